@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_userprofile_citizenship_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='availability_bitmap',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
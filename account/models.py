@@ -67,6 +67,8 @@ class UserProfile(models.Model):
 
     # Basic profile fields
     profile_picture = models.ImageField(upload_to="profiles/", blank=True, null=True)
+    # Resized WebP/JPEG versions of profile_picture (see parent.renditions)
+    profile_picture_renditions = models.JSONField(default=dict, blank=True, editable=False)
     address = models.CharField(max_length=255, blank=True, null=True)
     bio = models.TextField(blank=True, null=True)
 
@@ -74,6 +76,8 @@ class UserProfile(models.Model):
     citizenship_document = models.FileField(
         upload_to="documents/", blank=True, null=True
     )
+    # Packed weekly availability (see parent.availability_bitmap), rebuilt on slot changes
+    availability_bitmap = models.BinaryField(blank=True, null=True, editable=False)
 
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -3,6 +3,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from parent.renditions import rendition_urls
+
 from .models import User, UserProfile
 
 
@@ -60,20 +62,28 @@ class UserBasicSerializer(serializers.ModelSerializer):
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
+    # MeView returns the user next to the profile (see parent/conditional.py)
+    validator_fields = ("updated_at", "user__updated_at")
+
     profile_picture = serializers.ImageField(required=False, allow_null=True)
+    profile_picture_renditions = serializers.SerializerMethodField()
     citizenship_document = serializers.FileField(required=False, allow_null=True)
 
     class Meta:
         model = UserProfile
         fields = [
             "profile_picture",
+            "profile_picture_renditions",
             "address",
             "bio",
             "citizenship_document",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["created_at", "updated_at"]
+        read_only_fields = ["profile_picture_renditions", "created_at", "updated_at"]
+
+    def get_profile_picture_renditions(self, obj):
+        return rendition_urls(obj, "profile_picture", self.context.get("request"))
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -179,12 +189,14 @@ class RegisterSerializer(serializers.ModelSerializer):
 
 class AdminUserProfileSerializer(serializers.ModelSerializer):
     profile_picture = serializers.SerializerMethodField()
+    profile_picture_renditions = serializers.SerializerMethodField()
     citizenship_document = serializers.SerializerMethodField()
 
     class Meta:
         model = UserProfile
         fields = [
             "profile_picture",
+            "profile_picture_renditions",
             "address",
             "bio",
             "citizenship_document",
@@ -200,6 +212,9 @@ class AdminUserProfileSerializer(serializers.ModelSerializer):
         url = obj.profile_picture.url
         return request.build_absolute_uri(url) if request else url
 
+    def get_profile_picture_renditions(self, obj):
+        return rendition_urls(obj, "profile_picture", self.context.get("request"))
+
     def get_citizenship_document(self, obj):
         if not obj.citizenship_document:
             return None
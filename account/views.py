@@ -22,10 +22,16 @@ from .serializers import (
     AdminUserUpdateSerializer,
 )
 from .permissions import IsAdminRole
+from parent.compression import no_compression
+from parent.conditional import conditional_get
+from parent.pagination import StandardPageNumberPagination
+from parent.values_read import ValuesListMixin
 
 from .models import User
 
 
+# Auth responses carry tokens next to user-supplied fields; never compress them (BREACH)
+@no_compression
 class LoginView(APIView):
     permission_classes = [AllowAny]
 
@@ -46,6 +52,7 @@ class LoginView(APIView):
         )
 
 
+@no_compression
 class LogoutView(APIView):
     """
     JWT logout = blacklist refresh token.
@@ -71,15 +78,24 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        profile, _ = UserProfile.objects.get_or_create(user=request.user)
-
-        data = {
-            "user": UserBasicSerializer(request.user).data,
-            "profile": UserProfileSerializer(
-                profile, context={"request": request}
-            ).data,
-        }
-        return Response(data, status=status.HTTP_200_OK)
+        def respond():
+            profile, _ = UserProfile.objects.get_or_create(user=request.user)
+
+            data = {
+                "user": UserBasicSerializer(request.user).data,
+                "profile": UserProfileSerializer(
+                    profile, context={"request": request}
+                ).data,
+            }
+            return Response(data, status=status.HTTP_200_OK)
+
+        return conditional_get(
+            request,
+            UserProfile.objects.filter(user=request.user),
+            UserProfileSerializer,
+            respond,
+            single=True,
+        )
 
     def patch(self, request):
         """
@@ -134,6 +150,7 @@ class ProfileUpdateView(APIView):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@no_compression
 class ChangePasswordView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -148,6 +165,7 @@ class ChangePasswordView(APIView):
         )
 
 
+@no_compression
 class RegisterView(APIView):
     permission_classes = [AllowAny]
     parser_classes = [MultiPartParser, FormParser]
@@ -163,10 +181,11 @@ class RegisterView(APIView):
         )
 
 
-class AdminUserListView(generics.ListAPIView):
+class AdminUserListView(ValuesListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated, IsAdminRole]
     queryset = User.objects.all().order_by("-created_at")
     serializer_class = AdminUserListSerializer
+    pagination_class = StandardPageNumberPagination
 
 
 class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -12,4 +12,12 @@ export const getBabysitterAvailability = (babysitterId) => api.get(`/parent/list
 // Get existing bookings for a babysitter on a specific date
 export const getBabysitterBookings = (babysitterId, date) => api.get(`/parent/listings/${babysitterId}/bookings/`, {
   params: { date }
-})
\ No newline at end of file
+})
+
+// Get bookable windows for a babysitter over a date range (YYYY-MM-DD, inclusive)
+export const getBabysitterFreeSlots = (babysitterId, { from, to, minDuration } = {}) => api.get(`/parent/listings/${babysitterId}/free-slots/`, {
+  params: { from, to, min_duration: minDuration }
+})
+
+// Replace the whole weekly schedule: slots = [{ day_of_week, start_time, end_time }, ...]
+export const replaceAvailability = (slots) => api.put('/parent/babysitter/availability/bulk/', { slots })
@@ -5,6 +5,9 @@ export const getIncomingRequests = () => api.get('/parent/babysitter/requests/')
 export const getRequestDetail = (id) => api.get(`/parent/babysitter/requests/${id}/`)
 export const acceptRequest = (id) => api.post(`/parent/babysitter/requests/${id}/accept/`)
 export const rejectRequest = (id) => api.post(`/parent/babysitter/requests/${id}/reject/`)
+// decisions: [{ id, decision: 'accept' | 'reject' }]
+export const bulkDecideRequests = (decisions) =>
+  api.post('/parent/babysitter/requests/bulk-decide/', { decisions })
 
 // My Bookings
 export const getMyBookings = () => api.get('/parent/babysitter/bookings/')
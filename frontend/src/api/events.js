@@ -0,0 +1,46 @@
+// Server-sent events: live story posts and booking status changes.
+// Needs the ASGI server (the endpoint is not served by `manage.py runserver`);
+// when the stream is unavailable, hooks fall back to polling.
+const STREAM_URL = 'http://localhost:8000/api/events/stream/'
+
+let source = null
+let connected = false
+const listeners = new Set()
+
+const EVENT_TYPES = ['story.created', 'booking.created', 'booking.status']
+
+function open() {
+  const token = localStorage.getItem('access')
+  if (!token) return
+  source = new EventSource(`${STREAM_URL}?token=${encodeURIComponent(token)}`)
+  source.onopen = () => {
+    connected = true
+  }
+  source.onerror = () => {
+    connected = false
+    // A rejected token closes the stream for good; EventSource retries other errors
+    if (source.readyState === EventSource.CLOSED) source = null
+  }
+  EVENT_TYPES.forEach((type) => {
+    source.addEventListener(type, (message) => {
+      const event = JSON.parse(message.data)
+      listeners.forEach((listener) => listener(event))
+    })
+  })
+}
+
+// Subscribe to all events; returns an unsubscribe function
+export function subscribeToEvents(listener) {
+  listeners.add(listener)
+  if (!source) open()
+  return () => {
+    listeners.delete(listener)
+    if (!listeners.size && source) {
+      source.close()
+      source = null
+      connected = false
+    }
+  }
+}
+
+export const isLiveConnected = () => connected
@@ -1,8 +1,27 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useEffect, useMemo } from 'react'
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { fetchPage } from './pagination'
+
+// List endpoints are paginated: follow the next-page cursor until every page is
+// loaded and return the rows as one array, like an unpaginated useQuery would
+export function useListQuery(key, request, options = {}) {
+  const query = useInfiniteQuery(key, ({ pageParam }) => fetchPage(request, pageParam), {
+    getNextPageParam: (lastPage) => lastPage.next,
+    ...options,
+  })
+  const { hasNextPage, isFetchingNextPage, isError, fetchNextPage } = query
+  useEffect(() => {
+    if (hasNextPage && !isFetchingNextPage && !isError) fetchNextPage()
+  }, [hasNextPage, isFetchingNextPage, isError, fetchNextPage])
+  const pages = query.data?.pages
+  const data = useMemo(() => pages && pages.flatMap((page) => page.data), [pages])
+  return { ...query, data }
+}
+
 import { adminUsers, adminUserDetail, adminUserUpdate, adminUserDelete } from './account'
 
 export function useAdminUsers(options = {}) {
-  return useQuery(['adminUsers'], () => adminUsers().then((res) => res.data), {
+  return useListQuery(['adminUsers'], () => adminUsers(), {
     enabled: options.enabled !== false,
     ...options,
   })
@@ -109,7 +128,7 @@ export function usePatchParentProfile() {
 }
 
 export function useChildren() {
-  return useQuery(['children'], () => listChildren().then((res) => res.data), {
+  return useListQuery(['children'], () => listChildren(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -145,7 +164,7 @@ export function useDeleteChild() {
 }
 
 export function useRequests() {
-  return useQuery(['requests'], () => listRequests().then((res) => res.data), {
+  return useListQuery(['requests'], () => listRequests(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -189,19 +208,19 @@ export function useCancelRequest() {
 }
 
 export function useUpcomingBookings() {
-  return useQuery(['upcomingBookings'], () => upcomingBookings().then((res) => res.data), {
+  return useListQuery(['upcomingBookings'], () => upcomingBookings(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function usePastBookings() {
-  return useQuery(['pastBookings'], () => pastBookings().then((res) => res.data), {
+  return useListQuery(['pastBookings'], () => pastBookings(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function useBabysitters() {
-  return useQuery(['babysitters'], () => listBabysitters().then((res) => res.data), {
+  return useListQuery(['babysitters'], () => listBabysitters(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -213,13 +232,13 @@ export function useBabysitterDetail(id) {
 }
 
 export function useBabysittersSearch(params) {
-  return useQuery(['babysitters', params], () => babysitterSearch(params).then((res) => res.data), {
+  return useListQuery(['babysitters', params], () => babysitterSearch(params), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function useReviews() {
-  return useQuery(['reviews'], () => listReviews().then((res) => res.data), {
+  return useListQuery(['reviews'], () => listReviews(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -259,7 +278,7 @@ export function useDeleteReview() {
 }
 
 export function useBookingHistory() {
-  return useQuery(['bookingHistory'], () => bookingHistory().then((res) => res.data), {
+  return useListQuery(['bookingHistory'], () => bookingHistory(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -270,6 +289,7 @@ import {
   getRequestDetail as getBabysitterRequestDetail,
   acceptRequest,
   rejectRequest,
+  bulkDecideRequests,
   getMyBookings,
   getBookingDetail,
   completeBooking,
@@ -287,9 +307,32 @@ import {
   getBabysitterAvailability,
   getBabysitterBookings,
 } from './availability'
+import { subscribeToEvents, isLiveConnected } from './events'
+
+// Refetch the affected lists when the server pushes a change
+export function useLiveUpdates() {
+  const qc = useQueryClient()
+  useEffect(
+    () =>
+      subscribeToEvents((event) => {
+        if (event.type === 'story.created') {
+          qc.invalidateQueries(['parentStories'])
+        } else {
+          qc.invalidateQueries(['incomingRequests'])
+          qc.invalidateQueries(['myBookings'])
+          qc.invalidateQueries(['requests'])
+        }
+      }),
+    [qc]
+  )
+}
+
+// Poll only while the live event stream is down
+const fallbackPolling = (interval) => () => (isLiveConnected() ? false : interval)
 
 export function useIncomingRequests() {
-  return useQuery(['incomingRequests'], () => getIncomingRequests().then((res) => res.data), {
+  useLiveUpdates()
+  return useListQuery(['incomingRequests'], () => getIncomingRequests(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -321,8 +364,19 @@ export function useRejectRequest() {
   })
 }
 
+export function useBulkDecideRequests() {
+  const qc = useQueryClient()
+  return useMutation((decisions) => bulkDecideRequests(decisions).then((res) => res.data), {
+    onSuccess: () => {
+      qc.invalidateQueries(['incomingRequests'])
+      qc.invalidateQueries(['myBookings'])
+      qc.invalidateQueries(['babysitterRequest'])
+    },
+  })
+}
+
 export function useMyBookings() {
-  return useQuery(['myBookings'], () => getMyBookings().then((res) => res.data), {
+  return useListQuery(['myBookings'], () => getMyBookings(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -345,25 +399,25 @@ export function useCompleteBooking() {
 }
 
 export function useBabysitterUpcomingBookings() {
-  return useQuery(['babysitterUpcomingBookings'], () => getBabysitterUpcomingBookings().then((res) => res.data), {
+  return useListQuery(['babysitterUpcomingBookings'], () => getBabysitterUpcomingBookings(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function useBabysitterPastBookings() {
-  return useQuery(['babysitterPastBookings'], () => getBabysitterPastBookings().then((res) => res.data), {
+  return useListQuery(['babysitterPastBookings'], () => getBabysitterPastBookings(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function useReceivedReviews() {
-  return useQuery(['receivedReviews'], () => getReceivedReviews().then((res) => res.data), {
+  return useListQuery(['receivedReviews'], () => getReceivedReviews(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
 
 export function useBabysitterHistory(params) {
-  return useQuery(['babysitterHistory', params], () => getBabysitterHistory(params).then((res) => res.data), {
+  return useListQuery(['babysitterHistory', params], () => getBabysitterHistory(params), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -427,7 +481,7 @@ import {
 import { getParentStories } from './parent'
 
 export function useBabysitterOwnStories() {
-  return useQuery(['babysitterOwnStories'], () => getBabysitterStories().then((res) => res.data), {
+  return useListQuery(['babysitterOwnStories'], () => getBabysitterStories(), {
     enabled: !!localStorage.getItem('access'),
   })
 }
@@ -454,12 +508,11 @@ export function useDeleteBabysitterStory() {
 }
 
 export function useParentStories(params) {
-  return useQuery(
-    ['parentStories', params],
-    () => getParentStories(params).then((res) => res.data),
+  useLiveUpdates()
+  return useListQuery(['parentStories', params], () => getParentStories(params),
     {
       enabled: !!localStorage.getItem('access'),
-      refetchInterval: 30000,
+      refetchInterval: fallbackPolling(30000),
     }
   )
 }
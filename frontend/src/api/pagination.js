@@ -0,0 +1,25 @@
+import api from './axios'
+
+// List endpoints return one page per request. Keyset lists send the next cursor in
+// X-Next-Cursor; page-number lists (admin users) only send a Link rel="next" URL.
+
+const parseNextLink = (link) => {
+  if (!link) return undefined
+  const match = link.split(',').find((part) => /rel="next"/.test(part))
+  return match ? match.slice(match.indexOf('<') + 1, match.indexOf('>')) : undefined
+}
+
+// The request for the page after `res`, or undefined on the last page
+export const nextPageRequest = (res) => {
+  const cursor = res.headers['x-next-cursor']
+  if (cursor) return { url: res.config.url, params: { ...res.config.params, cursor } }
+  const next = parseNextLink(res.headers.link)
+  return next ? { url: next } : undefined
+}
+
+// Fetch the first page with `request()`, later pages with the request from the previous one
+export const fetchPage = (request, pageParam) =>
+  (pageParam ? api.get(pageParam.url, { params: pageParam.params }) : request()).then((res) => ({
+    data: res.data,
+    next: nextPageRequest(res),
+  }))
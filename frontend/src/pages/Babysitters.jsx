@@ -227,7 +227,17 @@ export default function Babysitters() {
           >
             <div className="flex flex-col items-center text-center">
               <div className="w-24 h-24 rounded-full overflow-hidden border-2 border-pink-100 flex-shrink-0 mb-4">
-                {babysitter.profile?.profile_picture ? (
+                {babysitter.profile?.profile_picture_renditions ? (
+                  <picture>
+                    <source srcSet={babysitter.profile.profile_picture_renditions.thumb.webp} type="image/webp" />
+                    <img
+                      src={babysitter.profile.profile_picture_renditions.thumb.jpeg}
+                      alt={`${babysitter.first_name} ${babysitter.last_name}`}
+                      loading="lazy"
+                      className="w-full h-full object-cover"
+                    />
+                  </picture>
+                ) : babysitter.profile?.profile_picture ? (
                   <img
                     src={babysitter.profile.profile_picture}
                     alt={`${babysitter.first_name} ${babysitter.last_name}`}
@@ -11,6 +11,7 @@ export default function BookingHistory() {
     if (status === 'ACCEPTED') return 'status-accepted'
     if (status === 'REJECTED') return 'status-rejected'
     if (status === 'CANCELLED') return 'status-cancelled'
+    if (status === 'EXPIRED') return 'status-expired'
     return 'status-completed'
   }
 
@@ -1,5 +1,10 @@
 import React, { useState } from 'react'
-import { useIncomingRequests, useAcceptRequest, useRejectRequest } from '../api/hooks'
+import {
+  useIncomingRequests,
+  useAcceptRequest,
+  useRejectRequest,
+  useBulkDecideRequests,
+} from '../api/hooks'
 import Alert from '../components/Alert'
 import { formatDateTime } from '../utils/date'
 
@@ -7,14 +12,49 @@ export default function IncomingRequests() {
   const { data: requests, isLoading } = useIncomingRequests()
   const acceptRequest = useAcceptRequest()
   const rejectRequest = useRejectRequest()
+  const bulkDecide = useBulkDecideRequests()
   const [message, setMessage] = useState('')
+  const [selected, setSelected] = useState([])
+
+  const pendingIds = requests?.filter((r) => r.status === 'PENDING').map((r) => r.id) || []
+  const selectedPending = selected.filter((id) => pendingIds.includes(id))
+
+  const toggleSelected = (id) => {
+    setSelected((ids) => (ids.includes(id) ? ids.filter((x) => x !== id) : [...ids, id]))
+  }
+
+  const handleBulk = async (decision) => {
+    const count = selectedPending.length
+    if (!window.confirm(`${decision === 'accept' ? 'Accept' : 'Reject'} ${count} selected request(s)?`)) return
+    setMessage('')
+    try {
+      const { results, declined_ids: declined } = await bulkDecide.mutateAsync(
+        selectedPending.map((id) => ({ id, decision }))
+      )
+      const done = results.filter((r) => r.result === 'accepted' || r.result === 'rejected').length
+      const failed = results.length - done
+      setMessage(
+        `${done} request(s) ${decision === 'accept' ? 'accepted' : 'rejected'}` +
+          (failed ? `, ${failed} could not be ${decision}ed (conflict or already decided)` : '') +
+          (declined.length ? `, ${declined.length} overlapping request(s) declined` : '') +
+          '.'
+      )
+      setSelected([])
+    } catch {
+      setMessage('Failed to update requests')
+    }
+  }
 
   const handleAccept = async (id) => {
     if (!window.confirm('Accept this booking request?')) return
     setMessage('')
     try {
-      await acceptRequest.mutateAsync(id)
-      setMessage('Request accepted successfully!')
+      const { declined_ids: declined = [] } = await acceptRequest.mutateAsync(id)
+      setMessage(
+        declined.length
+          ? `Request accepted. ${declined.length} overlapping request(s) were declined.`
+          : 'Request accepted successfully!'
+      )
     } catch {
       setMessage('Failed to accept request')
     }
@@ -50,6 +90,28 @@ export default function IncomingRequests() {
         </Alert>
       )}
 
+      {selectedPending.length > 0 && (
+        <div className="card mb-4 flex items-center justify-between gap-4 flex-wrap">
+          <span className="text-sm text-gray-700">{selectedPending.length} selected</span>
+          <div className="flex gap-2">
+            <button
+              onClick={() => handleBulk('accept')}
+              className="btn-primary"
+              disabled={bulkDecide.isLoading}
+            >
+              Accept selected
+            </button>
+            <button
+              onClick={() => handleBulk('reject')}
+              className="btn-secondary text-red-500"
+              disabled={bulkDecide.isLoading}
+            >
+              Reject selected
+            </button>
+          </div>
+        </div>
+      )}
+
       {requests?.length === 0 ? (
         <div className="card text-center">
           <p className="text-gray-500">No incoming requests at this time</p>
@@ -61,6 +123,14 @@ export default function IncomingRequests() {
               <div className="flex justify-between items-start mb-4 gap-4">
                 <div className="flex-1">
                   <div className="flex items-center gap-3 mb-2 flex-wrap">
+                    {request.status === 'PENDING' && (
+                      <input
+                        type="checkbox"
+                        checked={selected.includes(request.id)}
+                        onChange={() => toggleSelected(request.id)}
+                        aria-label="Select request"
+                      />
+                    )}
                     <h3 className="text-lg font-semibold">{request.parent_email}</h3>
                     <span className={getStatusClass(request.status)}>{request.status}</span>
                   </div>
@@ -82,6 +82,7 @@ export default function RequestDetail() {
     REJECTED: 'status-rejected',
     CANCELLED: 'status-cancelled',
     COMPLETED: 'status-completed',
+    EXPIRED: 'status-expired',
   }
 
   const canEdit = ['PENDING', 'ACCEPTED'].includes(request.status)
@@ -32,6 +32,7 @@ export default function Requests() {
       REJECTED: 'status-rejected',
       CANCELLED: 'status-cancelled',
       COMPLETED: 'status-completed',
+      EXPIRED: 'status-expired',
     }
     return (
       <span className={colors[status] || 'status-badge bg-pink-50 text-pink-700'}>
@@ -62,7 +63,7 @@ export default function Requests() {
 
       {/* Filter buttons */}
       <div className="flex gap-2 mb-5 overflow-x-auto">
-        {['ALL', 'PENDING', 'ACCEPTED', 'REJECTED', 'CANCELLED', 'COMPLETED'].map(status => (
+        {['ALL', 'PENDING', 'ACCEPTED', 'REJECTED', 'CANCELLED', 'COMPLETED', 'EXPIRED'].map(status => (
           <button
             key={status}
             onClick={() => setStatusFilter(status)}
@@ -112,7 +113,7 @@ export default function Requests() {
                 <Link to={`/requests/${r.id}`} className="btn-secondary text-sm">
                   View
                 </Link>
-                {r.status !== 'CANCELLED' && r.status !== 'COMPLETED' && (
+                {['PENDING', 'ACCEPTED'].includes(r.status) && (
                   <button 
                     className="btn-secondary text-sm text-red-600 hover:bg-red-50" 
                     onClick={() => handleCancel(r.id)}
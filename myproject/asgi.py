@@ -2,6 +2,9 @@
 ASGI config for myproject project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests to the server-sent events endpoint (``parent.streams``) are handled
+directly so the long-lived connection does not tie up a Django request thread;
+everything else goes to Django.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -13,4 +16,14 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myproject.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up, since it loads models
+from parent.streams import EVENT_STREAM_PATH, event_stream  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"] == EVENT_STREAM_PATH:
+        await event_stream(scope, receive, send)
+        return
+    await django_application(scope, receive, send)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import timedelta
 
@@ -52,6 +53,18 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
+    # orjson-backed JSON (see parent/renderers.py); MessagePack only when installed
+    "DEFAULT_RENDERER_CLASSES": [
+        "parent.renderers.FastJSONRenderer",
+        *(["parent.renderers.MessagePackRenderer"] if find_spec("msgpack") else []),
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "rest_framework.parsers.JSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+        *(["parent.renderers.MessagePackParser"] if find_spec("msgpack") else []),
+    ],
 }
 
 SIMPLE_JWT = {
@@ -67,11 +80,20 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
 ]
 
+# Pagination metadata is sent in headers (see parent/pagination.py)
+CORS_EXPOSE_HEADERS = ["Link", "X-Next-Cursor", "X-Since-Cursor", "X-Total-Count"]
+
+# Real-time events (see parent/events.py). The in-process backend needs a single
+# ASGI worker process; swap in a shared backend to run several.
+PARENT_EVENT_BACKEND = "parent.events.InProcessEventBackend"
+
 AUTH_USER_MODEL = "account.User"
 
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Before anything that reads or changes the response body
+    "parent.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -151,6 +173,22 @@ STATIC_URL = "static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Background jobs (see parent/jobs.py), run by `manage.py run_worker`
+JOB_VISIBILITY_TIMEOUT = 300  # seconds a claimed job stays leased to its worker
+JOB_RETRY_BACKOFF = 10  # seconds before the first retry, doubled per attempt
+JOB_RETRY_BACKOFF_MAX = 3600
+
+# Cached babysitter listing cards (see parent/card_cache.py). Point this at a cache
+# shared by all processes (Redis, Memcached) in production.
+BABYSITTER_CARD_CACHE = "default"
+BABYSITTER_CARD_CACHE_TIMEOUT = 3600
+
+# Response compression (see parent/compression.py); brotli is used when installed
+RESPONSE_COMPRESSION_MIN_SIZE = 1024  # bytes; smaller bodies are sent uncompressed
+RESPONSE_COMPRESSION_GZIP_LEVEL = 6
+RESPONSE_COMPRESSION_BROTLI_QUALITY = 4
+RESPONSE_COMPRESSION_EXCLUDE_PATHS = [MEDIA_URL]
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
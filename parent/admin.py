@@ -1,5 +1,7 @@
 from django.contrib import admin
-from .models import ParentProfile, ChildProfile, BabysitterRequest, BabysitterReview
+from django.utils import timezone
+
+from .models import ParentProfile, ChildProfile, BabysitterRequest, BabysitterReview, Job
 
 
 @admin.register(ParentProfile)
@@ -95,3 +97,24 @@ class BabysitterReviewAdmin(admin.ModelAdmin):
         ("Review Content", {"fields": ("rating", "comment")}),
         ("Timestamps", {"fields": ("created_at", "updated_at")}),
     )
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("name", "queue", "status", "attempts", "run_at", "locked_by")
+    list_filter = ("status", "queue")
+    search_fields = ("name",)
+    readonly_fields = ("created_at", "finished_at", "last_error")
+    actions = ["requeue"]
+
+    @admin.action(description="Run selected jobs again")
+    def requeue(self, request, queryset):
+        updated = queryset.exclude(status=Job.Status.RUNNING).update(
+            status=Job.Status.QUEUED,
+            attempts=0,
+            run_at=timezone.now(),
+            locked_until=None,
+            locked_by="",
+            finished_at=None,
+        )
+        self.message_user(request, f"{updated} job(s) queued again.")
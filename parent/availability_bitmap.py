@@ -0,0 +1,65 @@
+"""
+Packed weekly availability bitmap.
+
+A babysitter's week is 7 x 96 quarter-hour cells = 672 bits, stored as 84 bytes
+(little-endian) on UserProfile.availability_bitmap. Bit ``day * 96 + minute // 15``
+is set when that quarter hour is covered by an availability slot.
+
+The bitmap is only exact when every slot starts and ends on a quarter hour. For
+anything else ``build_bitmap`` returns None and callers fall back to querying
+BabysitterAvailability rows.
+"""
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+WEEK_SLOTS = 7 * SLOTS_PER_DAY
+BITMAP_BYTES = WEEK_SLOTS // 8
+
+
+def is_aligned(value):
+    """True if a time/datetime falls exactly on a quarter-hour boundary"""
+    return (
+        value.minute % SLOT_MINUTES == 0
+        and value.second == 0
+        and value.microsecond == 0
+    )
+
+
+def slot_mask(day_of_week, start_time, end_time):
+    """Bit mask for [start_time, end_time) on the given day (0=Monday)"""
+    day_offset = day_of_week * SLOTS_PER_DAY
+    first = day_offset + (start_time.hour * 60 + start_time.minute) // SLOT_MINUTES
+    last = day_offset + (end_time.hour * 60 + end_time.minute) // SLOT_MINUTES
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def build_bitmap(slots):
+    """
+    Pack (day_of_week, start_time, end_time) tuples into bytes, or return None if any
+    slot is not quarter-hour aligned.
+    """
+    bitmap = 0
+    for day_of_week, start_time, end_time in slots:
+        if not (is_aligned(start_time) and is_aligned(end_time)):
+            return None
+        bitmap |= slot_mask(day_of_week, start_time, end_time)
+    return bitmap.to_bytes(BITMAP_BYTES, "little")
+
+
+def unpack_bitmap(raw):
+    """Stored bytes (or memoryview) -> int, passing None through"""
+    if raw is None:
+        return None
+    return int.from_bytes(bytes(raw), "little")
+
+
+def covers(bitmap, mask):
+    """True if every bit of ``mask`` is set in ``bitmap``"""
+    return bitmap & mask == mask
+
+
+def overlaps(bitmap, mask):
+    """True if any bit of ``mask`` is set in ``bitmap``"""
+    return bitmap & mask != 0
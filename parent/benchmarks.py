@@ -0,0 +1,185 @@
+"""
+Micro-benchmarks on real rows. Run ``seed_load`` first for numbers that mean
+something.
+
+- Renderers: serializes babysitter cards, booking details, booking history and
+  stories once, then times each renderer on the resulting payloads.
+- Read paths: times ``serializer.data`` against the values read path
+  (parent/values_read.py) for the list serializers that support it, query included.
+- Compression: compresses rendered pages with each codec setting and reports the
+  bytes saved and the CPU time spent.
+"""
+
+import statistics
+import time
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from account.models import User
+from account.serializers import AdminUserListSerializer
+from .compression import BrotliCodec, GzipCodec, brotli
+from .eager_loading import apply_eager_loading
+from .models import BabysitterAvailability, BabysitterRequest, BabysitterStory
+from .renderers import FastJSONRenderer, MessagePackRenderer, msgpack, orjson
+from .serializers import (
+    BabysitterAvailabilitySerializer,
+    BabysitterListSerializer,
+    BabysitterRequestDetailSerializer,
+    BabysitterStorySerializer,
+    BookingHistorySerializer,
+)
+from .values_read import values_reader
+
+
+def _context():
+    return {"request": Request(APIRequestFactory().get("/api/parent/"))}
+
+
+def _median_ms(timings):
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def serializer_payloads(rows=200):
+    """``{name: serialized list}`` for up to ``rows`` rows of each serializer"""
+    context = _context()
+    sources = {
+        "listings": (
+            User.objects.filter(role="BABYSITTER", is_active=True).order_by("pk"),
+            BabysitterListSerializer,
+        ),
+        "booking_details": (
+            BabysitterRequest.objects.order_by("pk"),
+            BabysitterRequestDetailSerializer,
+        ),
+        "history": (
+            BabysitterRequest.objects.filter(status="COMPLETED").order_by("pk"),
+            BookingHistorySerializer,
+        ),
+        "stories": (BabysitterStory.objects.order_by("pk"), BabysitterStorySerializer),
+    }
+    payloads = {}
+    for name, (queryset, serializer_class) in sources.items():
+        queryset = apply_eager_loading(queryset, serializer_class, context)[:rows]
+        data = serializer_class(queryset, many=True, context=context).data
+        if data:
+            payloads[name] = data
+    return payloads
+
+
+def available_renderers():
+    renderers = {"drf-json": JSONRenderer()}
+    if orjson is not None:
+        renderers["fast-json"] = FastJSONRenderer()
+    if msgpack is not None:
+        renderers["msgpack"] = MessagePackRenderer()
+    return renderers
+
+
+def run_renderer_benchmark(payloads, repeat=50):
+    """
+    Time every available renderer on every payload. Returns one dict per
+    (payload, renderer) with the median render time and the output size.
+    """
+    results = []
+    for name, data in payloads.items():
+        for label, renderer in available_renderers().items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                body = renderer.render(data, renderer.media_type)
+                timings.append(time.perf_counter() - started)
+            results.append(
+                {
+                    "payload": name,
+                    "rows": len(data),
+                    "renderer": label,
+                    "median_ms": _median_ms(timings),
+                    "bytes": len(body),
+                }
+            )
+    return results
+
+
+def run_read_path_benchmark(rows=1000, repeat=20):
+    """
+    Time the serializer and values read paths, query included, on up to ``rows``
+    rows of each supported list serializer. Both must render the same bytes.
+    Returns one dict per (serializer, path) with the median time and rows/s.
+    """
+    context = _context()
+    sources = [
+        (BabysitterRequest.objects.filter(status="COMPLETED"), BookingHistorySerializer),
+        (BabysitterAvailability.objects.all(), BabysitterAvailabilitySerializer),
+        (User.objects.all(), AdminUserListSerializer),
+    ]
+    renderer = JSONRenderer()
+    results = []
+    for queryset, serializer_class in sources:
+        queryset = apply_eager_loading(queryset.order_by("pk"), serializer_class)
+        reader = values_reader(serializer_class(context=context))
+        paths = {
+            "serializer": lambda: serializer_class(
+                queryset[:rows], many=True, context=context
+            ).data,
+            "values": lambda: reader.rows(reader.values(queryset)[:rows]),
+        }
+        outputs = {}
+        for label, read in paths.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                data = read()
+                timings.append(time.perf_counter() - started)
+            outputs[label] = renderer.render(data)
+            median = statistics.median(timings)
+            results.append(
+                {
+                    "serializer": serializer_class.__name__,
+                    "path": label,
+                    "rows": len(data),
+                    "median_ms": _median_ms(timings),
+                    "rows_per_s": round(len(data) / median) if median else 0,
+                }
+            )
+        if outputs["serializer"] != outputs["values"]:
+            raise AssertionError(f"{serializer_class.__name__}: values output differs")
+    return results
+
+
+def compression_codecs():
+    """``{label: codec}`` for the settings worth comparing"""
+    codecs = {f"gzip-{level}": GzipCodec(level) for level in (1, 6, 9)}
+    if brotli is not None:
+        codecs.update({f"br-{quality}": BrotliCodec(quality) for quality in (1, 4, 11)})
+    return codecs
+
+
+def run_compression_benchmark(payloads, repeat=50):
+    """
+    Compress each payload, rendered as the API sends it, with every codec setting.
+    Returns one dict per (payload, codec) with sizes and the median time.
+    """
+    renderer = FastJSONRenderer()
+    results = []
+    for name, data in payloads.items():
+        body = renderer.render(data, renderer.media_type)
+        for label, codec in compression_codecs().items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                compressed = codec.compress(body)
+                timings.append(time.perf_counter() - started)
+            results.append(
+                {
+                    "payload": name,
+                    "rows": len(data),
+                    "codec": label,
+                    "bytes": len(body),
+                    "compressed": len(compressed),
+                    "saved_pct": round(100 * (1 - len(compressed) / len(body)), 1),
+                    "median_ms": _median_ms(timings),
+                }
+            )
+    return results
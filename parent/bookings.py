@@ -0,0 +1,242 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .events import publish_event
+from .locking import lock_babysitter
+from .models import BabysitterRequest
+from .scheduling import merge_intervals
+
+
+class BookingTransitionError(Exception):
+    """Raised when a booking cannot move to the requested status"""
+
+    def __init__(self, detail):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class BookingConflictError(BookingTransitionError):
+    """Raised when the babysitter already has an overlapping booking"""
+
+
+def accept_booking(booking_id, babysitter):
+    """
+    Accept a PENDING request for ``babysitter``.
+
+    The status check, the conflict check and the update run in one transaction that
+    holds the babysitter's booking lock, so concurrent accepts for overlapping windows
+    cannot both succeed. Other PENDING requests overlapping the accepted window can
+    never be accepted afterwards, so they are rejected in the same transaction; their
+    ids are left on ``booking.auto_declined``.
+    """
+    with transaction.atomic():
+        lock_babysitter(babysitter.pk)
+        booking = BabysitterRequest.objects.get(pk=booking_id, babysitter=babysitter)
+
+        if booking.status != "PENDING":
+            raise BookingTransitionError(
+                f"Cannot accept request with status {booking.status}."
+            )
+
+        # Check against both ACCEPTED and COMPLETED bookings
+        conflict = BabysitterRequest.objects.find_conflict(
+            babysitter, booking.start_date, booking.end_date, exclude_id=booking.id
+        )
+        if conflict:
+            raise BookingConflictError(
+                "Babysitter already has a booking during this time. "
+                f"Conflicting booking: {conflict.start_date.strftime('%Y-%m-%d %H:%M')} to "
+                f"{conflict.end_date.strftime('%Y-%m-%d %H:%M')}."
+            )
+
+        booking.status = "ACCEPTED"
+        booking.save(update_fields=["status", "updated_at"])
+        booking.auto_declined = decline_overlapping_requests(booking)
+    return booking
+
+
+def decline_overlapping_requests(booking):
+    """
+    Reject the babysitter's PENDING requests that overlap ``booking`` and notify both
+    sides. One range query on the (babysitter, status, start_date) index plus one
+    UPDATE; returns the rejected ids.
+    """
+    overlapping = list(
+        BabysitterRequest.objects.filter(
+            babysitter_id=booking.babysitter_id, status="PENDING"
+        )
+        .overlapping(booking.start_date, booking.end_date)
+        .exclude(pk=booking.pk)
+        .select_for_update(of=("self",))
+        .values("id", "parent__user_id", "start_date", "end_date")
+    )
+    if not overlapping:
+        return []
+
+    ids = [row["id"] for row in overlapping]
+    BabysitterRequest.objects.filter(pk__in=ids).update(
+        status="REJECTED", updated_at=timezone.now()
+    )
+    for row in overlapping:
+        publish_event(
+            [row["parent__user_id"], booking.babysitter_id],
+            "booking.status",
+            {
+                "id": row["id"],
+                "status": "REJECTED",
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "previous_status": "PENDING",
+                "reason": "overlapping_booking_accepted",
+            },
+        )
+    return ids
+
+
+MAX_BULK_DECISIONS = 100
+
+
+def _first_overlap(intervals, start, end, position):
+    """
+    Advance ``position`` through sorted, non-overlapping ``intervals`` past those
+    ending by ``start``; return (position, overlapping interval or None).
+    """
+    while position < len(intervals) and intervals[position][1] <= start:
+        position += 1
+    if position < len(intervals) and intervals[position][0] < end:
+        return position, intervals[position]
+    return position, None
+
+
+def decide_bookings(babysitter, decisions):
+    """
+    Apply ``decisions`` (``[(booking_id, "accept" | "reject"), ...]``) for
+    ``babysitter`` in one transaction and return ``(outcomes, declined_ids)``.
+
+    Accepts are checked in start order against the babysitter's existing
+    accepted/completed bookings and against each other in a single sweep; when two
+    accepts in the batch overlap, the earlier-starting one wins and the other is
+    reported as a conflict. Any other PENDING request overlapping a newly accepted
+    booking is rejected, as with a single accept. Outcomes are keyed by id with
+    ``result`` one of accepted, rejected, conflict, not_found or invalid_status.
+    """
+    with transaction.atomic():
+        lock_babysitter(babysitter.pk)
+        rows = {
+            row["id"]: row
+            for row in BabysitterRequest.objects.filter(
+                pk__in=[booking_id for booking_id, _ in decisions],
+                babysitter=babysitter,
+            ).values("id", "status", "start_date", "end_date", "parent__user_id")
+        }
+
+        outcomes = {}
+        accepts = []
+        rejects = []
+        for booking_id, decision in decisions:
+            row = rows.get(booking_id)
+            if row is None:
+                outcomes[booking_id] = {"result": "not_found", "detail": "Not found."}
+            elif row["status"] != "PENDING":
+                outcomes[booking_id] = {
+                    "result": "invalid_status",
+                    "status": row["status"],
+                    "detail": f"Cannot {decision} request with status {row['status']}.",
+                }
+            elif decision == "accept":
+                accepts.append(row)
+            else:
+                rejects.append(row)
+
+        accepted = []
+        if accepts:
+            accepts.sort(key=lambda row: (row["start_date"], row["end_date"]))
+            span_end = max(row["end_date"] for row in accepts)
+            busy = merge_intervals(
+                BabysitterRequest.objects.blocking()
+                .filter(babysitter=babysitter)
+                .overlapping(accepts[0]["start_date"], span_end)
+                .values_list("start_date", "end_date")
+            )
+            position = 0
+            for row in accepts:
+                start, end = row["start_date"], row["end_date"]
+                position, clash = _first_overlap(busy, start, end, position)
+                if clash is not None:
+                    clash_start, clash_end = (
+                        timezone.localtime(value).strftime("%Y-%m-%d %H:%M")
+                        for value in clash
+                    )
+                    outcomes[row["id"]] = {
+                        "result": "conflict",
+                        "status": "PENDING",
+                        "detail": "Babysitter already has a booking during this time. "
+                        f"Conflicting booking: {clash_start} to {clash_end}.",
+                    }
+                elif accepted and accepted[-1]["end_date"] > start:
+                    outcomes[row["id"]] = {
+                        "result": "conflict",
+                        "status": "PENDING",
+                        "detail": f"Overlaps request {accepted[-1]['id']} "
+                        "accepted in this batch.",
+                    }
+                else:
+                    accepted.append(row)
+                    outcomes[row["id"]] = {"result": "accepted", "status": "ACCEPTED"}
+
+        for row in rejects:
+            outcomes[row["id"]] = {"result": "rejected", "status": "REJECTED"}
+
+        # Pending requests (in the batch or not) that can no longer be accepted
+        declined = []
+        if accepted:
+            windows = [(row["start_date"], row["end_date"]) for row in accepted]
+            decided = {row["id"] for row in accepted} | {row["id"] for row in rejects}
+            pending = (
+                BabysitterRequest.objects.filter(babysitter=babysitter, status="PENDING")
+                .overlapping(windows[0][0], max(end for _, end in windows))
+                .exclude(pk__in=decided)
+                .order_by("start_date")
+                .values("id", "status", "start_date", "end_date", "parent__user_id")
+            )
+            position = 0
+            for row in pending:
+                position, clash = _first_overlap(
+                    windows, row["start_date"], row["end_date"], position
+                )
+                if clash is not None:
+                    declined.append(row)
+                    if row["id"] in outcomes:
+                        outcomes[row["id"]]["status"] = "REJECTED"
+
+        now = timezone.now()
+        if accepted:
+            BabysitterRequest.objects.filter(pk__in=[r["id"] for r in accepted]).update(
+                status="ACCEPTED", updated_at=now
+            )
+        if rejects or declined:
+            BabysitterRequest.objects.filter(
+                pk__in=[r["id"] for r in rejects + declined]
+            ).update(status="REJECTED", updated_at=now)
+
+        for rows_changed, new_status, extra in (
+            (accepted, "ACCEPTED", {}),
+            (rejects, "REJECTED", {}),
+            (declined, "REJECTED", {"reason": "overlapping_booking_accepted"}),
+        ):
+            for row in rows_changed:
+                publish_event(
+                    [row["parent__user_id"], babysitter.pk],
+                    "booking.status",
+                    {
+                        "id": row["id"],
+                        "status": new_status,
+                        "start_date": row["start_date"],
+                        "end_date": row["end_date"],
+                        "previous_status": "PENDING",
+                        **extra,
+                    },
+                )
+
+    declined_ids = [row["id"] for row in declined if row["id"] not in outcomes]
+    return outcomes, declined_ids
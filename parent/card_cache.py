@@ -0,0 +1,115 @@
+"""
+Cached babysitter listing cards.
+
+Each babysitter's serialized ``BabysitterListSerializer`` output (the "card") is
+cached under ``babysitter-card:<user id>:<origin>`` together with the version stamp
+it was built for. Signals replace the stamp whenever the user, their profile or their
+reviews change (see parent/signals.py), and ``invalidate_all_cards`` replaces a global
+generation stamp for bulk writes that bypass signals. A list response fetches every
+card and stamp of the page with one ``get_many`` and only serializes the rows whose
+card is missing or stale.
+
+Stamps are replaced once right away and again after the transaction commits, so a
+card rebuilt from rows read before the commit never outlives the change. Use a cache
+shared by all processes (``BABYSITTER_CARD_CACHE``) in production; with the default
+per-process LocMemCache other processes keep serving old cards until they expire.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.manager import BaseManager
+from rest_framework import serializers
+
+CARD_KEY = "babysitter-card:{user_id}:{origin}"
+VERSION_KEY = "babysitter-card-version:{user_id}"
+GENERATION_KEY = "babysitter-card-generation"
+
+
+def get_card_cache():
+    return caches[getattr(settings, "BABYSITTER_CARD_CACHE", "default")]
+
+
+def card_timeout():
+    return getattr(settings, "BABYSITTER_CARD_CACHE_TIMEOUT", 3600)
+
+
+def _new_stamp():
+    return uuid.uuid4().hex
+
+
+def _replace_stamps(keys):
+    def replace():
+        get_card_cache().set_many(
+            {key: _new_stamp() for key in keys}, timeout=card_timeout()
+        )
+
+    replace()
+    transaction.on_commit(replace)
+
+
+def bump_card_version(*user_ids):
+    """Invalidate the cached cards of ``user_ids``"""
+    keys = [VERSION_KEY.format(user_id=user_id) for user_id in user_ids if user_id]
+    if keys:
+        _replace_stamps(keys)
+
+
+def invalidate_all_cards():
+    """Invalidate every cached card (after bulk writes that skip signals)"""
+    _replace_stamps([GENERATION_KEY])
+
+
+def _request_origin(request):
+    # Cards hold absolute URLs, which depend on the host the client used
+    if request is None:
+        return ""
+    return f"{request.scheme}://{request.get_host()}"
+
+
+class CachedCardListSerializer(serializers.ListSerializer):
+    """List serializer that assembles the response from cached per-row cards"""
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, BaseManager) else data)
+        if not items:
+            return []
+        cache = get_card_cache()
+        origin = _request_origin(self.context.get("request"))
+        card_keys = [CARD_KEY.format(user_id=item.pk, origin=origin) for item in items]
+        version_keys = [VERSION_KEY.format(user_id=item.pk) for item in items]
+        found = cache.get_many([GENERATION_KEY, *version_keys, *card_keys])
+
+        generation = found.get(GENERATION_KEY)
+        if generation is None:
+            generation = _new_stamp()
+            if not cache.add(GENERATION_KEY, generation, timeout=card_timeout()):
+                generation = None
+
+        cards = []
+        fresh = {}
+        for item, card_key, version_key in zip(items, card_keys, version_keys):
+            version = found.get(version_key)
+            cached = found.get(card_key)
+            if generation is not None and version is not None and cached is not None:
+                stamp, card = cached
+                if stamp == (generation, version):
+                    cards.append(card)
+                    continue
+
+            card = self.child.to_representation(item)
+            cards.append(card)
+            if generation is None:
+                continue
+            if version is None:
+                version = _new_stamp()
+                # Someone bumped the stamp meanwhile: leave the card uncached
+                if not cache.add(version_key, version, timeout=card_timeout()):
+                    continue
+            fresh[card_key] = ((generation, version), card)
+
+        if fresh:
+            cache.set_many(fresh, timeout=card_timeout())
+        return cards
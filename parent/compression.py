@@ -0,0 +1,199 @@
+"""
+Response compression.
+
+``CompressionMiddleware`` encodes responses with brotli (when the ``brotli`` package
+is installed) or gzip, whichever the client's ``Accept-Encoding`` prefers; on a tie
+brotli wins. Only text-like types are compressed (JSON, MessagePack, JS, CSS, plain
+text, XML); images and other media are already compressed, event streams must not be
+buffered, and HTML is left alone because admin pages carry CSRF tokens (BREACH). For
+the same reason the account login, logout, register and change-password views are
+marked ``no_compression``: their bodies hold tokens next to user-supplied fields.
+
+- Bodies below ``RESPONSE_COMPRESSION_MIN_SIZE`` bytes are sent as is, and so is a
+  compressed body that would not be smaller.
+- Streaming responses (sync or async) are compressed chunk by chunk, flushing after
+  every chunk so clients still receive each one as soon as it is produced.
+- Paths under ``RESPONSE_COMPRESSION_EXCLUDE_PATHS`` (media by default) and views
+  decorated with ``no_compression`` are skipped.
+
+``manage.py benchmark_compression`` reports size and CPU cost on real payloads.
+"""
+
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.oai.openapi",
+    "text/css",
+    "text/csv",
+    "text/javascript",
+    "text/plain",
+    "text/xml",
+)
+
+
+def min_size():
+    return getattr(settings, "RESPONSE_COMPRESSION_MIN_SIZE", 1024)
+
+
+def excluded_paths():
+    return getattr(settings, "RESPONSE_COMPRESSION_EXCLUDE_PATHS", [settings.MEDIA_URL])
+
+
+class GzipCodec:
+    name = "gzip"
+
+    def __init__(self, level=None):
+        if level is None:
+            level = getattr(settings, "RESPONSE_COMPRESSION_GZIP_LEVEL", 6)
+        self.level = level
+
+    def compressor(self):
+        # wbits=31 writes a gzip header and trailer
+        stream = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return (
+            lambda chunk: stream.compress(chunk) + stream.flush(zlib.Z_SYNC_FLUSH),
+            stream.flush,
+        )
+
+    def compress(self, data):
+        stream = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return stream.compress(data) + stream.flush()
+
+
+class BrotliCodec:
+    name = "br"
+
+    def __init__(self, quality=None):
+        if quality is None:
+            quality = getattr(settings, "RESPONSE_COMPRESSION_BROTLI_QUALITY", 4)
+        self.quality = quality
+
+    def compressor(self):
+        stream = brotli.Compressor(quality=self.quality)
+        return lambda chunk: stream.process(chunk) + stream.flush(), stream.finish
+
+    def compress(self, data):
+        return brotli.compress(data, quality=self.quality)
+
+
+def available_codecs():
+    """Codecs in order of preference"""
+    codecs = [GzipCodec()]
+    if brotli is not None:
+        codecs.insert(0, BrotliCodec())
+    return codecs
+
+
+def choose_codec(accept_encoding, codecs=None):
+    """The preferred codec the ``Accept-Encoding`` header allows, or None"""
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, *params = [item.strip() for item in part.split(";")]
+        if not name:
+            continue
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+
+    best, best_weight = None, 0.0
+    for codec in codecs if codecs is not None else available_codecs():
+        weight = weights.get(codec.name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = codec, weight
+    return best
+
+
+def no_compression(view):
+    """Mark a view function or class so its responses are never compressed"""
+    view.compress_responses = False
+    return view
+
+
+def _compress_sequence(codec, chunks):
+    process, finish = codec.compressor()
+    for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+async def _compress_async_sequence(codec, chunks):
+    process, finish = codec.compressor()
+    async for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Compress eligible responses with the client's preferred encoding"""
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        if not getattr(view_func, "compress_responses", True) or not getattr(
+            view_class, "compress_responses", True
+        ):
+            request._skip_compression = True
+
+    def process_response(self, request, response):
+        if (
+            getattr(request, "_skip_compression", False)
+            or response.has_header("Content-Encoding")
+            or response.status_code in (204, 304)
+            or not response.get("Content-Type", "").startswith(COMPRESSIBLE_TYPES)
+            or request.path.startswith(tuple(excluded_paths()))
+        ):
+            return response
+        if not response.streaming and len(response.content) < min_size():
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        codec = choose_codec(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _compress_async_sequence(
+                    codec, response.streaming_content
+                )
+            else:
+                response.streaming_content = _compress_sequence(
+                    codec, response.streaming_content
+                )
+            # The compressed size is unknown until the stream ends
+            del response.headers["Content-Length"]
+        else:
+            compressed = codec.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # A strong ETag must change with the encoding (RFC 9110 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = codec.name
+        return response
@@ -0,0 +1,163 @@
+"""
+Conditional GET (``ETag`` / ``Last-Modified``) for read endpoints.
+
+Serializers declare the timestamp columns their output depends on in a
+``validator_fields`` tuple, as lookups from the serialized model (the way they
+declare joins in ``setup_eager_loading``). Before serializing, the viewset runs one
+aggregate over the filtered queryset: the row count plus ``Max()`` of each declared
+column. Every write that changes a row bumps its ``updated_at`` (including the
+queryset updates in bookings, series, the sweeper and renditions), inserts and
+status changes move the maximum, and deletions or rows leaving a filtered set change
+the count. Related rows can vanish without moving any timestamp (a ``SET_NULL``
+foreign key is cleared by a bulk UPDATE; a deleted reverse row just drops out of the
+join), so the aggregate also counts the distinct related rows behind every nullable
+or to-many step of the declared lookups. The ETag hashes those values with the user, the path and query string,
+and the negotiated media type; a matching ``If-None-Match`` gets a 304 without
+fetching or serializing any rows.
+
+``Last-Modified`` is only sent for single resources: for a collection, a deleted row
+changes the count but not the newest timestamp, so ``If-Modified-Since`` alone could
+not tell. Responses are marked ``Cache-Control: private, no-cache`` so browsers keep
+them and revalidate on every fetch.
+"""
+
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def _optional_relations(model, fields):
+    """Lookup prefixes of ``fields`` that go through a nullable or to-many relation"""
+    prefixes = []
+    for field in fields:
+        current, path = model, []
+        for name in field.split("__")[:-1]:
+            relation = current._meta.get_field(name)
+            path.append(name)
+            prefix = "__".join(path)
+            # Reverse relations (one_to_many, reverse one-to-one) report null=True
+            optional = relation.null or relation.one_to_many or relation.many_to_many
+            if optional and prefix not in prefixes:
+                prefixes.append(prefix)
+            current = relation.related_model
+    return prefixes
+
+
+def queryset_validator(queryset, fields):
+    """
+    ``(count, newest timestamp, validator parts)`` for ``queryset`` in one query.
+    The parts are the per-field maxima followed by the related-row counts.
+    """
+    maxima = {f"max_{index}": Max(field) for index, field in enumerate(fields)}
+    related = {
+        f"related_{index}": Count(prefix, distinct=True)
+        for index, prefix in enumerate(_optional_relations(queryset.model, fields))
+    }
+    values = queryset.order_by().aggregate(
+        count=Count("pk", distinct=True), **maxima, **related
+    )
+    stamps = [values[key] for key in maxima]
+    last_modified = max((stamp for stamp in stamps if stamp), default=None)
+    return values["count"], last_modified, stamps + [values[key] for key in related]
+
+
+def make_etag(request, *parts):
+    """Weak ETag for ``parts`` as seen by this user, URL and media type"""
+    key = repr(
+        (
+            str(getattr(request.user, "pk", "")),
+            request.get_full_path(),
+            getattr(request, "accepted_media_type", ""),
+            *(part.isoformat() if hasattr(part, "isoformat") else part for part in parts),
+        )
+    )
+    return "W/" + quote_etag(hashlib.sha1(key.encode()).hexdigest())
+
+
+def not_modified(request, etag, last_modified=None):
+    """The 304 response if the client's copy is current, else None"""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    if response.status_code not in (200, 304):
+        return response
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_get(request, queryset, serializer_class, respond, single=False):
+    """
+    Answer with 304 if the client's copy of ``queryset`` rendered by
+    ``serializer_class`` is current, otherwise call ``respond()`` and add the
+    validators to its response.
+    """
+    fields = getattr(serializer_class, "validator_fields", None)
+    if request.method not in ("GET", "HEAD") or not fields:
+        return respond()
+    try:
+        count, last_modified, parts = queryset_validator(queryset, fields)
+    except (ValueError, TypeError, ValidationError):
+        # Malformed lookup value: let the normal path produce the 404/400
+        return respond()
+    if single and not count:
+        return respond()
+
+    etag = make_etag(request, serializer_class.__name__, count, *parts)
+    last_modified = last_modified if single else None
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    return set_validators(respond(), etag, last_modified)
+
+
+class ConditionalGetMixin:
+    """Conditional GET for list, retrieve and ``paginated_response`` actions"""
+
+    def list(self, request, *args, **kwargs):
+        def respond():
+            return super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+
+        return conditional_get(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer_class(),
+            respond,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        def respond():
+            return super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (ValueError, TypeError, ValidationError):
+            return respond()
+        return conditional_get(
+            request, queryset, self.get_serializer_class(), respond, single=True
+        )
+
+    def paginated_response(self, queryset, serializer_class=None, conditional=True, **kwargs):
+        def respond():
+            return super(ConditionalGetMixin, self).paginated_response(
+                queryset, serializer_class, **kwargs
+            )
+
+        if not conditional:
+            return respond()
+        return conditional_get(
+            self.request, queryset, serializer_class or self.get_serializer_class(), respond
+        )
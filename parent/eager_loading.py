@@ -0,0 +1,32 @@
+"""
+Action-aware eager loading for viewsets.
+
+Serializers that read related objects declare what they need in a
+``setup_eager_loading(queryset)`` static method. The viewset applies it for
+whichever serializer the current action uses, so list endpoints run a constant
+number of queries however many rows they return. Serializers with sparse fieldsets
+(see parent/sparse_fields.py) get the serializer context as well and only join
+what the requested fields read.
+"""
+
+from .sparse_fields import SparseFieldsMixin
+
+
+def apply_eager_loading(queryset, serializer_class, context=None):
+    """Return ``queryset`` with the joins/prefetches ``serializer_class`` declares"""
+    setup = getattr(serializer_class, "setup_eager_loading", None)
+    if setup is None:
+        return queryset
+    if issubclass(serializer_class, SparseFieldsMixin):
+        return setup(queryset, context)
+    return setup(queryset)
+
+
+class EagerLoadingMixin:
+    """Apply the action's serializer eager loading to list, retrieve and get_object"""
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return apply_eager_loading(
+            queryset, self.get_serializer_class(), self.get_serializer_context()
+        )
@@ -0,0 +1,141 @@
+"""
+Publish/subscribe for real-time updates (story posts, booking status changes).
+
+Events are published to per-user channels (``user:<id>``) once the surrounding
+transaction commits, and delivered to connected clients by the server-sent events
+stream in ``parent.streams``.
+
+The backend is pluggable through ``settings.PARENT_EVENT_BACKEND``. The default
+``InProcessEventBackend`` fans out inside a single process, which is enough for one
+ASGI worker; a multi-process deployment needs a backend that shares events between
+workers (e.g. Redis pub/sub) implementing the same two methods.
+"""
+
+import asyncio
+import itertools
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+DEFAULT_EVENT_BACKEND = "parent.events.InProcessEventBackend"
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+class BaseEventBackend:
+    """Interface for event backends"""
+
+    def publish(self, channel, event):
+        """Deliver ``event`` (a JSON-serializable dict) to subscribers of ``channel``"""
+        raise NotImplementedError
+
+    def subscribe(self, channel):
+        """Return a Subscription for ``channel``; must be called inside an event loop"""
+        raise NotImplementedError
+
+
+class Subscription:
+    """One client's view of a channel: an asyncio queue filled by the backend"""
+
+    def __init__(self, backend, channel, max_pending):
+        self.backend = backend
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_pending)
+
+    def offer(self, event):
+        """Called on the subscriber's loop; drops the oldest event for slow clients"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout=None):
+        """Next event, or None if nothing arrived within ``timeout`` seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.backend.unsubscribe(self)
+
+
+class InProcessEventBackend(BaseEventBackend):
+    """
+    Fan-out between threads and event loops of the current process.
+    ``publish`` may be called from synchronous code (signals, request threads).
+    """
+
+    max_pending = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's loop has shut down
+                self.unsubscribe(subscription)
+        return len(subscriptions)
+
+    def subscribe(self, channel):
+        subscription = Subscription(self, channel, self.max_pending)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+
+_backend = None
+_backend_path = None
+_event_ids = itertools.count(1)
+
+
+def get_event_backend():
+    """The configured backend, created on first use"""
+    global _backend, _backend_path
+    path = getattr(settings, "PARENT_EVENT_BACKEND", DEFAULT_EVENT_BACKEND)
+    if _backend is None or path != _backend_path:
+        _backend = import_string(path)()
+        _backend_path = path
+    return _backend
+
+
+def publish_event(user_ids, event_type, data):
+    """
+    Send an event to each of ``user_ids`` after the current transaction commits,
+    so clients never hear about rows that end up rolled back.
+    """
+    user_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+    if not user_ids:
+        return
+    event = {
+        "id": next(_event_ids),
+        "type": event_type,
+        "data": data,
+        "sent_at": timezone.now().isoformat(),
+    }
+
+    def send():
+        backend = get_event_backend()
+        for user_id in user_ids:
+            backend.publish(user_channel(user_id), event)
+
+    transaction.on_commit(send)
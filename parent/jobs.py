@@ -0,0 +1,245 @@
+"""
+Database-backed background jobs.
+
+Register a function with ``@job`` and queue it with ``enqueue``. The row is written in
+the caller's transaction, so workers only see a job once that transaction commits and
+never see it if it rolls back. ``manage.py run_worker`` starts worker processes that
+claim due jobs, run them and record the outcome.
+
+- Delayed jobs: ``enqueue(func, ..., delay=timedelta(minutes=5))`` or ``run_at=``
+- Retries: a job that raises is queued again with exponential backoff until
+  ``max_attempts`` is used up, then kept as FAILED with the traceback
+- Visibility timeout: a claimed job is leased to one worker until ``locked_until``;
+  if that worker dies, another one picks the job up after the lease expires
+- Claiming uses ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database supports it
+  (PostgreSQL, MySQL 8). SQLite has no row locks, so there each claim is a conditional
+  UPDATE that only one worker can win.
+
+Arguments must be JSON-serializable. A job can run more than once (a lease may expire
+mid-run), so job functions should be idempotent. Successful jobs are deleted.
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+def job(func=None, *, queue="default", max_attempts=5, timeout=None):
+    """
+    Register ``func`` as a job under its dotted path. ``timeout`` (seconds) is the
+    visibility timeout, defaulting to ``settings.JOB_VISIBILITY_TIMEOUT``.
+    The function itself is returned unchanged and can still be called directly.
+    """
+
+    def register(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        func.job_name = name
+        func.job_options = {
+            "queue": queue,
+            "max_attempts": max_attempts,
+            "timeout": timeout,
+        }
+        _registry[name] = func
+        return func
+
+    return register(func) if func is not None else register
+
+
+def get_job_function(name):
+    """The registered function for ``name``, importing its module if needed"""
+    if name not in _registry:
+        try:
+            import_string(name)
+        except ImportError:
+            pass
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f"No job registered as '{name}'.") from None
+
+
+def enqueue(func, *args, delay=None, run_at=None, queue=None, **kwargs):
+    """Queue ``func(*args, **kwargs)``; runs after ``run_at`` / ``delay`` if given"""
+    name = getattr(func, "job_name", func)
+    options = get_job_function(name).job_options
+    if run_at is None:
+        run_at = timezone.now() + (delay or timedelta())
+    return Job.objects.create(
+        name=name,
+        queue=queue or options["queue"],
+        args=list(args),
+        kwargs=kwargs,
+        max_attempts=options["max_attempts"],
+        run_at=run_at,
+    )
+
+
+def visibility_timeout(name):
+    try:
+        timeout = get_job_function(name).job_options["timeout"]
+    except LookupError:
+        timeout = None
+    if timeout is None:
+        timeout = getattr(settings, "JOB_VISIBILITY_TIMEOUT", 300)
+    return timedelta(seconds=timeout)
+
+
+def retry_delay(attempts):
+    """Backoff before the next attempt: base * 2^(attempts - 1), capped, +-10% jitter"""
+    base = getattr(settings, "JOB_RETRY_BACKOFF", 10)
+    cap = getattr(settings, "JOB_RETRY_BACKOFF_MAX", 3600)
+    seconds = min(base * 2 ** max(attempts - 1, 0), cap)
+    return timedelta(seconds=seconds * random.uniform(0.9, 1.1))
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_job(worker_id, queues=None, now=None):
+    """
+    Lease the oldest due job to ``worker_id`` and return it, or None if there is
+    nothing to do. Expired leases count as due, so crashed workers' jobs are retried.
+    """
+    now = now or timezone.now()
+    using = router.db_for_write(Job)
+    jobs = Job.objects.using(using)
+    candidates = jobs.claimable(now, queues).order_by("run_at", "id")
+
+    def lease(job_id, name):
+        return jobs.claimable(now, queues).filter(pk=job_id).update(
+            status=Job.Status.RUNNING,
+            attempts=F("attempts") + 1,
+            locked_by=worker_id,
+            locked_until=now + visibility_timeout(name),
+        )
+
+    if connections[using].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=using):
+            row = (
+                candidates.select_for_update(skip_locked=True)
+                .values_list("id", "name")
+                .first()
+            )
+            if row is None or not lease(*row):
+                return None
+        return jobs.get(pk=row[0])
+
+    # No row locks: read outside a transaction (a read lock upgraded to a write lock
+    # deadlocks between SQLite writers), then race for each row with an UPDATE
+    for job_id, name in candidates.values_list("id", "name")[:10]:
+        if lease(job_id, name):
+            return jobs.get(pk=job_id)
+    return None
+
+
+def _release(job, worker_id, **fields):
+    """Update a job only if this worker still holds its lease"""
+    return Job.objects.filter(
+        pk=job.pk, status=Job.Status.RUNNING, locked_by=worker_id
+    ).update(**fields)
+
+
+def run_job(job, worker_id):
+    """Run a claimed job and record success, a retry or the final failure"""
+    try:
+        if job.attempts > job.max_attempts:
+            raise TimeoutError("Visibility timeout expired on the final attempt.")
+        func = get_job_function(job.name)
+        func(*job.args, **job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if job.attempts >= job.max_attempts:
+            logger.error("Job %s failed permanently:\n%s", job, error)
+            _release(
+                job,
+                worker_id,
+                status=Job.Status.FAILED,
+                last_error=error,
+                locked_until=None,
+                finished_at=now,
+            )
+        else:
+            logger.warning("Job %s failed, will retry:\n%s", job, error)
+            _release(
+                job,
+                worker_id,
+                status=Job.Status.QUEUED,
+                last_error=error,
+                locked_until=None,
+                run_at=now + retry_delay(job.attempts),
+            )
+        return False
+    else:
+        Job.objects.filter(pk=job.pk, locked_by=worker_id).delete()
+        return True
+    finally:
+        close_old_connections()
+
+
+def run_pending(queues=None, worker_id=None, limit=None):
+    """Run due jobs in the current thread until none are left; returns the count"""
+    worker_id = worker_id or default_worker_id()
+    count = 0
+    while limit is None or count < limit:
+        job = claim_job(worker_id, queues)
+        if job is None:
+            break
+        run_job(job, worker_id)
+        count += 1
+    return count
+
+
+class Worker:
+    """Claims and runs jobs one at a time until ``stop()`` is called"""
+
+    def __init__(self, queues=None, poll_interval=1.0, burst=False, max_jobs=None):
+        self.queues = queues or None
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.max_jobs = max_jobs
+        self.worker_id = default_worker_id()
+        self.processed = 0
+        self._stopping = threading.Event()
+
+    def stop(self, *args):
+        """Finish the current job, then exit (safe to use as a signal handler)"""
+        self._stopping.set()
+
+    def run(self):
+        logger.info("Worker %s started (queues: %s)", self.worker_id, self.queues)
+        while not self._stopping.is_set():
+            if self.max_jobs is not None and self.processed >= self.max_jobs:
+                break
+            try:
+                job = claim_job(self.worker_id, self.queues)
+            except Exception:
+                logger.exception("Worker %s could not claim a job", self.worker_id)
+                close_old_connections()
+                job = None
+            if job is not None:
+                run_job(job, self.worker_id)
+                self.processed += 1
+                continue
+            if self.burst:
+                break
+            self._stopping.wait(self.poll_interval)
+        logger.info("Worker %s stopped after %d job(s)", self.worker_id, self.processed)
+        return self.processed
@@ -0,0 +1,43 @@
+from django.db import IntegrityError, connections, router, transaction
+from django.db.transaction import TransactionManagementError
+from django.utils import timezone
+
+from account.models import User
+from .models import BookingLock
+
+
+def lock_babysitter(babysitter_id):
+    """
+    Serialize booking changes for one babysitter until the current transaction ends.
+
+    Uses ``SELECT ... FOR UPDATE`` on the babysitter's user row where the backend
+    supports it. SQLite has no row locks, so there we write to the babysitter's
+    BookingLock row instead, which takes the database write lock and makes other
+    writers wait for our commit.
+    """
+    using = router.db_for_write(BookingLock)
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        raise TransactionManagementError(
+            "lock_babysitter() must be called inside transaction.atomic()."
+        )
+
+    if connection.features.has_select_for_update:
+        list(
+            User.objects.using(using)
+            .select_for_update()
+            .filter(pk=babysitter_id)
+            .values_list("pk", flat=True)
+        )
+        return
+
+    now = timezone.now()
+    locks = BookingLock.objects.using(using)
+    if locks.filter(babysitter_id=babysitter_id).update(locked_at=now):
+        return
+    try:
+        with transaction.atomic(using=using):
+            locks.create(babysitter_id=babysitter_id, locked_at=now)
+    except IntegrityError:
+        # Another transaction created the row first; updating it now waits on that lock
+        locks.filter(babysitter_id=babysitter_id).update(locked_at=now)
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from parent.benchmarks import run_compression_benchmark, serializer_payloads
+
+
+class Command(BaseCommand):
+    help = (
+        "Compress rendered API pages with gzip and brotli at several levels. "
+        "Reports bytes saved and median CPU time per response."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=50,
+            help="Rows per payload; the default page size is 50 (default: 50)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Compressions timed per payload and codec (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        payloads = serializer_payloads(rows=options["rows"])
+        if not payloads:
+            raise CommandError("No data to compress; run `manage.py seed_load` first.")
+
+        results = run_compression_benchmark(payloads, repeat=options["repeat"])
+        self.stdout.write(
+            f"{'payload':<16}{'rows':>6}  {'codec':<8}{'bytes':>10}{'compressed':>12}"
+            f"{'saved':>8}{'median ms':>11}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['payload']:<16}{row['rows']:>6}  {row['codec']:<8}{row['bytes']:>10}"
+                f"{row['compressed']:>12}{row['saved_pct']:>7}%{row['median_ms']:>11.3f}"
+            )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from parent.benchmarks import run_read_path_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare serializer.data with the values read path on the list serializers "
+        "that support it. Reports median time per list and rows per second."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=1000,
+            help="Rows read per list (default: 1000)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Reads timed per serializer and path (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = run_read_path_benchmark(rows=options["rows"], repeat=options["repeat"])
+        except AssertionError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(
+            f"{'serializer':<34}{'path':<12}{'rows':>6}{'median ms':>11}{'rows/s':>10}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['serializer']:<34}{row['path']:<12}{row['rows']:>6}"
+                f"{row['median_ms']:>11.3f}{row['rows_per_s']:>10}"
+            )
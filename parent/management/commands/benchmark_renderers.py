@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from parent.benchmarks import run_renderer_benchmark, serializer_payloads
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSONRenderer with the fast JSON and MessagePack renderers "
+        "on real serializer output. Reports median render time and size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200,
+            help="Rows serialized per payload (default: 200)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Renders timed per payload and renderer (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        payloads = serializer_payloads(rows=options["rows"])
+        if not payloads:
+            raise CommandError("No data to render; run `manage.py seed_load` first.")
+
+        results = run_renderer_benchmark(payloads, repeat=options["repeat"])
+        self.stdout.write(
+            f"{'payload':<16}{'rows':>6}  {'renderer':<10}{'median ms':>11}{'bytes':>10}"
+        )
+        baseline = {}
+        for row in results:
+            if row["renderer"] == "drf-json":
+                baseline[row["payload"]] = row["median_ms"]
+            speedup = ""
+            if row["renderer"] != "drf-json" and row["median_ms"]:
+                speedup = f"  x{baseline[row['payload']] / row['median_ms']:.1f}"
+            self.stdout.write(
+                f"{row['payload']:<16}{row['rows']:>6}  {row['renderer']:<10}"
+                f"{row['median_ms']:>11.3f}{row['bytes']:>10}{speedup}"
+            )
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from parent.jobs import enqueue
+from parent.renditions import IMAGE_FIELDS, generate_renditions, renditions_field
+
+
+class Command(BaseCommand):
+    help = "Create thumbnail/card/full renditions for uploaded images that lack them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every rendition, not only missing or stale ones",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of images processed in parallel (default: 4)",
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Queue background jobs for run_worker instead of resizing here",
+        )
+
+    def handle(self, *args, **options):
+        jobs = []
+        for label, field_name in IMAGE_FIELDS:
+            model = apps.get_model(label)
+            rows = (
+                model.objects.exclude(**{field_name: ""})
+                .exclude(**{f"{field_name}__isnull": True})
+                .values_list("pk", field_name, renditions_field(field_name))
+            )
+            for pk, name, renditions in rows.iterator():
+                if options["all"] or (renditions or {}).get("source") != name:
+                    jobs.append((label, str(pk), field_name))
+
+        if options["enqueue"]:
+            for job in jobs:
+                enqueue(generate_renditions, *job)
+            self.stdout.write(self.style.SUCCESS(f"Queued {len(jobs)} image(s)."))
+            return
+
+        def run(job):
+            try:
+                return generate_renditions(*job) is not None
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=max(1, options["workers"])) as pool:
+            done = sum(pool.map(run, jobs))
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created renditions for {done} of {len(jobs)} image(s).")
+        )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from parent.stats import rebuild_babysitter_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized BabysitterStats table from BabysitterReview"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--babysitter",
+            action="append",
+            dest="babysitters",
+            help="Only rebuild stats for this babysitter id (can be repeated)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows written per bulk insert (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_babysitter_stats(
+            babysitter_ids=options["babysitters"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt stats for {written} babysitter(s).")
+        )
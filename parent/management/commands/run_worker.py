@@ -0,0 +1,114 @@
+import multiprocessing
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from parent.jobs import Worker
+
+
+def _work(options):
+    # Each child opens its own database connection
+    worker = Worker(**options)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+
+
+class Command(BaseCommand):
+    help = "Run background job worker processes (see parent/jobs.py)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of worker processes (default: 1)",
+        )
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="Only take jobs from this queue; repeat for several (default: all)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when no job is due (default: 1)",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no due jobs are left instead of waiting for more",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            help="Exit each process after running this many jobs",
+        )
+
+    def handle(self, *args, **options):
+        processes = options["processes"]
+        if processes < 1:
+            raise CommandError("--processes must be at least 1.")
+        worker_options = {
+            "queues": options["queues"],
+            "poll_interval": options["poll_interval"],
+            "burst": options["burst"],
+            "max_jobs": options["max_jobs"],
+        }
+
+        if processes == 1:
+            worker = Worker(**worker_options)
+            previous = {
+                signum: signal.signal(signum, worker.stop)
+                for signum in (signal.SIGTERM, signal.SIGINT)
+            }
+            try:
+                processed = worker.run()
+            finally:
+                for signum, handler in previous.items():
+                    signal.signal(signum, handler)
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} job(s)."))
+            return
+
+        # Connections must not be shared with forked children
+        connections.close_all()
+        children = [
+            multiprocessing.Process(target=_work, args=(worker_options,))
+            for _ in range(processes)
+        ]
+        stopping = False
+
+        def stop(signum, frame):
+            nonlocal stopping
+            stopping = True
+            for child in children:
+                if child.is_alive():
+                    child.terminate()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        for child in children:
+            child.start()
+        self.stdout.write(f"Started {processes} worker processes.")
+
+        # Restart children that crash; stop when all exited on their own (--burst)
+        while True:
+            for index, child in enumerate(children):
+                if child.is_alive() or child.exitcode is None:
+                    continue
+                if child.exitcode != 0 and not stopping:
+                    self.stderr.write(
+                        f"Worker {child.pid} exited with {child.exitcode}, restarting."
+                    )
+                    children[index] = multiprocessing.Process(
+                        target=_work, args=(worker_options,)
+                    )
+                    children[index].start()
+            if not any(child.is_alive() for child in children):
+                break
+            time.sleep(0.5)
+        self.stdout.write(self.style.SUCCESS("All workers stopped."))
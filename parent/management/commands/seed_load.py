@@ -0,0 +1,92 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import User
+from parent.seeding import flush_seeded, seed_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic data set (parents, children, babysitters "
+        "with availability, bookings, reviews, stories) for load and benchmark work"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--parents",
+            type=int,
+            default=700,
+            help="Number of parent users (default: 700)",
+        )
+        parser.add_argument(
+            "--babysitters",
+            type=int,
+            default=300,
+            help="Number of babysitter users (default: 300)",
+        )
+        parser.add_argument(
+            "--bookings",
+            type=int,
+            default=20000,
+            help="Number of bookings across all statuses (default: 20000)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed gives the same data (default: 0)",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="load",
+            help="Email prefix of generated users (default: load)",
+        )
+        parser.add_argument(
+            "--anchor",
+            type=date.fromisoformat,
+            help="Date (YYYY-MM-DD) separating past and future bookings (default: today)",
+        )
+        parser.add_argument(
+            "--future-days",
+            type=int,
+            default=60,
+            help="How far past the anchor bookings are scheduled (default: 60)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows written per transaction (default: 5000)",
+        )
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete users previously generated with the same prefix first",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if options["flush"]:
+            deleted = flush_seeded(prefix, batch_size=options["batch_size"])
+            self.stdout.write(f"Deleted {deleted} rows from a previous run.")
+        elif User.objects.filter(email__startswith=f"{prefix}-").exists():
+            raise CommandError(
+                f"Users with prefix '{prefix}' already exist. "
+                "Use --flush to replace them or pick another --prefix."
+            )
+
+        written = seed_load(
+            parents=options["parents"],
+            babysitters=options["babysitters"],
+            bookings=options["bookings"],
+            seed=options["seed"],
+            prefix=prefix,
+            anchor=options["anchor"],
+            future_days=options["future_days"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        )
+        for name, count in written.items():
+            self.stdout.write(f"{name:>24}: {count}")
+        self.stdout.write(self.style.SUCCESS("Seed data generated."))
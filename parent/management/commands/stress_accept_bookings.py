@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import User
+from parent.stress import create_overlapping_requests, run_accept_stress
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent accepts for overlapping requests of one babysitter and "
+        "verify that at most one wins. Reports throughput and latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=300,
+            help="Number of overlapping PENDING requests to accept (default: 300)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=16,
+            help="Number of concurrent worker threads (default: 16)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated users and requests instead of deleting them",
+        )
+
+    def handle(self, *args, **options):
+        babysitter, parent_user, request_ids = create_overlapping_requests(
+            options["requests"]
+        )
+        try:
+            result = run_accept_stress(
+                babysitter, request_ids, threads=options["threads"]
+            )
+        finally:
+            if not options["keep"]:
+                User.objects.filter(pk__in=[babysitter.pk, parent_user.pk]).delete()
+
+        for key, value in result.items():
+            self.stdout.write(f"{key:>18}: {value}")
+
+        if result["accepted"] > 1 or result["accepted_in_db"] > 1:
+            raise CommandError("Double booking: more than one overlapping accept won.")
+        self.stdout.write(self.style.SUCCESS("OK: at most one overlapping accept won."))
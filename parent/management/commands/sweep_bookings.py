@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from parent.sweeper import DEFAULT_BATCH_SIZE, sweep_stale_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark ended ACCEPTED bookings COMPLETED and past PENDING requests EXPIRED. "
+        "Safe to run from cron on several nodes at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows updated per statement (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--every",
+            type=int,
+            metavar="SECONDS",
+            help="Keep running and sweep again every SECONDS instead of once",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            counts = sweep_stale_bookings(batch_size=options["batch_size"])
+            self.stdout.write(
+                f"{counts['completed']} booking(s) completed, "
+                f"{counts['expired']} request(s) expired."
+            )
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
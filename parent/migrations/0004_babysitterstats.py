@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:57
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_babysitter_stats(apps, schema_editor):
+    BabysitterReview = apps.get_model("parent", "BabysitterReview")
+    BabysitterStats = apps.get_model("parent", "BabysitterStats")
+
+    histogram = {
+        f"rating_{rating}_count": models.Count("id", filter=models.Q(rating=rating))
+        for rating in range(1, 6)
+    }
+    rows = (
+        BabysitterReview.objects.values("babysitter_id")
+        .annotate(
+            total_reviews=models.Count("id"),
+            rating_sum=models.Sum("rating"),
+            last_review_at=models.Max("created_at"),
+            **histogram,
+        )
+        .order_by("babysitter_id")
+    )
+    BabysitterStats.objects.bulk_create(
+        [
+            BabysitterStats(
+                average_rating=round(row["rating_sum"] / row["total_reviews"], 2),
+                **row,
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_userprofile_citizenship_document'),
+        ('parent', '0003_babysitterstory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BabysitterStats',
+            fields=[
+                ('babysitter', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='babysitter_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=0, max_digits=3, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(5)])),
+                ('total_reviews', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_1_count', models.PositiveIntegerField(default=0)),
+                ('rating_2_count', models.PositiveIntegerField(default=0)),
+                ('rating_3_count', models.PositiveIntegerField(default=0)),
+                ('rating_4_count', models.PositiveIntegerField(default=0)),
+                ('rating_5_count', models.PositiveIntegerField(default=0)),
+                ('last_review_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Babysitter Stats',
+                'verbose_name_plural': 'Babysitter Stats',
+            },
+        ),
+        migrations.RunPython(backfill_babysitter_stats, migrations.RunPython.noop),
+    ]
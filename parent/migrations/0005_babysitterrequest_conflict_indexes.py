@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parent', '0004_babysitterstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='babysitterrequest',
+            index=models.Index(fields=['babysitter', 'status', 'start_date', 'end_date'], name='parent_req_sitter_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='babysitterrequest',
+            index=models.Index(fields=['babysitter', 'status', 'end_date'], name='parent_req_sitter_end_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_userprofile_citizenship_document'),
+        ('parent', '0005_babysitterrequest_conflict_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingLock',
+            fields=[
+                ('babysitter', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='booking_lock', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Booking Lock',
+                'verbose_name_plural': 'Booking Locks',
+            },
+        ),
+    ]
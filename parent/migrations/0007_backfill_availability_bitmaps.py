@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:07
+
+from django.db import migrations
+
+from parent.availability_bitmap import build_bitmap
+
+
+def backfill_availability_bitmaps(apps, schema_editor):
+    UserProfile = apps.get_model("account", "UserProfile")
+    BabysitterAvailability = apps.get_model("parent", "BabysitterAvailability")
+
+    slots_by_babysitter = {}
+    for babysitter_id, day_of_week, start_time, end_time in (
+        BabysitterAvailability.objects.values_list(
+            "babysitter_id", "day_of_week", "start_time", "end_time"
+        ).iterator()
+    ):
+        slots_by_babysitter.setdefault(babysitter_id, []).append(
+            (day_of_week, start_time, end_time)
+        )
+
+    profiles = UserProfile.objects.filter(user__role="BABYSITTER").only("id", "user_id")
+    for profile in profiles.iterator():
+        profile.availability_bitmap = build_bitmap(
+            slots_by_babysitter.get(profile.user_id, [])
+        )
+        profile.save(update_fields=["availability_bitmap"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_userprofile_availability_bitmap'),
+        ('parent', '0006_bookinglock'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_availability_bitmaps, migrations.RunPython.noop),
+    ]
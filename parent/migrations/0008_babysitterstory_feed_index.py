@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parent', '0007_backfill_availability_bitmaps'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='babysitterstory',
+            index=models.Index(fields=['booking', 'created_at'], name='parent_story_booking_time_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parent', '0010_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='babysitterrequest',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('ACCEPTED', 'Accepted'), ('REJECTED', 'Rejected'), ('CANCELLED', 'Cancelled'), ('COMPLETED', 'Completed'), ('EXPIRED', 'Expired')], default='PENDING', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='babysitterrequest',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['start_date'], name='parent_req_pending_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='babysitterrequest',
+            index=models.Index(condition=models.Q(('status', 'ACCEPTED')), fields=['end_date'], name='parent_req_accepted_end_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:42
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parent', '0011_booking_expired_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingSeries',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('weekdays', models.JSONField(help_text='Days of the week, 0=Monday')),
+                ('interval', models.PositiveSmallIntegerField(default=1, help_text='Repeat every N weeks')),
+                ('starts_on', models.DateField(help_text='First day the series may occur')),
+                ('until', models.DateField(blank=True, help_text='Last day the series may occur', null=True)),
+                ('count', models.PositiveSmallIntegerField(blank=True, help_text='Number of occurrences', null=True)),
+                ('exceptions', models.JSONField(blank=True, default=list, help_text='Dates (YYYY-MM-DD) to leave out')),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('hourly_rate', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('special_requirements', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('babysitter', models.ForeignKey(blank=True, limit_choices_to={'role': 'BABYSITTER'}, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='booking_series_received', to=settings.AUTH_USER_MODEL)),
+                ('child', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='booking_series', to='parent.childprofile')),
+                ('parent', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booking_series', to='parent.parentprofile')),
+            ],
+            options={
+                'verbose_name': 'Booking Series',
+                'verbose_name_plural': 'Booking Series',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='babysitterrequest',
+            name='series',
+            field=models.ForeignKey(blank=True, help_text='Recurring series this booking was created from', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='occurrences', to='parent.bookingseries'),
+        ),
+    ]
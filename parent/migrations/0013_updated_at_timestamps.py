@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parent', '0012_bookingseries'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='babysitteravailability',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='babysitterstory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
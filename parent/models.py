@@ -1,7 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from decimal import Decimal
 import uuid
 
 
@@ -27,6 +29,10 @@ class ParentProfile(models.Model):
         null=True,
         help_text=_("Parent profile picture"),
     )
+    # Resized WebP/JPEG versions of profile_picture (see renditions.py)
+    profile_picture_renditions = models.JSONField(
+        default=dict, blank=True, editable=False
+    )
     verified = models.BooleanField(
         default=False, help_text=_("Is parent profile verified")
     )
@@ -89,6 +95,35 @@ class ChildProfile(models.Model):
         return f"{self.name} (Child of {self.parent.user.first_name} {self.parent.user.last_name})"
 
 
+class BabysitterRequestQuerySet(models.QuerySet):
+    """Query helpers for booking conflict checks"""
+
+    # Statuses that occupy a babysitter's time
+    BLOCKING_STATUSES = ("ACCEPTED", "COMPLETED")
+
+    def blocking(self):
+        """Bookings that block the babysitter's calendar"""
+        return self.filter(status__in=self.BLOCKING_STATUSES)
+
+    def overlapping(self, start_date, end_date):
+        """Bookings whose interval intersects [start_date, end_date)"""
+        return self.filter(start_date__lt=end_date, end_date__gt=start_date)
+
+    def find_conflict(self, babysitter, start_date, end_date, exclude_id=None):
+        """
+        Return the earliest accepted/completed booking of the babysitter that overlaps
+        the given window, or None. Runs as a single indexed LIMIT 1 query.
+        """
+        queryset = self.blocking().filter(babysitter=babysitter).overlapping(
+            start_date, end_date
+        )
+        if exclude_id is not None:
+            queryset = queryset.exclude(id=exclude_id)
+        return (
+            queryset.only("id", "start_date", "end_date").order_by("start_date").first()
+        )
+
+
 class BabysitterRequest(models.Model):
     """Model for babysitter requests/bookings"""
 
@@ -98,6 +133,7 @@ class BabysitterRequest(models.Model):
         ("REJECTED", _("Rejected")),
         ("CANCELLED", _("Cancelled")),
         ("COMPLETED", _("Completed")),
+        ("EXPIRED", _("Expired")),
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -137,13 +173,53 @@ class BabysitterRequest(models.Model):
         null=True,
         help_text=_("Special requirements or notes for the babysitter"),
     )
+    series = models.ForeignKey(
+        "BookingSeries",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="occurrences",
+        help_text=_("Recurring series this booking was created from"),
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BabysitterRequestQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Babysitter Request")
         verbose_name_plural = _("Babysitter Requests")
         ordering = ["-created_at"]
+        indexes = [
+            # Conflict checks: start_date < new_end AND end_date > new_start
+            models.Index(
+                fields=["babysitter", "status", "start_date", "end_date"],
+                name="parent_req_sitter_start_idx",
+            ),
+            models.Index(
+                fields=["babysitter", "status", "end_date"],
+                name="parent_req_sitter_end_idx",
+            ),
+            # Stale booking sweeper (parent.sweeper): only live rows are indexed
+            models.Index(
+                fields=["start_date"],
+                condition=models.Q(status="PENDING"),
+                name="parent_req_pending_start_idx",
+            ),
+            models.Index(
+                fields=["end_date"],
+                condition=models.Q(status="ACCEPTED"),
+                name="parent_req_accepted_end_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as loaded, so post_save can tell when it changed (parent.signals).
+        # Deferred (only()) rows have no status here and never publish changes.
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
 
     def __str__(self):
         return f"Babysitting Request - {self.parent.user.email} - {self.status}"
@@ -155,6 +231,82 @@ class BabysitterRequest(models.Model):
         return self.total_cost
 
 
+class BookingSeries(models.Model):
+    """
+    A recurring booking: a weekly rule expanded into one BabysitterRequest per
+    occurrence (see parent.series).
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    parent = models.ForeignKey(
+        ParentProfile, on_delete=models.CASCADE, related_name="booking_series"
+    )
+    child = models.ForeignKey(
+        ChildProfile,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="booking_series",
+    )
+    babysitter = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        limit_choices_to={"role": "BABYSITTER"},
+        related_name="booking_series_received",
+    )
+    weekdays = models.JSONField(help_text=_("Days of the week, 0=Monday"))
+    interval = models.PositiveSmallIntegerField(
+        default=1, help_text=_("Repeat every N weeks")
+    )
+    starts_on = models.DateField(help_text=_("First day the series may occur"))
+    until = models.DateField(
+        blank=True, null=True, help_text=_("Last day the series may occur")
+    )
+    count = models.PositiveSmallIntegerField(
+        blank=True, null=True, help_text=_("Number of occurrences")
+    )
+    exceptions = models.JSONField(
+        default=list, blank=True, help_text=_("Dates (YYYY-MM-DD) to leave out")
+    )
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    hourly_rate = models.DecimalField(max_digits=10, decimal_places=2)
+    special_requirements = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Booking Series")
+        verbose_name_plural = _("Booking Series")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Booking series - {self.parent_id} - {self.starts_on}"
+
+
+class BookingLock(models.Model):
+    """
+    One row per babysitter, written to serialize booking acceptance on databases
+    without row-level locks (SQLite). See parent.locking.
+    """
+
+    babysitter = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="booking_lock",
+    )
+    locked_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("Booking Lock")
+        verbose_name_plural = _("Booking Locks")
+
+    def __str__(self):
+        return f"Booking lock for {self.babysitter_id}"
+
+
 class BabysitterReview(models.Model):
     """Model for parent reviews of babysitters"""
 
@@ -194,6 +346,91 @@ class BabysitterReview(models.Model):
     def __str__(self):
         return f"Review by {self.parent.user.email} for Booking {self.booking.id}"
 
+    def save(self, *args, **kwargs):
+        # Run the save and the BabysitterStats update (post_save) in one transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+
+class BabysitterStats(models.Model):
+    """Denormalized rating summary per babysitter, kept in sync with BabysitterReview"""
+
+    babysitter = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="babysitter_stats",
+    )
+    average_rating = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(5)],
+    )
+    total_reviews = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    last_review_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Babysitter Stats")
+        verbose_name_plural = _("Babysitter Stats")
+
+    def __str__(self):
+        return f"Stats for {self.babysitter_id} - {self.average_rating} ({self.total_reviews})"
+
+    @property
+    def histogram(self):
+        """Review counts keyed by star rating (1-5)"""
+        return {
+            rating: getattr(self, f"rating_{rating}_count") for rating in range(1, 6)
+        }
+
+    def refresh_average(self):
+        """Recompute average_rating from the running sum and count"""
+        if self.total_reviews:
+            average = round(self.rating_sum / self.total_reviews, 2)
+            self.average_rating = Decimal(str(average))
+        else:
+            self.average_rating = Decimal("0")
+        return self.average_rating
+
+    def add_rating(self, rating, created_at=None):
+        """Account for one new review"""
+        field = f"rating_{rating}_count"
+        setattr(self, field, getattr(self, field) + 1)
+        self.total_reviews += 1
+        self.rating_sum += rating
+        if created_at and (not self.last_review_at or created_at > self.last_review_at):
+            self.last_review_at = created_at
+        self.refresh_average()
+
+    def remove_rating(self, rating):
+        """Account for one removed review (last_review_at is handled by the caller)"""
+        field = f"rating_{rating}_count"
+        setattr(self, field, max(getattr(self, field) - 1, 0))
+        self.total_reviews = max(self.total_reviews - 1, 0)
+        self.rating_sum = max(self.rating_sum - rating, 0)
+        self.refresh_average()
+
+    @classmethod
+    def for_update(cls, babysitter_id, create=True):
+        """Fetch (or create) the stats row for a babysitter, locked for the current transaction"""
+        queryset = cls.objects.select_for_update()
+        if not create:
+            return queryset.filter(babysitter_id=babysitter_id).first()
+        stats, _ = queryset.get_or_create(babysitter_id=babysitter_id)
+        return stats
+
 
 class BabysitterAvailability(models.Model):
     """Model for babysitter availability schedule"""
@@ -222,11 +459,14 @@ class BabysitterAvailability(models.Model):
     start_time = models.TimeField(help_text=_("Start time for availability"))
     end_time = models.TimeField(help_text=_("End time for availability"))
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = _("Babysitter Availability")
         verbose_name_plural = _("Babysitter Availabilities")
         ordering = ["day_of_week", "start_time"]
+        # Also serves the availability search, whose EXISTS subqueries filter on
+        # babysitter and day_of_week first
         unique_together = ["babysitter", "day_of_week", "start_time", "end_time"]
 
     def __str__(self):
@@ -235,31 +475,26 @@ class BabysitterAvailability(models.Model):
 
     def clean(self):
         from django.core.exceptions import ValidationError
-        
+        from .scheduling import find_overlapping_slot
+
         # Validate start_time < end_time
         if self.start_time >= self.end_time:
             raise ValidationError(_("Start time must be earlier than end time"))
-        
-        # Check for overlapping availability slots
-        if self.pk:
-            # If updating existing slot
-            overlapping = BabysitterAvailability.objects.filter(
-                babysitter=self.babysitter,
-                day_of_week=self.day_of_week
-            ).exclude(pk=self.pk)
-        else:
-            # If creating new slot
-            overlapping = BabysitterAvailability.objects.filter(
-                babysitter=self.babysitter,
-                day_of_week=self.day_of_week
+
+        # Check for overlapping availability slots. New slots can be checked against
+        # the weekly bitmap; updates query the rows since our stored times changed.
+        slot = find_overlapping_slot(
+            self.babysitter_id,
+            self.day_of_week,
+            self.start_time,
+            self.end_time,
+            exclude=None if self._state.adding else self,
+            use_bitmap=self._state.adding,
+        )
+        if slot:
+            raise ValidationError(
+                _(f"This time slot overlaps with existing availability: {slot.start_time}-{slot.end_time}")
             )
-        
-        # Check for time overlap
-        for slot in overlapping:
-            if (self.start_time < slot.end_time and self.end_time > slot.start_time):
-                raise ValidationError(
-                    _(f"This time slot overlaps with existing availability: {slot.start_time}-{slot.end_time}")
-                )
 
     def save(self, *args, **kwargs):
         self.clean()
@@ -288,12 +523,73 @@ class BabysitterStory(models.Model):
         null=True,
         help_text=_("Optional image for the story"),
     )
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = _("Babysitter Story")
         verbose_name_plural = _("Babysitter Stories")
         ordering = ["-created_at"]
+        indexes = [
+            # Parent story feed: stories of a booking, newest first / newer than a cursor
+            models.Index(
+                fields=["booking", "created_at"], name="parent_story_booking_time_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Story by {self.babysitter.email} for Booking {self.booking.id}"
+
+
+class JobQuerySet(models.QuerySet):
+    """Query helpers for the background job queue (see parent.jobs)"""
+
+    def claimable(self, now, queues=None):
+        """Queued jobs that are due, plus running jobs whose lease has expired"""
+        queryset = self.filter(
+            models.Q(status=Job.Status.QUEUED, run_at__lte=now)
+            | models.Q(status=Job.Status.RUNNING, locked_until__lt=now)
+        )
+        if queues:
+            queryset = queryset.filter(queue__in=queues)
+        return queryset
+
+
+class Job(models.Model):
+    """A unit of background work, claimed and run by ``manage.py run_worker``"""
+
+    class Status(models.TextChoices):
+        QUEUED = "QUEUED", _("Queued")
+        RUNNING = "RUNNING", _("Running")
+        FAILED = "FAILED", _("Failed")
+
+    name = models.CharField(max_length=200, help_text=_("Registered job function"))
+    queue = models.CharField(max_length=50, default="default")
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(blank=True, null=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Job")
+        verbose_name_plural = _("Jobs")
+        ordering = ["run_at", "id"]
+        indexes = [
+            # Workers poll for the oldest due job per status
+            models.Index(fields=["status", "run_at"], name="parent_job_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.id} ({self.status})"
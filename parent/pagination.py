@@ -0,0 +1,286 @@
+"""
+Pagination for list endpoints.
+
+Response bodies stay plain JSON lists so existing clients keep working; paging
+information travels in headers instead:
+
+- ``Link``: RFC 8288 ``rel="next"`` / ``rel="prev"`` URLs
+- ``X-Next-Cursor``: opaque cursor for the next page (keyset mode)
+- ``X-Since-Cursor``: cursor of the newest row, for ``?since=`` polling (story feeds)
+- ``X-Total-Count``: total number of rows (page-number mode only)
+"""
+
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .eager_loading import apply_eager_loading
+
+
+def _positive_int(value, default, maximum):
+    """Parse a page size query param, falling back to the default when invalid"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    if value <= 0:
+        return default
+    return min(value, maximum)
+
+
+def _link_header(links):
+    return ", ".join(f'<{url}>; rel="{rel}"' for rel, url in links if url)
+
+
+class PaginationOptOutMixin:
+    """
+    Lets internal callers receive the full, unpaginated list.
+    Either set ``pagination_disabled = True`` on the view (e.g. via ``as_view``)
+    or, as a staff user, pass ``?paginate=false``.
+    """
+
+    disable_query_param = "paginate"
+
+    def is_disabled(self, request, view):
+        if getattr(view, "pagination_disabled", False):
+            return True
+        if request.query_params.get(self.disable_query_param, "").lower() == "false":
+            return bool(getattr(request.user, "is_staff", False))
+        return False
+
+
+class KeysetPagination(PaginationOptOutMixin, BasePagination):
+    """
+    Keyset (cursor) pagination on ``(<ordering field>, id)``.
+
+    The ordering field is taken from the queryset's current ``order_by`` (set by the
+    action or by OrderingFilter), falling back to ``default_ordering``. The primary key
+    is always used as tiebreaker, so pages stay stable while rows are being added and
+    each page costs one bounded, index-friendly query regardless of offset.
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    default_ordering = "-created_at"
+
+    def get_page_size(self, request):
+        return _positive_int(
+            request.query_params.get(self.page_size_query_param),
+            self.page_size,
+            self.max_page_size,
+        )
+
+    def get_ordering(self, queryset):
+        """Return ``(field_name, descending)`` for the primary keyset column"""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering or []
+        ordering = [o for o in ordering if isinstance(o, str)]
+        field = ordering[0] if ordering else self.default_ordering
+        descending = field.startswith("-")
+        field = field.lstrip("-")
+        if field == "pk":
+            field = queryset.model._meta.pk.name
+        try:
+            queryset.model._meta.get_field(field)
+        except FieldDoesNotExist:
+            field = self.default_ordering.lstrip("-")
+            descending = self.default_ordering.startswith("-")
+        return field, descending
+
+    def encode_cursor(self, field, obj):
+        if isinstance(obj, dict):
+            # Rows of a values() queryset (see parent/values_read.py)
+            value, pk = obj[field], obj["pk"]
+        else:
+            value, pk = getattr(obj, field), obj.pk
+        payload = {"f": field, "v": str(value), "pk": str(pk)}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request, queryset, field, param=None):
+        encoded = request.query_params.get(param or self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            if payload["f"] != field:
+                raise ValueError("cursor was issued for a different ordering")
+            opts = queryset.model._meta
+            value = opts.get_field(field).to_python(payload["v"])
+            pk = opts.pk.to_python(payload["pk"])
+        except (ValueError, KeyError, TypeError, ValidationError):
+            raise NotFound("Invalid cursor")
+        return value, pk
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_disabled(request, view):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field, descending = self.get_ordering(queryset)
+        pk_name = queryset.model._meta.pk.name
+
+        cursor = self.decode_cursor(request, queryset, field)
+        if cursor is not None:
+            value, pk = cursor
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": value})
+                | Q(**{field: value, f"{pk_name}__{lookup}": pk})
+            )
+
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{field}", f"{prefix}{pk_name}")
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        self.next_cursor = (
+            self.encode_cursor(field, self.page[-1]) if self.has_next else None
+        )
+        return self.page
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_first_link(self):
+        if self.cursor_query_param not in self.request.query_params:
+            return None
+        url = self.request.build_absolute_uri()
+        return remove_query_param(url, self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        headers = {}
+        link = _link_header(
+            [("next", self.get_next_link()), ("first", self.get_first_link())]
+        )
+        if link:
+            headers["Link"] = link
+        if self.next_cursor:
+            headers["X-Next-Cursor"] = self.next_cursor
+        return Response(data, headers=headers)
+
+    def get_paginated_response_schema(self, schema):
+        return schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from the X-Next-Cursor header of the previous page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Number of results per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class BookingCursorPagination(KeysetPagination):
+    """Keyset pagination for booking feeds, on (start_date, id) unless the view orders otherwise"""
+
+    default_ordering = "-start_date"
+
+
+class StoryCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for story feeds, newest first on (created_at, id).
+
+    The first page carries ``X-Since-Cursor`` (the newest story returned). Polling
+    with ``?since=<that cursor>`` returns only stories posted after it, so clients
+    can refresh a feed without downloading it again.
+    """
+
+    default_ordering = "-created_at"
+    since_query_param = "since"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        field, _ = self.get_ordering(queryset)
+        since = self.decode_cursor(request, queryset, field, self.since_query_param)
+        if since is not None:
+            value, pk = since
+            pk_name = queryset.model._meta.pk.name
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": value}) | Q(**{field: value, f"{pk_name}__gt": pk})
+            )
+        self.since_cursor = request.query_params.get(self.since_query_param)
+
+        page = super().paginate_queryset(queryset, request, view)
+        if page and self.cursor_query_param not in request.query_params:
+            self.since_cursor = self.encode_cursor(field, page[0])
+        return page
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.since_cursor:
+            response["X-Since-Cursor"] = self.since_cursor
+        return response
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.since_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Only stories newer than this X-Since-Cursor value.",
+                "schema": {"type": "string"},
+            }
+        ]
+
+
+class StandardPageNumberPagination(PaginationOptOutMixin, PageNumberPagination):
+    """Page-number pagination for admin screens that need totals and random access"""
+
+    page_size = 25
+    max_page_size = 100
+    page_size_query_param = "page_size"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_disabled(request, view):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        headers = {"X-Total-Count": str(self.page.paginator.count)}
+        link = _link_header(
+            [("next", self.get_next_link()), ("prev", self.get_previous_link())]
+        )
+        if link:
+            headers["Link"] = link
+        return Response(data, headers=headers)
+
+    def get_paginated_response_schema(self, schema):
+        return schema
+
+
+class PaginatedActionMixin:
+    """Helper for custom list actions so they paginate like the default ``list``"""
+
+    def paginated_response(self, queryset, serializer_class=None, **kwargs):
+        serializer_class = serializer_class or self.get_serializer_class()
+        kwargs.setdefault("context", self.get_serializer_context())
+        queryset = apply_eager_loading(queryset, serializer_class, kwargs["context"])
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True, **kwargs)
+            return self.get_paginated_response(serializer.data)
+        serializer = serializer_class(queryset, many=True, **kwargs)
+        return Response(serializer.data)
@@ -0,0 +1,110 @@
+"""
+Response renderers (configured in ``REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]``).
+
+- ``FastJSONRenderer``: ``application/json`` encoded with orjson, which handles
+  UUID, datetime, date and time natively and is several times faster than
+  ``json.dumps`` on large lists. The output matches DRF's ``JSONRenderer``
+  (compact, UTF-8, ``Z`` for UTC, Decimal as float, U+2028/9 escaped), except
+  that floats needing an exponent are written the shortest way (``1.5e-7``, not
+  ``1.5e-07``); the parsed values are equal. Indented output (browsable API,
+  ``; indent=``), data orjson refuses and data holding NaN or infinity (orjson
+  would write ``null``) go through ``JSONRenderer``, as does everything when
+  orjson is not installed.
+- ``MessagePackRenderer`` / ``MessagePackParser``: ``application/msgpack`` for
+  clients that send ``Accept: application/msgpack``. Values are converted like in
+  JSON (UUIDs, dates and Decimals as strings/floats), so both encodings carry the
+  same data. Only enabled when msgpack is installed.
+
+``manage.py benchmark_renderers`` compares them on real serializer output.
+"""
+
+import math
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+# DRF's conversions for everything the fast encoders do not handle themselves
+_default = JSONEncoder().default
+
+
+def _orjson_default(obj):
+    value = _default(obj)
+    if isinstance(value, float) and not math.isfinite(value):
+        # e.g. Decimal("NaN"); let JSONRenderer apply STRICT_JSON
+        raise TypeError("non-finite float")
+    return value
+
+
+def _has_non_finite_float(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer with an orjson fast path"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_orjson_default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        # orjson writes NaN and infinity as null; only then is the data walked
+        if b"null" in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Keep the output a strict JavaScript subset, like JSONRenderer
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default, use_bin_type=True, datetime=False)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
+
@@ -0,0 +1,175 @@
+"""
+Resized image renditions for uploaded pictures.
+
+Every image field listed in ``IMAGE_FIELDS`` gets a JSON sibling
+``<field>_renditions`` holding fixed-size WebP and JPEG versions:
+
+- ``thumb``: 128x128, cropped (avatars)
+- ``card``: 480x360, cropped (listing cards, story thumbnails)
+- ``full``: fits in 1600x1600 (detail views)
+
+Renditions are generated by a background job (see ``parent.jobs``) queued with the
+upload, so the request only pays for storing the original. Decoding uses Pillow's
+draft mode (JPEG DCT scaling) and the output carries no EXIF data. Originals are
+left untouched.
+"""
+
+import io
+import logging
+import posixpath
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+from django.dispatch import Signal
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .jobs import enqueue, job
+
+logger = logging.getLogger(__name__)
+
+# Sent with sender=<model> and instance_pk after a row's renditions were stored
+renditions_updated = Signal()
+
+# (model label, image field) pairs that get renditions
+IMAGE_FIELDS = [
+    ("account.UserProfile", "profile_picture"),
+    ("parent.ParentProfile", "profile_picture"),
+    ("parent.BabysitterStory", "image"),
+]
+
+# name -> (width, height, crop)
+RENDITIONS = {
+    "thumb": (128, 128, True),
+    "card": (480, 360, True),
+    "full": (1600, 1600, False),
+}
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+RENDITION_ROOT = "renditions"
+
+
+def renditions_field(field_name):
+    return f"{field_name}_renditions"
+
+
+def rendition_path(source_name, name, extension):
+    """``profiles/me.jpg`` -> ``renditions/profiles/me/card.webp``"""
+    stem = posixpath.splitext(source_name)[0]
+    return posixpath.join(RENDITION_ROOT, stem, f"{name}.{extension}")
+
+
+def render(source):
+    """
+    Decode ``source`` (a file object) once and return
+    ``{name: (width, height, {extension: bytes})}`` for every rendition.
+    """
+    largest = max(max(width, height) for width, height, _ in RENDITIONS.values())
+    with Image.open(source) as image:
+        # JPEG only: decode at the smallest DCT scale still >= the largest rendition
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGB")
+
+    results = {}
+    for name, (width, height, crop) in RENDITIONS.items():
+        if crop:
+            resized = ImageOps.fit(image, (width, height), Image.LANCZOS)
+        else:
+            resized = image.copy()
+            resized.thumbnail((width, height), Image.LANCZOS)
+        encoded = {}
+        for extension, (pil_format, options) in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, pil_format, **options)
+            encoded[extension] = buffer.getvalue()
+        results[name] = (resized.width, resized.height, encoded)
+    return results
+
+
+def _delete_files(renditions):
+    for name in RENDITIONS:
+        for path in (renditions.get(name) or {}).get("files", {}).values():
+            default_storage.delete(path)
+
+
+@job(queue="images", max_attempts=3)
+def generate_renditions(model_label, pk, field_name):
+    """Build and store the renditions of one row's image; returns the new JSON value"""
+    model = apps.get_model(model_label)
+    json_field = renditions_field(field_name)
+    instance = model.objects.filter(pk=pk).only(field_name, json_field).first()
+    if instance is None:
+        return None
+    image = getattr(instance, field_name)
+    previous = getattr(instance, json_field) or {}
+
+    if not image:
+        renditions = {}
+    else:
+        try:
+            with image.open("rb") as source:
+                rendered = render(source)
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+            logger.warning("Cannot create renditions for %s %s", model_label, pk)
+            return None
+        renditions = {"source": image.name}
+        for name, (width, height, encoded) in rendered.items():
+            files = {}
+            for extension, content in encoded.items():
+                path = rendition_path(image.name, name, extension)
+                default_storage.delete(path)
+                files[extension] = default_storage.save(path, ContentFile(content))
+            renditions[name] = {"width": width, "height": height, "files": files}
+
+    # Only store if the image was not replaced again in the meantime
+    unchanged = (
+        Q(**{field_name: image.name})
+        if image
+        else Q(**{f"{field_name}__isnull": True}) | Q(**{field_name: ""})
+    )
+    fields = {json_field: renditions}
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        # Queryset updates skip auto_now; clients revalidate against updated_at
+        fields["updated_at"] = timezone.now()
+    updated = model.objects.filter(unchanged, pk=pk).update(**fields)
+    if updated:
+        renditions_updated.send(sender=model, instance_pk=pk)
+    if updated and previous.get("source") != renditions.get("source"):
+        _delete_files(previous)
+    return renditions
+
+
+def schedule_renditions(instance, field_name):
+    """Queue rendition generation if the image changed since the last run"""
+    image = getattr(instance, field_name)
+    renditions = getattr(instance, renditions_field(field_name)) or {}
+    if (image.name or None) == renditions.get("source"):
+        return
+    enqueue(generate_renditions, instance._meta.label, str(instance.pk), field_name)
+
+
+def rendition_urls(instance, field_name, request=None):
+    """
+    ``{name: {"width", "height", "webp", "jpeg"}}`` with absolute URLs, or None while
+    the renditions for the current image are not ready.
+    """
+    image = getattr(instance, field_name)
+    renditions = getattr(instance, renditions_field(field_name)) or {}
+    if not image or renditions.get("source") != image.name:
+        return None
+    urls = {}
+    for name in RENDITIONS:
+        rendition = renditions.get(name)
+        if not rendition:
+            return None
+        entry = {"width": rendition["width"], "height": rendition["height"]}
+        for extension, path in rendition["files"].items():
+            url = default_storage.url(path)
+            entry[extension] = request.build_absolute_uri(url) if request else url
+        urls[name] = entry
+    return urls
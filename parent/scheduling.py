@@ -0,0 +1,284 @@
+"""
+Interval helpers for babysitter calendars.
+
+Weekly BabysitterAvailability rows are a template: (day_of_week, start_time, end_time)
+in the project's local time zone. These helpers expand that template over a date
+range and subtract bookings with a sweep over sorted intervals.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from account.models import UserProfile
+from .availability_bitmap import (
+    build_bitmap,
+    covers,
+    is_aligned,
+    overlaps,
+    slot_mask,
+    unpack_bitmap,
+)
+from .models import BabysitterAvailability, BabysitterRequest
+
+
+def merge_intervals(intervals):
+    """Merge overlapping or touching (start, end) intervals; returns a sorted list"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def intervals_cover(intervals, start, end):
+    """True if the union of ``intervals`` (touching ones joined) contains [start, end)"""
+    return any(
+        low <= start and high >= end for low, high in merge_intervals(intervals)
+    )
+
+
+def subtract_intervals(free, busy):
+    """
+    Remove ``busy`` intervals from ``free`` intervals.
+    Both inputs are merged first; the result is sorted and non-overlapping.
+    """
+    free = merge_intervals(free)
+    busy = merge_intervals(busy)
+    result = []
+    i = 0
+    for start, end in free:
+        # Skip busy intervals that end before this free window starts
+        while i < len(busy) and busy[i][1] <= start:
+            i += 1
+        cursor = start
+        j = i
+        while j < len(busy) and busy[j][0] < end:
+            busy_start, busy_end = busy[j]
+            if busy_start > cursor:
+                result.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            if cursor >= end:
+                break
+            j += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+def expand_weekly_slots(slots, from_date, to_date, tz=None):
+    """
+    Turn weekly (day_of_week, start_time, end_time) tuples into aware datetime
+    intervals for every date in [from_date, to_date].
+    """
+    tz = tz or timezone.get_current_timezone()
+    by_day = {}
+    for day_of_week, start_time, end_time in slots:
+        by_day.setdefault(day_of_week, []).append((start_time, end_time))
+
+    intervals = []
+    day = from_date
+    while day <= to_date:
+        for start_time, end_time in by_day.get(day.weekday(), ()):
+            intervals.append(
+                (
+                    timezone.make_aware(datetime.combine(day, start_time), tz),
+                    timezone.make_aware(datetime.combine(day, end_time), tz),
+                )
+            )
+        day += timedelta(days=1)
+    return intervals
+
+
+def compute_free_slots(babysitter, from_date, to_date, min_duration=None, now=None):
+    """
+    Bookable windows for ``babysitter`` between ``from_date`` and ``to_date``
+    (inclusive dates): weekly availability minus ACCEPTED/COMPLETED bookings,
+    starting no earlier than ``now``.
+
+    Runs two queries regardless of the size of the range.
+    """
+    tz = timezone.get_current_timezone()
+    now = now or timezone.now()
+    range_start = timezone.make_aware(datetime.combine(from_date, datetime.min.time()), tz)
+    range_end = timezone.make_aware(
+        datetime.combine(to_date + timedelta(days=1), datetime.min.time()), tz
+    )
+
+    slots = BabysitterAvailability.objects.filter(babysitter=babysitter).values_list(
+        "day_of_week", "start_time", "end_time"
+    )
+    available = expand_weekly_slots(slots, from_date, to_date, tz)
+
+    busy = (
+        BabysitterRequest.objects.blocking()
+        .filter(babysitter=babysitter)
+        .overlapping(range_start, range_end)
+        .values_list("start_date", "end_date")
+    )
+    # Time that has already passed cannot be booked
+    busy = list(busy) + [(range_start, max(now, range_start))]
+
+    free = subtract_intervals(available, busy)
+    if min_duration:
+        free = [(start, end) for start, end in free if end - start >= min_duration]
+    return free
+
+
+def filter_available(queryset, start, end):
+    """
+    Narrow a babysitter (User) queryset to those whose weekly availability covers
+    [start, end) and who have no overlapping accepted/completed booking.
+
+    As with the bitmap, touching slots count as one window (9-12 + 12-15 covers
+    11-13): the start must fall in a slot, and every slot ending inside the window
+    must be continued by a slot containing its end. All checks are correlated
+    EXISTS subqueries, so filtering happens in SQL.
+    """
+    local_start = timezone.localtime(start)
+    local_end = timezone.localtime(end)
+    start_time, end_time = local_start.time(), local_end.time()
+    day_slots = BabysitterAvailability.objects.filter(
+        babysitter=OuterRef("pk"), day_of_week=local_start.weekday()
+    )
+    starting_slot = day_slots.filter(start_time__lte=start_time, end_time__gt=start_time)
+    continuation = BabysitterAvailability.objects.filter(
+        babysitter=OuterRef("babysitter"),
+        day_of_week=OuterRef("day_of_week"),
+        start_time__lte=OuterRef("end_time"),
+        end_time__gt=OuterRef("end_time"),
+    )
+    gap = day_slots.filter(end_time__gt=start_time, end_time__lt=end_time).exclude(
+        Exists(continuation)
+    )
+    clashing_booking = (
+        BabysitterRequest.objects.blocking()
+        .filter(babysitter=OuterRef("pk"))
+        .overlapping(start, end)
+    )
+    return (
+        queryset.filter(Exists(starting_slot))
+        .exclude(Exists(gap))
+        .exclude(Exists(clashing_booking))
+    )
+
+
+# Babysitters whose bitmap rebuild is postponed until a bulk edit finishes
+_deferred_bitmap_rebuilds = ContextVar("deferred_bitmap_rebuilds", default=frozenset())
+
+
+@contextmanager
+def defer_bitmap_rebuild(*babysitter_ids):
+    """Skip per-row bitmap rebuilds inside the block and rebuild each once on exit"""
+    token = _deferred_bitmap_rebuilds.set(
+        _deferred_bitmap_rebuilds.get() | set(babysitter_ids)
+    )
+    try:
+        yield
+    finally:
+        _deferred_bitmap_rebuilds.reset(token)
+    for babysitter_id in babysitter_ids:
+        rebuild_availability_bitmap(babysitter_id)
+
+
+def bitmap_rebuild_deferred(babysitter_id):
+    return babysitter_id in _deferred_bitmap_rebuilds.get()
+
+
+def get_availability_bitmap(babysitter_id):
+    """The babysitter's packed weekly availability as an int, or None if not exact"""
+    raw = (
+        UserProfile.objects.filter(user_id=babysitter_id)
+        .values_list("availability_bitmap", flat=True)
+        .first()
+    )
+    return unpack_bitmap(raw)
+
+
+def rebuild_availability_bitmap(babysitter_id):
+    """Recompute and store the bitmap from the babysitter's BabysitterAvailability rows"""
+    slots = list(
+        BabysitterAvailability.objects.filter(babysitter_id=babysitter_id).values_list(
+            "day_of_week", "start_time", "end_time"
+        )
+    )
+    bitmap = build_bitmap(slots)
+    updated = UserProfile.objects.filter(user_id=babysitter_id).update(
+        availability_bitmap=bitmap
+    )
+    if not updated and slots:
+        UserProfile.objects.create(user_id=babysitter_id, availability_bitmap=bitmap)
+    return bitmap
+
+
+def covers_window(babysitter_id, day_of_week, start_time, end_time):
+    """
+    True if the babysitter's weekly availability covers [start_time, end_time) on the
+    day. Touching slots count as one window, on both the bitmap and the row path.
+    """
+    if is_aligned(start_time) and is_aligned(end_time):
+        bitmap = get_availability_bitmap(babysitter_id)
+        if bitmap is not None:
+            return covers(bitmap, slot_mask(day_of_week, start_time, end_time))
+    slots = BabysitterAvailability.objects.filter(
+        babysitter_id=babysitter_id, day_of_week=day_of_week
+    ).values_list("start_time", "end_time")
+    return intervals_cover(slots, start_time, end_time)
+
+
+def find_overlapping_slot(
+    babysitter_id, day_of_week, start_time, end_time, exclude=None, use_bitmap=True
+):
+    """
+    Return an existing availability slot overlapping the given one, or None.
+
+    ``exclude`` is the slot being updated; its stored times are cleared from the
+    bitmap before checking. When the bitmap says there is no overlap no rows are
+    read; otherwise the overlapping slot is fetched for the error message.
+    """
+    if use_bitmap and is_aligned(start_time) and is_aligned(end_time):
+        bitmap = get_availability_bitmap(babysitter_id)
+        if bitmap is not None:
+            if exclude is not None:
+                bitmap &= ~slot_mask(
+                    exclude.day_of_week, exclude.start_time, exclude.end_time
+                )
+            if not overlaps(bitmap, slot_mask(day_of_week, start_time, end_time)):
+                return None
+
+    queryset = BabysitterAvailability.objects.filter(
+        babysitter_id=babysitter_id,
+        day_of_week=day_of_week,
+        start_time__lt=end_time,
+        end_time__gt=start_time,
+    )
+    if exclude is not None:
+        queryset = queryset.exclude(pk=exclude.pk)
+    return queryset.order_by("start_time").first()
+
+
+def find_overlaps_in_schedule(slots):
+    """
+    Sort-and-scan overlap check for a full weekly schedule held in memory.
+    ``slots`` are dicts with day_of_week/start_time/end_time; returns a list of
+    (earlier, later) pairs that overlap.
+    """
+    ordered = sorted(slots, key=lambda s: (s["day_of_week"], s["start_time"]))
+    clashes = []
+    # The slot reaching furthest into the day so far
+    reach = None
+    for current in ordered:
+        if reach is not None and reach["day_of_week"] == current["day_of_week"]:
+            if current["start_time"] < reach["end_time"]:
+                clashes.append((reach, current))
+            if current["end_time"] > reach["end_time"]:
+                reach = current
+        else:
+            reach = current
+    return clashes
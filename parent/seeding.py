@@ -0,0 +1,361 @@
+"""
+Synthetic data generator for load tests and benchmarks.
+
+Everything is derived from a single ``random.Random(seed)``: ids, names, schedules,
+booking times and statuses. The same seed, volumes and anchor date always produce
+the same rows, so query plans and benchmark numbers can be compared across runs.
+Only ``created_at``/``updated_at`` (auto_now fields) differ between runs.
+
+Rows are written with ``bulk_create`` in batches, one transaction per batch, and
+model signals do not fire; BabysitterStats and availability bitmaps are built
+here instead.
+"""
+
+import random
+import uuid
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from account.models import User, UserProfile
+from .availability_bitmap import build_bitmap
+from .card_cache import bump_card_version
+from .models import (
+    BabysitterAvailability,
+    BabysitterRequest,
+    BabysitterReview,
+    BabysitterStats,
+    BabysitterStory,
+    BookingLock,
+    BookingSeries,
+    ChildProfile,
+    ParentProfile,
+)
+from .scheduling import defer_bitmap_rebuild
+from .stats import rebuild_babysitter_stats
+
+SEED_PASSWORD = "loadtest-pass-123"
+
+FIRST_NAMES = [
+    "Aarav", "Anita", "Bikash", "Binita", "Deepak", "Gita", "Hari", "Kabita",
+    "Kiran", "Laxmi", "Manish", "Maya", "Nabin", "Nisha", "Prakash", "Priya",
+    "Rajesh", "Rita", "Sagar", "Sita", "Suman", "Sunita", "Ujjwal", "Yamuna",
+]
+LAST_NAMES = [
+    "Adhikari", "Bhattarai", "Gurung", "Karki", "Khadka", "Lama", "Magar",
+    "Pandey", "Rai", "Sharma", "Shrestha", "Tamang", "Thapa", "Yadav",
+]
+CITIES = ["Kathmandu", "Lalitpur", "Bhaktapur", "Pokhara", "Biratnagar", "Chitwan"]
+STORY_LINES = [
+    "Finished lunch, all vegetables eaten!",
+    "Playing with blocks in the living room.",
+    "Nap time started.",
+    "Out for a short walk in the park.",
+    "Homework done, now drawing.",
+]
+REVIEW_LINES = ["Great with the kids.", "Very punctual.", "Would book again.", ""]
+
+# (weight, first hour, last hour) of the blocks a babysitter typically offers
+DAY_BLOCKS = [(3, 7, 12), (4, 13, 19), (2, 17, 22), (2, 8, 18)]
+PAST_STATUSES = [("COMPLETED", 75), ("CANCELLED", 15), ("REJECTED", 10)]
+FUTURE_STATUSES = [("PENDING", 40), ("ACCEPTED", 45), ("CANCELLED", 10), ("REJECTED", 5)]
+
+
+def _uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _pick(rng, weighted):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights)[0]
+
+
+# Insert order inside a batch, so foreign keys always point at earlier rows
+WRITE_ORDER = [
+    User,
+    UserProfile,
+    ParentProfile,
+    ChildProfile,
+    BabysitterAvailability,
+    BabysitterRequest,
+    BabysitterReview,
+    BabysitterStory,
+]
+
+
+class _BatchWriter:
+    """Buffers model instances per model and bulk inserts them in one transaction"""
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.pending = {model: [] for model in WRITE_ORDER}
+        self.size = 0
+        self.written = {}
+
+    def add(self, instance):
+        self.pending[type(instance)].append(instance)
+        self.size += 1
+        if self.size >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.size:
+            return
+        with transaction.atomic():
+            for model, rows in self.pending.items():
+                if rows:
+                    model.objects.bulk_create(rows, batch_size=self.batch_size)
+                    name = model._meta.model_name
+                    self.written[name] = self.written.get(name, 0) + len(rows)
+        self.pending = {model: [] for model in WRITE_ORDER}
+        self.size = 0
+
+
+def weekly_schedule(rng):
+    """3-6 working days with one or two non-overlapping blocks on half-hour boundaries"""
+    schedule = []
+    for day in sorted(rng.sample(range(7), rng.randint(3, 6))):
+        first = _pick(rng, [((start, end), weight) for weight, start, end in DAY_BLOCKS])
+        blocks = [first]
+        if first[1] <= 12 and rng.random() < 0.4:
+            blocks.append((first[1] + 2, min(first[1] + 2 + rng.randint(3, 6), 22)))
+        for start_hour, end_hour in blocks:
+            start = time(start_hour, rng.choice((0, 30)))
+            end = time(end_hour, 0)
+            if start < end:
+                schedule.append((day, start, end))
+    return schedule
+
+
+def _bookable_blocks(schedule, anchor, future_days, needed, tz):
+    """
+    Availability blocks as aware datetimes, walking back from ``anchor + future_days``
+    until at least ``needed`` blocks are collected.
+    """
+    by_day = {}
+    for day_of_week, start, end in schedule:
+        by_day.setdefault(day_of_week, []).append((start, end))
+    blocks = []
+    day = anchor + timedelta(days=future_days)
+    while len(blocks) < needed:
+        for start, end in by_day.get(day.weekday(), ()):
+            blocks.append(
+                (
+                    timezone.make_aware(datetime.combine(day, start), tz),
+                    timezone.make_aware(datetime.combine(day, end), tz),
+                )
+            )
+        day -= timedelta(days=1)
+    return blocks
+
+
+def seed_load(
+    parents=700,
+    babysitters=300,
+    bookings=20000,
+    seed=0,
+    prefix="load",
+    anchor=None,
+    future_days=60,
+    batch_size=5000,
+    log=None,
+):
+    """
+    Generate a synthetic data set and return the number of rows written per model.
+
+    Bookings are spread evenly over the babysitters, one per availability block, so
+    ACCEPTED/COMPLETED bookings never overlap. Bookings before ``anchor`` are mostly
+    COMPLETED (with reviews), later ones mostly PENDING/ACCEPTED.
+    """
+    rng = random.Random(seed)
+    tz = timezone.get_current_timezone()
+    anchor = anchor or timezone.localdate()
+    now = timezone.make_aware(datetime.combine(anchor, time(12, 0)), tz)
+    password = make_password(SEED_PASSWORD, salt=f"{prefix}{seed}")
+    log = log or (lambda message: None)
+    writer = _BatchWriter(batch_size)
+
+    def add_user(role, index):
+        first_name = rng.choice(FIRST_NAMES)
+        user = User(
+            id=_uuid(rng),
+            email=f"{prefix}-{role.lower()}-{index}@example.com",
+            first_name=first_name,
+            last_name=rng.choice(LAST_NAMES),
+            phone_number=f"98{rng.randrange(10**8):08d}",
+            role=role,
+            password=password,
+        )
+        writer.add(user)
+        return user
+
+    # Parents and their children
+    families = []
+    for index in range(parents):
+        user = add_user("PARENT", index)
+        city = rng.choice(CITIES)
+        writer.add(UserProfile(user=user, address=city))
+        parent = ParentProfile(id=_uuid(rng), user=user, city=city)
+        writer.add(parent)
+        children = []
+        for _ in range(rng.choices((1, 2, 3), (5, 4, 1))[0]):
+            child = ChildProfile(
+                id=_uuid(rng),
+                parent=parent,
+                name=rng.choice(FIRST_NAMES),
+                date_of_birth=anchor - timedelta(days=rng.randint(180, 12 * 365)),
+                gender=rng.choice("MF"),
+            )
+            writer.add(child)
+            children.append(child.id)
+        families.append((parent.id, children))
+    log(f"Generated {parents} parents")
+
+    # Babysitters with weekly availability (and the matching bitmap)
+    sitters = []
+    for index in range(babysitters):
+        user = add_user("BABYSITTER", index)
+        schedule = weekly_schedule(rng)
+        writer.add(
+            UserProfile(
+                user=user,
+                address=rng.choice(CITIES),
+                bio=f"{rng.randint(1, 10)} years of childcare experience.",
+                availability_bitmap=build_bitmap(schedule),
+            )
+        )
+        for day_of_week, start, end in schedule:
+            writer.add(
+                BabysitterAvailability(
+                    id=_uuid(rng),
+                    babysitter=user,
+                    day_of_week=day_of_week,
+                    start_time=start,
+                    end_time=end,
+                )
+            )
+        sitters.append((user.id, schedule, Decimal(rng.randrange(10, 31))))
+    log(f"Generated {babysitters} babysitters")
+
+    # Bookings, reviews and stories, babysitter by babysitter
+    per_sitter, extra = divmod(bookings, babysitters) if babysitters else (0, 0)
+    for position, (sitter_id, schedule, rate) in enumerate(sitters):
+        count = per_sitter + (1 if position < extra else 0)
+        if not count or not schedule:
+            continue
+        blocks = _bookable_blocks(schedule, anchor, future_days, count * 3 // 2, tz)
+        for block_start, block_end in sorted(rng.sample(blocks, count)):
+            block_hours = int((block_end - block_start).total_seconds() // 3600)
+            hours = rng.randint(2, max(2, min(5, block_hours)))
+            start = block_start + timedelta(
+                minutes=30 * rng.randint(0, max(0, (block_hours - hours) * 2))
+            )
+            end = min(start + timedelta(hours=hours), block_end)
+            status = _pick(rng, PAST_STATUSES if end <= now else FUTURE_STATUSES)
+            parent_id, children = rng.choice(families)
+            booking = BabysitterRequest(
+                id=_uuid(rng),
+                parent_id=parent_id,
+                child_id=rng.choice(children),
+                babysitter_id=sitter_id,
+                status=status,
+                start_date=start,
+                end_date=end,
+                hourly_rate=rate,
+            )
+            minutes = int((end - start).total_seconds() // 60)
+            booking.total_cost = (rate * minutes / 60).quantize(Decimal("0.01"))
+            writer.add(booking)
+
+            if status == "COMPLETED" and rng.random() < 0.6:
+                writer.add(
+                    BabysitterReview(
+                        id=_uuid(rng),
+                        booking=booking,
+                        parent_id=parent_id,
+                        babysitter_id=sitter_id,
+                        rating=rng.choices((1, 2, 3, 4, 5), (1, 1, 3, 8, 10))[0],
+                        comment=rng.choice(REVIEW_LINES),
+                    )
+                )
+            if status in ("ACCEPTED", "COMPLETED") and rng.random() < 0.2:
+                for _ in range(rng.randint(1, 3)):
+                    writer.add(
+                        BabysitterStory(
+                            id=_uuid(rng),
+                            booking=booking,
+                            babysitter_id=sitter_id,
+                            content=rng.choice(STORY_LINES),
+                        )
+                    )
+        if (position + 1) % 100 == 0:
+            log(f"Generated bookings for {position + 1}/{babysitters} babysitters")
+    writer.flush()
+
+    # Signals did not fire for bulk inserts
+    sitter_ids = [sitter_id for sitter_id, _, _ in sitters]
+    for offset in range(0, len(sitter_ids), batch_size):
+        rebuild_babysitter_stats(sitter_ids[offset : offset + batch_size])
+    return writer.written
+
+
+def flush_seeded(prefix="load", batch_size=1000):
+    """
+    Delete every user created by seed_load with ``prefix`` and all their rows.
+
+    Users are handled ``batch_size`` at a time. Each batch deletes stats, stories,
+    reviews, bookings, series, availability, children and profiles from the leaves
+    up with ``QuerySet.delete()``, so the delete signals fire. The seeded
+    babysitters' stats rows go first, which leaves nothing for the per-review stats
+    receiver to update, and their bitmaps are rebuilt once per babysitter rather
+    than once per slot. Babysitters outside the batch that lost reviews get their
+    stats rebuilt and their cards invalidated.
+    """
+    users = User.objects.filter(email__startswith=f"{prefix}-")
+    deleted = 0
+    while True:
+        user_ids = list(users.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not user_ids:
+            return deleted
+        with transaction.atomic():
+            deleted += _delete_user_rows(user_ids)
+            deleted += users.filter(pk__in=user_ids).delete()[0]
+
+
+def _delete_user_rows(user_ids):
+    parent_ids = list(
+        ParentProfile.objects.filter(user_id__in=user_ids).values_list("pk", flat=True)
+    )
+    # Other babysitters lose these parents' reviews
+    reviewed = list(
+        BabysitterReview.objects.filter(parent_id__in=parent_ids)
+        .exclude(babysitter_id__in=user_ids)
+        .values_list("babysitter_id", flat=True)
+        .distinct()
+    )
+    leaves_up = [
+        BabysitterStats.objects.filter(babysitter_id__in=user_ids),
+        BabysitterStory.objects.filter(
+            Q(booking__parent_id__in=parent_ids) | Q(babysitter_id__in=user_ids)
+        ),
+        BabysitterReview.objects.filter(
+            Q(parent_id__in=parent_ids) | Q(babysitter_id__in=user_ids)
+        ),
+        BabysitterRequest.objects.filter(parent_id__in=parent_ids),
+        BookingSeries.objects.filter(parent_id__in=parent_ids),
+        BabysitterAvailability.objects.filter(babysitter_id__in=user_ids),
+        BookingLock.objects.filter(babysitter_id__in=user_ids),
+        ChildProfile.objects.filter(parent_id__in=parent_ids),
+        ParentProfile.objects.filter(pk__in=parent_ids),
+        UserProfile.objects.filter(user_id__in=user_ids),
+    ]
+    with defer_bitmap_rebuild(*user_ids):
+        deleted = sum(queryset.delete()[0] for queryset in leaves_up)
+    if reviewed:
+        rebuild_babysitter_stats(reviewed)
+    bump_card_version(*user_ids)
+    return deleted
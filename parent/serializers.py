@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from .models import (
     ParentProfile,
@@ -6,9 +8,30 @@ from .models import (
     BabysitterRequest,
     BabysitterReview,
     BabysitterAvailability,
+    BabysitterStats,
     BabysitterStory,
+    BookingSeries,
 )
 from account.models import User, UserProfile
+from .bookings import MAX_BULK_DECISIONS
+from .card_cache import CachedCardListSerializer
+from .sparse_fields import SparseFieldsMixin
+from .renditions import rendition_urls
+from .series import MAX_OCCURRENCES, create_series, expand_dates
+from .scheduling import (
+    covers_window,
+    defer_bitmap_rebuild,
+    find_overlapping_slot,
+    find_overlaps_in_schedule,
+)
+
+
+def get_babysitter_stats(user):
+    """Return the user's BabysitterStats row, or None if no review was ever recorded"""
+    try:
+        return user.babysitter_stats
+    except BabysitterStats.DoesNotExist:
+        return None
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -21,7 +44,13 @@ class UserSerializer(serializers.ModelSerializer):
 
 
 class BabysitterListSerializer(serializers.ModelSerializer):
-    """Serializer for babysitter listings"""
+    """
+    Serializer for babysitter listings. With ``many=True`` the rows are served from
+    the per-babysitter card cache (see parent/card_cache.py).
+    """
+
+    # Timestamps whose maximum changes with the output (see parent/conditional.py)
+    validator_fields = ("updated_at", "profile__updated_at", "babysitter_stats__updated_at")
 
     profile = serializers.SerializerMethodField()
     average_rating = serializers.SerializerMethodField()
@@ -29,6 +58,7 @@ class BabysitterListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
+        list_serializer_class = CachedCardListSerializer
         fields = [
             "id",
             "email",
@@ -53,6 +83,9 @@ class BabysitterListSerializer(serializers.ModelSerializer):
             )
             return {
                 "profile_picture": profile_picture,
+                "profile_picture_renditions": rendition_urls(
+                    profile, "profile_picture", request
+                ),
                 "bio": profile.bio,
                 "address": profile.address,
             }
@@ -60,24 +93,37 @@ class BabysitterListSerializer(serializers.ModelSerializer):
             return None
 
     def get_average_rating(self, obj):
-        """Calculate average rating from reviews"""
-        reviews = obj.reviews_received.all()
-        if reviews.exists():
-            total = sum(r.rating for r in reviews)
-            return round(total / reviews.count(), 2)
+        """Average rating from the denormalized BabysitterStats row"""
+        stats = get_babysitter_stats(obj)
+        if stats and stats.total_reviews:
+            return float(stats.average_rating)
         return 0
 
     def get_total_reviews(self, obj):
         """Get total number of reviews"""
-        return obj.reviews_received.count()
+        stats = get_babysitter_stats(obj)
+        return stats.total_reviews if stats else 0
 
 
-class BabysitterDetailSerializer(serializers.ModelSerializer):
+class BabysitterDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer for babysitter profile"""
 
+    # The recent reviews cost their own query; ?expand= without them skips it
+    expandable_fields = {"reviews": None}
+
+    validator_fields = (
+        "updated_at",
+        "profile__updated_at",
+        "babysitter_stats__updated_at",
+        "reviews_received__updated_at",
+        "reviews_received__parent__user__updated_at",
+    )
+
     profile = serializers.SerializerMethodField()
     average_rating = serializers.SerializerMethodField()
     total_reviews = serializers.SerializerMethodField()
+    rating_histogram = serializers.SerializerMethodField()
+    last_review_at = serializers.SerializerMethodField()
     reviews = serializers.SerializerMethodField()
 
     class Meta:
@@ -91,6 +137,8 @@ class BabysitterDetailSerializer(serializers.ModelSerializer):
             "profile",
             "average_rating",
             "total_reviews",
+            "rating_histogram",
+            "last_review_at",
             "reviews",
         ]
         read_only_fields = fields
@@ -107,6 +155,9 @@ class BabysitterDetailSerializer(serializers.ModelSerializer):
             )
             return {
                 "profile_picture": profile_picture,
+                "profile_picture_renditions": rendition_urls(
+                    profile, "profile_picture", request
+                ),
                 "bio": profile.bio,
                 "address": profile.address,
             }
@@ -114,20 +165,32 @@ class BabysitterDetailSerializer(serializers.ModelSerializer):
             return None
 
     def get_average_rating(self, obj):
-        """Calculate average rating from reviews"""
-        reviews = obj.reviews_received.all()
-        if reviews.exists():
-            total = sum(r.rating for r in reviews)
-            return round(total / reviews.count(), 2)
+        """Average rating from the denormalized BabysitterStats row"""
+        stats = get_babysitter_stats(obj)
+        if stats and stats.total_reviews:
+            return float(stats.average_rating)
         return 0
 
     def get_total_reviews(self, obj):
         """Get total number of reviews"""
-        return obj.reviews_received.count()
+        stats = get_babysitter_stats(obj)
+        return stats.total_reviews if stats else 0
+
+    def get_rating_histogram(self, obj):
+        """Number of reviews per star rating"""
+        stats = get_babysitter_stats(obj)
+        if not stats:
+            return {str(rating): 0 for rating in range(1, 6)}
+        return {str(rating): count for rating, count in stats.histogram.items()}
+
+    def get_last_review_at(self, obj):
+        """Timestamp of the most recent review"""
+        stats = get_babysitter_stats(obj)
+        return stats.last_review_at if stats else None
 
     def get_reviews(self, obj):
         """Get recent reviews (limit 10)"""
-        reviews = obj.reviews_received.all()[:10]
+        reviews = obj.reviews_received.select_related("parent__user")[:10]
         return [
             {
                 "rating": r.rating,
@@ -139,11 +202,17 @@ class BabysitterDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class ParentProfileSerializer(serializers.ModelSerializer):
+class ParentProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for parent profile management"""
 
+    expandable_fields = {"user": "pk"}
+    field_lookups = {"user": ("user",)}
+
+    validator_fields = ("updated_at", "user__updated_at")
+
     user = UserSerializer(read_only=True)
     profile_picture = serializers.ImageField(required=False, allow_null=True)
+    profile_picture_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = ParentProfile
@@ -156,6 +225,7 @@ class ParentProfileSerializer(serializers.ModelSerializer):
             "state",
             "zip_code",
             "profile_picture",
+            "profile_picture_renditions",
             "verified",
             "average_rating",
             "total_ratings",
@@ -165,6 +235,7 @@ class ParentProfileSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "id",
             "user",
+            "profile_picture_renditions",
             "verified",
             "average_rating",
             "total_ratings",
@@ -172,6 +243,9 @@ class ParentProfileSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def get_profile_picture_renditions(self, obj):
+        return rendition_urls(obj, "profile_picture", self.context.get("request"))
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         profile_picture = data.get("profile_picture")
@@ -185,6 +259,8 @@ class ParentProfileSerializer(serializers.ModelSerializer):
 class ChildProfileSerializer(serializers.ModelSerializer):
     """Serializer for child profile management"""
 
+    validator_fields = ("updated_at", "parent__user__updated_at")
+
     parent_email = serializers.CharField(source="parent.user.email", read_only=True)
 
     class Meta:
@@ -206,9 +282,14 @@ class ChildProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "parent", "parent_email", "created_at", "updated_at"]
 
 
-class ChildProfileDetailSerializer(serializers.ModelSerializer):
+class ChildProfileDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer for child profile"""
 
+    expandable_fields = {"parent": "pk"}
+    field_lookups = {"parent": ("parent",)}
+
+    validator_fields = ("updated_at", "parent__updated_at", "parent__user__updated_at")
+
     parent = ParentProfileSerializer(read_only=True)
 
     class Meta:
@@ -229,9 +310,24 @@ class ChildProfileDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "parent", "created_at", "updated_at"]
 
 
-class BabysitterRequestSerializer(serializers.ModelSerializer):
+class BabysitterRequestSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for babysitter requests/bookings"""
 
+    # babysitter_info repeats the ``babysitter`` id with contact details
+    expandable_fields = {"babysitter_info": None}
+    field_lookups = {
+        "parent_email": ("parent__user",),
+        "child_name": ("child",),
+        "babysitter_info": ("babysitter",),
+    }
+
+    validator_fields = (
+        "updated_at",
+        "parent__user__updated_at",
+        "child__updated_at",
+        "babysitter__updated_at",
+    )
+
     parent_email = serializers.CharField(source="parent.user.email", read_only=True)
     babysitter_info = UserSerializer(source="babysitter", read_only=True)
     child_name = serializers.CharField(source="child.name", read_only=True)
@@ -295,21 +391,11 @@ class BabysitterRequestSerializer(serializers.ModelSerializer):
                 "Bookings cannot span multiple days. Please create separate bookings for each day."
             )
 
-        # Find matching availability slots
-        availability_slots = BabysitterAvailability.objects.filter(
-            babysitter=babysitter, day_of_week=day_of_week
+        # Check the weekly availability covers the entire booking time
+        is_available = covers_window(
+            babysitter.pk, day_of_week, booking_start_time, booking_end_time
         )
 
-        # Check if any availability slot covers the entire booking time
-        is_available = False
-        for slot in availability_slots:
-            if (
-                booking_start_time >= slot.start_time
-                and booking_end_time <= slot.end_time
-            ):
-                is_available = True
-                break
-
         if not is_available:
             day_name = [
                 "Monday",
@@ -327,23 +413,20 @@ class BabysitterRequestSerializer(serializers.ModelSerializer):
 
         # Check for booking conflicts with existing accepted/completed bookings
         # Only check against ACCEPTED and COMPLETED bookings (not PENDING)
-        conflicting_bookings = BabysitterRequest.objects.filter(
-            babysitter=babysitter, status__in=["ACCEPTED", "COMPLETED"]
-        ).exclude(
+        booking = BabysitterRequest.objects.find_conflict(
+            babysitter,
+            start_date,
+            end_date,
             # Exclude current instance if updating
-            id=self.instance.id if self.instance else None
+            exclude_id=self.instance.id if self.instance else None,
         )
-
-        for booking in conflicting_bookings:
-            # Check if the new booking overlaps with existing ones
-            # Overlap logic: existing_start < new_end AND existing_end > new_start
-            if start_date < booking.end_date and end_date > booking.start_date:
-                raise serializers.ValidationError(
-                    f"Babysitter already has a booking during this time "
-                    f"({booking.start_date.strftime('%Y-%m-%d %H:%M')} to "
-                    f"{booking.end_date.strftime('%Y-%m-%d %H:%M')}). "
-                    f"Please choose a different time."
-                )
+        if booking:
+            raise serializers.ValidationError(
+                f"Babysitter already has a booking during this time "
+                f"({booking.start_date.strftime('%Y-%m-%d %H:%M')} to "
+                f"{booking.end_date.strftime('%Y-%m-%d %H:%M')}). "
+                f"Please choose a different time."
+            )
 
         return data
 
@@ -370,9 +453,31 @@ class BabysitterRequestSerializer(serializers.ModelSerializer):
         return request_obj
 
 
-class BabysitterRequestDetailSerializer(serializers.ModelSerializer):
+class BabysitterRequestDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Detailed serializer for babysitter requests"""
 
+    expandable_fields = {
+        "parent": "pk",
+        "child": "pk",
+        "babysitter_info": "pk",
+        "review": None,
+    }
+    field_lookups = {
+        "parent": ("parent",),
+        "child": ("child",),
+        "babysitter_info": ("babysitter",),
+        "review": ("review__parent__user", "review__babysitter"),
+    }
+
+    validator_fields = (
+        "updated_at",
+        "parent__updated_at",
+        "parent__user__updated_at",
+        "child__updated_at",
+        "babysitter__updated_at",
+        "review__updated_at",
+    )
+
     parent = ParentProfileSerializer(read_only=True)
     babysitter_info = UserSerializer(source="babysitter", read_only=True)
     child = ChildProfileDetailSerializer(read_only=True)
@@ -406,16 +511,155 @@ class BabysitterRequestDetailSerializer(serializers.ModelSerializer):
             return None
 
 
+class SeriesOccurrenceSerializer(serializers.ModelSerializer):
+    """Compact booking row nested in a series"""
+
+    class Meta:
+        model = BabysitterRequest
+        fields = ["id", "status", "start_date", "end_date"]
+        read_only_fields = fields
+
+
+class BookingSeriesSerializer(serializers.ModelSerializer):
+    """Recurring booking series: a weekly rule expanded into individual requests"""
+
+    validator_fields = ("created_at", "occurrences__updated_at")
+
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6),
+        min_length=1,
+        max_length=7,
+    )
+    exceptions = serializers.ListField(
+        child=serializers.DateField(), required=False, default=list
+    )
+    interval = serializers.IntegerField(min_value=1, max_value=52, default=1)
+    hourly_rate = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    skip_conflicts = serializers.BooleanField(
+        write_only=True,
+        default=True,
+        help_text="Book the free occurrences when some conflict (otherwise book none)",
+    )
+    occurrences = SeriesOccurrenceSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = BookingSeries
+        fields = [
+            "id",
+            "parent",
+            "child",
+            "babysitter",
+            "weekdays",
+            "interval",
+            "starts_on",
+            "until",
+            "count",
+            "exceptions",
+            "start_time",
+            "end_time",
+            "hourly_rate",
+            "special_requirements",
+            "skip_conflicts",
+            "occurrences",
+            "created_at",
+        ]
+        read_only_fields = ["id", "parent", "occurrences", "created_at"]
+        extra_kwargs = {"babysitter": {"required": True, "allow_null": False}}
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("parent").prefetch_related(
+            Prefetch(
+                "occurrences",
+                queryset=BabysitterRequest.objects.only(
+                    "id", "series_id", "status", "start_date", "end_date"
+                ).order_by("start_date"),
+            )
+        )
+
+    def validate_child(self, child):
+        request = self.context.get("request")
+        if child and request and child.parent.user_id != request.user.pk:
+            raise serializers.ValidationError("Child not found.")
+        return child
+
+    def validate(self, data):
+        """Check the rule and that it expands to between 1 and MAX_OCCURRENCES bookings"""
+        if data["start_time"] >= data["end_time"]:
+            raise serializers.ValidationError("Start time must be before end time.")
+        if data.get("until") is None and data.get("count") is None:
+            raise serializers.ValidationError("Either until or count is required.")
+        if data.get("until") and data["until"] < data["starts_on"]:
+            raise serializers.ValidationError("until must not be before starts_on.")
+        if not data.get("hourly_rate"):
+            data["hourly_rate"] = 15.00
+        data["weekdays"] = sorted(set(data["weekdays"]))
+
+        dates = expand_dates(
+            data["weekdays"],
+            data["starts_on"],
+            interval=data["interval"],
+            until=data.get("until"),
+            count=data.get("count"),
+            exceptions=data["exceptions"],
+        )
+        if not dates:
+            raise serializers.ValidationError("The rule does not produce any bookings.")
+        if len(dates) > MAX_OCCURRENCES:
+            raise serializers.ValidationError(
+                f"A series can have at most {MAX_OCCURRENCES} bookings "
+                f"(this rule produces {len(dates)})."
+            )
+        return data
+
+    def create(self, validated_data):
+        """
+        Expand, check and bulk-insert; the per-occurrence outcome is kept on
+        ``.report``. Raises SeriesConflictError when skip_conflicts is off.
+        """
+        parent = validated_data.pop("parent")
+        skip_conflicts = validated_data.pop("skip_conflicts")
+        series, self.report = create_series(
+            parent, skip_conflicts=skip_conflicts, **validated_data
+        )
+        return series
+
+
+class BookingDecisionSerializer(serializers.Serializer):
+    """One accept/reject decision in a bulk request"""
+
+    id = serializers.UUIDField()
+    decision = serializers.ChoiceField(choices=["accept", "reject"])
+
+
+class BulkBookingDecisionSerializer(serializers.Serializer):
+    """Accept or reject several incoming requests at once"""
+
+    decisions = BookingDecisionSerializer(
+        many=True, allow_empty=False, max_length=MAX_BULK_DECISIONS
+    )
+
+    def validate_decisions(self, decisions):
+        ids = [decision["id"] for decision in decisions]
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError("Each request may only appear once.")
+        return decisions
+
+
 class BabysitterReviewSerializer(serializers.ModelSerializer):
     """Serializer for babysitter reviews"""
 
+    validator_fields = ("updated_at", "parent__user__updated_at", "babysitter__updated_at")
+
     booking = serializers.PrimaryKeyRelatedField(
         queryset=BabysitterRequest.objects.all(),
         write_only=True,
     )
     parent_info = UserSerializer(source="parent.user", read_only=True)
     babysitter_info = UserSerializer(source="babysitter", read_only=True)
-    booking_id = serializers.CharField(source="booking.id", read_only=True)
+    booking_id = serializers.CharField(read_only=True)
 
     class Meta:
         model = BabysitterReview
@@ -439,6 +683,10 @@ class BabysitterReviewSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("parent__user", "babysitter")
+
     def validate(self, attrs):
         """Ensure the review belongs to the current parent and a valid completed booking."""
         request = self.context["request"]
@@ -480,6 +728,10 @@ class BabysitterReviewSerializer(serializers.ModelSerializer):
 class BookingHistorySerializer(serializers.ModelSerializer):
     """Serializer for booking history view"""
 
+    validator_fields = ("updated_at", "child__updated_at", "babysitter__updated_at")
+    # Columns read by method fields on the values read path (parent/values_read.py)
+    values_columns = {"duration_hours": ("start_date", "end_date")}
+
     babysitter_info = UserSerializer(source="babysitter", read_only=True)
     child_name = serializers.CharField(source="child.name", read_only=True)
     duration_hours = serializers.SerializerMethodField()
@@ -500,6 +752,27 @@ class BookingHistorySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        # Read-only, so unused columns can be left out as well
+        return queryset.select_related("child", "babysitter").only(
+            "id",
+            "status",
+            "start_date",
+            "end_date",
+            "hourly_rate",
+            "total_cost",
+            "created_at",
+            # Kept so rows from a parent's related manager can be attached to it
+            "parent",
+            "child__name",
+            "babysitter__id",
+            "babysitter__email",
+            "babysitter__first_name",
+            "babysitter__last_name",
+            "babysitter__phone_number",
+        )
+
     def get_duration_hours(self, obj):
         """Calculate duration in hours"""
         duration = (obj.end_date - obj.start_date).total_seconds() / 3600
@@ -509,6 +782,8 @@ class BookingHistorySerializer(serializers.ModelSerializer):
 class BabysitterAvailabilitySerializer(serializers.ModelSerializer):
     """Serializer for babysitter availability management"""
 
+    validator_fields = ("updated_at",)
+
     day_of_week_display = serializers.CharField(
         source="get_day_of_week_display", read_only=True
     )
@@ -541,26 +816,26 @@ class BabysitterAvailabilitySerializer(serializers.ModelSerializer):
         # Check for overlapping slots
         babysitter = self.context["request"].user
 
-        # Build queryset for overlap check
-        queryset = BabysitterAvailability.objects.filter(
-            babysitter=babysitter, day_of_week=day_of_week
-        )
-
-        # If updating, exclude current instance
+        # Partial updates only send the changed fields
         if self.instance:
-            queryset = queryset.exclude(pk=self.instance.pk)
-
-        # Check for overlaps
-        for slot in queryset:
-            if start_time < slot.end_time and end_time > slot.start_time:
-                raise serializers.ValidationError(
-                    {
-                        "non_field_errors": [
-                            f"This time slot overlaps with existing availability: "
-                            f"{slot.start_time.strftime('%H:%M')}-{slot.end_time.strftime('%H:%M')}"
-                        ]
-                    }
-                )
+            start_time = start_time or self.instance.start_time
+            end_time = end_time or self.instance.end_time
+            if day_of_week is None:
+                day_of_week = self.instance.day_of_week
+
+        # Check for overlaps (the instance being updated is excluded)
+        slot = find_overlapping_slot(
+            babysitter.pk, day_of_week, start_time, end_time, exclude=self.instance
+        )
+        if slot:
+            raise serializers.ValidationError(
+                {
+                    "non_field_errors": [
+                        f"This time slot overlaps with existing availability: "
+                        f"{slot.start_time.strftime('%H:%M')}-{slot.end_time.strftime('%H:%M')}"
+                    ]
+                }
+            )
 
         return attrs
 
@@ -570,11 +845,87 @@ class BabysitterAvailabilitySerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class AvailabilitySlotInputSerializer(serializers.Serializer):
+    """One slot of a full weekly schedule submitted in bulk"""
+
+    day_of_week = serializers.ChoiceField(choices=BabysitterAvailability.DAY_CHOICES)
+    start_time = serializers.TimeField()
+    end_time = serializers.TimeField()
+
+    def validate(self, attrs):
+        if attrs["start_time"] >= attrs["end_time"]:
+            raise serializers.ValidationError(
+                {"end_time": "End time must be after start time"}
+            )
+        return attrs
+
+
+class BabysitterAvailabilityBulkSerializer(serializers.Serializer):
+    """Replace a babysitter's whole weekly schedule in one request"""
+
+    slots = AvailabilitySlotInputSerializer(many=True, allow_empty=True)
+
+    def validate_slots(self, slots):
+        """Reject overlapping slots using a sort-and-scan over the submitted week"""
+        clashes = find_overlaps_in_schedule(slots)
+        if clashes:
+            earlier, later = clashes[0]
+            day_name = dict(BabysitterAvailability.DAY_CHOICES)[later["day_of_week"]]
+            raise serializers.ValidationError(
+                f"Slots overlap on {day_name}: "
+                f"{earlier['start_time'].strftime('%H:%M')}-{earlier['end_time'].strftime('%H:%M')} and "
+                f"{later['start_time'].strftime('%H:%M')}-{later['end_time'].strftime('%H:%M')}"
+            )
+        return slots
+
+    def save(self, **kwargs):
+        """Apply the difference between the stored and submitted schedule atomically"""
+        babysitter = self.context["request"].user
+        wanted = {
+            (slot["day_of_week"], slot["start_time"], slot["end_time"])
+            for slot in self.validated_data["slots"]
+        }
+
+        with transaction.atomic(), defer_bitmap_rebuild(babysitter.pk):
+            existing = {
+                (slot.day_of_week, slot.start_time, slot.end_time): slot.pk
+                for slot in BabysitterAvailability.objects.filter(babysitter=babysitter)
+            }
+            stale = [pk for key, pk in existing.items() if key not in wanted]
+            if stale:
+                BabysitterAvailability.objects.filter(pk__in=stale).delete()
+            BabysitterAvailability.objects.bulk_create(
+                [
+                    BabysitterAvailability(
+                        babysitter=babysitter,
+                        day_of_week=day_of_week,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+                    for day_of_week, start_time, end_time in sorted(wanted)
+                    if (day_of_week, start_time, end_time) not in existing
+                ]
+            )
+
+        return BabysitterAvailability.objects.filter(babysitter=babysitter).order_by(
+            "day_of_week", "start_time"
+        )
+
+
 class BabysitterStorySerializer(serializers.ModelSerializer):
     """Serializer for babysitter stories - create (babysitter) and read (parent)"""
 
+    validator_fields = (
+        "updated_at",
+        "babysitter__updated_at",
+        "booking__updated_at",
+        "booking__child__updated_at",
+        "booking__parent__user__updated_at",
+    )
+
     babysitter_name = serializers.SerializerMethodField()
     booking_info = serializers.SerializerMethodField()
+    image_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = BabysitterStory
@@ -585,13 +936,29 @@ class BabysitterStorySerializer(serializers.ModelSerializer):
             "booking_info",
             "content",
             "image",
+            "image_renditions",
+            "created_at",
+        ]
+        read_only_fields = [
+            "id",
+            "babysitter_name",
+            "booking_info",
+            "image_renditions",
             "created_at",
         ]
-        read_only_fields = ["id", "babysitter_name", "booking_info", "created_at"]
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related(
+            "babysitter", "booking__child", "booking__parent__user"
+        )
 
     def get_babysitter_name(self, obj):
         return f"{obj.babysitter.first_name} {obj.babysitter.last_name}"
 
+    def get_image_renditions(self, obj):
+        return rendition_urls(obj, "image", self.context.get("request"))
+
     def get_booking_info(self, obj):
         return {
             "child_name": obj.booking.child.name if obj.booking.child else None,
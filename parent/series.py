@@ -0,0 +1,255 @@
+"""
+Recurring booking series.
+
+A series is a weekly rule (weekdays, every ``interval`` weeks, from ``starts_on``
+until a date or for ``count`` occurrences) with a fixed daily time window and a list
+of excepted dates. ``create_series`` expands the rule, checks every occurrence with
+one availability fetch and one booking fetch, and inserts the bookable ones with a
+single ``bulk_create``.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from .availability_bitmap import covers, is_aligned, slot_mask
+from .events import publish_event
+from .models import BabysitterAvailability, BabysitterRequest, BookingSeries
+from .scheduling import get_availability_bitmap, intervals_cover, merge_intervals
+
+MAX_OCCURRENCES = 100
+MAX_SPAN_DAYS = 366
+
+DAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+
+def expand_dates(weekdays, starts_on, interval=1, until=None, count=None, exceptions=()):
+    """
+    Dates produced by the rule, in order. ``count`` counts occurrences before
+    exceptions are removed (as RRULE/EXDATE do); expansion stops at MAX_SPAN_DAYS.
+    """
+    weekdays = set(weekdays)
+    exceptions = set(exceptions)
+    # Weeks are counted from the Monday of the first week
+    first_monday = starts_on - timedelta(days=starts_on.weekday())
+    last = starts_on + timedelta(days=MAX_SPAN_DAYS)
+    if until is not None:
+        last = min(last, until)
+
+    dates = []
+    produced = 0
+    day = starts_on
+    while day <= last and (count is None or produced < count):
+        week = (day - first_monday).days // 7
+        if day.weekday() in weekdays and week % interval == 0:
+            produced += 1
+            if day not in exceptions:
+                dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def occurrence_windows(dates, start_time, end_time, tz=None):
+    """Aware (start, end) datetimes for each date"""
+    tz = tz or timezone.get_current_timezone()
+    return [
+        (
+            timezone.make_aware(datetime.combine(day, start_time), tz),
+            timezone.make_aware(datetime.combine(day, end_time), tz),
+        )
+        for day in dates
+    ]
+
+
+def available_weekdays(babysitter_id, weekdays, start_time, end_time):
+    """Subset of ``weekdays`` whose weekly availability covers the window (one query)"""
+    if is_aligned(start_time) and is_aligned(end_time):
+        bitmap = get_availability_bitmap(babysitter_id)
+        if bitmap is not None:
+            return {
+                day
+                for day in weekdays
+                if covers(bitmap, slot_mask(day, start_time, end_time))
+            }
+    slots = BabysitterAvailability.objects.filter(
+        babysitter_id=babysitter_id, day_of_week__in=weekdays
+    ).values_list("day_of_week", "start_time", "end_time")
+    by_day = {}
+    for day, slot_start, slot_end in slots:
+        by_day.setdefault(day, []).append((slot_start, slot_end))
+    return {
+        day for day, slots in by_day.items() if intervals_cover(slots, start_time, end_time)
+    }
+
+
+def check_occurrences(babysitter_id, windows, weekdays, start_time, end_time, now=None):
+    """
+    Classify sorted ``windows`` as ``ok``, ``past``, ``unavailable`` or ``conflict``.
+    Returns one dict per window. Existing accepted/completed bookings are fetched
+    once for the whole span and merged against the windows in a single pass.
+    """
+    now = now or timezone.now()
+    results = [{"start_date": start, "end_date": end} for start, end in windows]
+    if not windows:
+        return results
+
+    covered = available_weekdays(babysitter_id, weekdays, start_time, end_time)
+    busy = merge_intervals(
+        BabysitterRequest.objects.blocking()
+        .filter(babysitter_id=babysitter_id)
+        .overlapping(windows[0][0], windows[-1][1])
+        .values_list("start_date", "end_date")
+    )
+
+    i = 0
+    for result in results:
+        start, end = result["start_date"], result["end_date"]
+        # Both lists are sorted and the merged busy intervals do not overlap
+        while i < len(busy) and busy[i][1] <= start:
+            i += 1
+        local_start = timezone.localtime(start)
+        if start <= now:
+            result.update(status="past", detail="This time has already passed.")
+        elif local_start.weekday() not in covered:
+            result.update(
+                status="unavailable",
+                detail=f"Babysitter is not available on {DAY_NAMES[local_start.weekday()]} "
+                f"from {start_time.strftime('%H:%M')} to {end_time.strftime('%H:%M')}.",
+            )
+        elif i < len(busy) and busy[i][0] < end:
+            busy_start = timezone.localtime(busy[i][0])
+            busy_end = timezone.localtime(busy[i][1])
+            result.update(
+                status="conflict",
+                detail="Babysitter already has a booking during this time "
+                f"({busy_start.strftime('%Y-%m-%d %H:%M')} to "
+                f"{busy_end.strftime('%Y-%m-%d %H:%M')}).",
+            )
+        else:
+            result["status"] = "ok"
+    return results
+
+
+class SeriesConflictError(Exception):
+    """Raised when ``skip_conflicts`` is off and an occurrence cannot be booked"""
+
+    def __init__(self, occurrences):
+        super().__init__("Some occurrences cannot be booked.")
+        self.occurrences = occurrences
+
+
+def create_series(parent, skip_conflicts=True, now=None, **rule):
+    """
+    Create a BookingSeries and a PENDING BabysitterRequest for every bookable
+    occurrence. Returns ``(series, occurrences)`` where each occurrence reports
+    ``created`` (with ``booking_id``) or why it was skipped. With
+    ``skip_conflicts=False`` nothing is created unless every occurrence is bookable.
+    """
+    dates = expand_dates(
+        rule["weekdays"],
+        rule["starts_on"],
+        interval=rule.get("interval") or 1,
+        until=rule.get("until"),
+        count=rule.get("count"),
+        exceptions=rule.get("exceptions") or (),
+    )
+    windows = occurrence_windows(dates, rule["start_time"], rule["end_time"])
+    babysitter = rule["babysitter"]
+
+    with transaction.atomic():
+        occurrences = check_occurrences(
+            babysitter.pk,
+            windows,
+            rule["weekdays"],
+            rule["start_time"],
+            rule["end_time"],
+            now=now,
+        )
+        if not skip_conflicts and any(o["status"] != "ok" for o in occurrences):
+            raise SeriesConflictError(occurrences)
+
+        series = BookingSeries.objects.create(
+            parent=parent,
+            **{
+                **rule,
+                "exceptions": [day.isoformat() for day in rule.get("exceptions") or ()],
+            },
+        )
+        rate = Decimal(str(series.hourly_rate))
+        bookings = []
+        for occurrence in occurrences:
+            if occurrence["status"] != "ok":
+                continue
+            hours = (occurrence["end_date"] - occurrence["start_date"]).total_seconds() / 3600
+            booking = BabysitterRequest(
+                parent=parent,
+                child=series.child,
+                babysitter=babysitter,
+                series=series,
+                start_date=occurrence["start_date"],
+                end_date=occurrence["end_date"],
+                hourly_rate=series.hourly_rate,
+                total_cost=(rate * Decimal(str(hours))).quantize(Decimal("0.01")),
+                special_requirements=series.special_requirements,
+            )
+            bookings.append(booking)
+            occurrence.update(status="created", booking_id=booking.id)
+        BabysitterRequest.objects.bulk_create(bookings)
+
+        if bookings:
+            # bulk_create skips post_save, so announce the whole series at once
+            publish_event(
+                [babysitter.pk],
+                "series.created",
+                {
+                    "id": series.id,
+                    "booking_ids": [booking.id for booking in bookings],
+                    "start_date": bookings[0].start_date,
+                    "end_date": bookings[-1].end_date,
+                },
+            )
+    return series, occurrences
+
+
+def cancel_series(series, now=None):
+    """
+    Cancel every occurrence that has not started yet and is still PENDING or
+    ACCEPTED, with one UPDATE. Returns the cancelled booking ids.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        upcoming = list(
+            series.occurrences.filter(
+                status__in=["PENDING", "ACCEPTED"], start_date__gt=now
+            )
+            .select_for_update()
+            .values("id", "status", "babysitter_id", "start_date", "end_date")
+        )
+        if not upcoming:
+            return []
+        BabysitterRequest.objects.filter(pk__in=[row["id"] for row in upcoming]).update(
+            status="CANCELLED", updated_at=timezone.now()
+        )
+        for row in upcoming:
+            publish_event(
+                [series.parent.user_id, row["babysitter_id"]],
+                "booking.status",
+                {
+                    "id": row["id"],
+                    "status": "CANCELLED",
+                    "start_date": row["start_date"],
+                    "end_date": row["end_date"],
+                    "previous_status": row["status"],
+                },
+            )
+    return [row["id"] for row in upcoming]
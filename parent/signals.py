@@ -0,0 +1,194 @@
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from account.models import User, UserProfile
+from .card_cache import bump_card_version
+from .events import publish_event
+from .models import (
+    BabysitterAvailability,
+    BabysitterRequest,
+    BabysitterReview,
+    BabysitterStats,
+    BabysitterStory,
+    ParentProfile,
+)
+from .renditions import renditions_updated, schedule_renditions
+from .scheduling import bitmap_rebuild_deferred, rebuild_availability_bitmap
+
+
+def _refresh_last_review_at(stats):
+    """Recompute last_review_at after a review was removed or moved"""
+    stats.last_review_at = BabysitterReview.objects.filter(
+        babysitter_id=stats.babysitter_id
+    ).aggregate(latest=Max("created_at"))["latest"]
+
+
+@receiver(pre_save, sender=BabysitterReview)
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+    """Keep the stored rating/babysitter so post_save can apply a delta on edits"""
+    instance._previous_rating = None
+    if raw or instance._state.adding:
+        return
+    previous = (
+        BabysitterReview.objects.filter(pk=instance.pk)
+        .values("rating", "babysitter_id")
+        .first()
+    )
+    if previous:
+        instance._previous_rating = previous
+
+
+@receiver(post_save, sender=BabysitterReview)
+def update_stats_on_review_save(sender, instance, created, raw=False, **kwargs):
+    """Apply a new or edited review to the babysitter's stats row"""
+    if raw:
+        return
+
+    previous = getattr(instance, "_previous_rating", None)
+    if created or previous is None:
+        stats = BabysitterStats.for_update(instance.babysitter_id)
+        stats.add_rating(instance.rating, instance.created_at)
+        stats.save()
+        return
+
+    if (
+        previous["rating"] == instance.rating
+        and previous["babysitter_id"] == instance.babysitter_id
+    ):
+        return
+
+    old_stats = BabysitterStats.for_update(previous["babysitter_id"])
+    old_stats.remove_rating(previous["rating"])
+    if previous["babysitter_id"] == instance.babysitter_id:
+        old_stats.add_rating(instance.rating, instance.created_at)
+        old_stats.save()
+        return
+
+    _refresh_last_review_at(old_stats)
+    old_stats.save()
+    new_stats = BabysitterStats.for_update(instance.babysitter_id)
+    new_stats.add_rating(instance.rating, instance.created_at)
+    new_stats.save()
+
+
+@receiver(post_delete, sender=BabysitterReview)
+def update_stats_on_review_delete(sender, instance, **kwargs):
+    """Remove a deleted review from the babysitter's stats row"""
+    # The row may already be gone when the babysitter account itself is deleted
+    stats = BabysitterStats.for_update(instance.babysitter_id, create=False)
+    if stats is None:
+        return
+    stats.remove_rating(instance.rating)
+    if stats.last_review_at and instance.created_at >= stats.last_review_at:
+        _refresh_last_review_at(stats)
+    stats.save()
+
+
+@receiver(post_save, sender=BabysitterReview)
+@receiver(post_delete, sender=BabysitterReview)
+def invalidate_card_on_review_change(sender, instance, raw=False, **kwargs):
+    """Ratings are part of the listing card"""
+    if raw:
+        return
+    previous = getattr(instance, "_previous_rating", None) or {}
+    bump_card_version(instance.babysitter_id, previous.get("babysitter_id"))
+
+
+@receiver(post_save, sender=User)
+def invalidate_card_on_user_change(sender, instance, raw=False, **kwargs):
+    if raw or instance.role != User.RoleChoices.BABYSITTER:
+        return
+    bump_card_version(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_card_on_profile_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_card_version(instance.user_id)
+
+
+@receiver(renditions_updated, sender=UserProfile)
+def invalidate_card_on_renditions(sender, instance_pk, **kwargs):
+    """Rendition URLs are stored with a queryset update, which sends no post_save"""
+    bump_card_version(
+        UserProfile.objects.filter(pk=instance_pk).values_list("user_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=BabysitterAvailability)
+@receiver(post_delete, sender=BabysitterAvailability)
+def rebuild_bitmap_on_slot_change(sender, instance, raw=False, **kwargs):
+    """Keep the packed weekly availability bitmap in sync with the slots"""
+    if raw or bitmap_rebuild_deferred(instance.babysitter_id):
+        return
+    rebuild_availability_bitmap(instance.babysitter_id)
+
+
+def _parent_user_id(booking):
+    if BabysitterRequest.parent.is_cached(booking):
+        return booking.parent.user_id
+    return (
+        ParentProfile.objects.filter(pk=booking.parent_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=BabysitterRequest)
+def publish_booking_change(sender, instance, created, raw=False, **kwargs):
+    """Push new requests to the babysitter and status changes to both sides"""
+    if raw:
+        return
+    previous = getattr(instance, "_loaded_status", None)
+    instance._loaded_status = instance.status
+    data = {
+        "id": instance.id,
+        "status": instance.status,
+        "start_date": instance.start_date,
+        "end_date": instance.end_date,
+    }
+    if created:
+        publish_event([instance.babysitter_id], "booking.created", data)
+    elif previous is not None and previous != instance.status:
+        publish_event(
+            [_parent_user_id(instance), instance.babysitter_id],
+            "booking.status",
+            {**data, "previous_status": previous},
+        )
+
+
+@receiver(post_save, sender=BabysitterStory)
+def publish_story(sender, instance, created, raw=False, **kwargs):
+    """Push a new story to the parent who owns the booking"""
+    if raw or not created:
+        return
+    publish_event(
+        [_parent_user_id(instance.booking)],
+        "story.created",
+        {
+            "id": instance.id,
+            "booking_id": instance.booking_id,
+            "babysitter_id": instance.babysitter_id,
+            "created_at": instance.created_at,
+        },
+    )
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_save, sender=ParentProfile)
+def queue_profile_picture_renditions(sender, instance, raw=False, **kwargs):
+    """Resize a new or replaced profile picture in the background"""
+    if raw:
+        return
+    schedule_renditions(instance, "profile_picture")
+
+
+@receiver(post_save, sender=BabysitterStory)
+def queue_story_image_renditions(sender, instance, raw=False, **kwargs):
+    """Resize a story image in the background"""
+    if raw:
+        return
+    schedule_renditions(instance, "image")
@@ -0,0 +1,99 @@
+"""
+Sparse fieldsets (``?fields=``) and expansion controls (``?expand=``) for reads.
+
+- ``?fields=id,status,child.name`` keeps only the listed fields. Dotted names select
+  inside a nested object; a nested object named without a dotted part stays whole.
+- ``?expand=child,child.parent`` renders only the listed relations as nested objects.
+  The other relations in ``expandable_fields`` collapse to their primary key, or are
+  left out when they have no collapsed form. Without ``expand`` every relation is
+  nested, as before.
+
+Serializers declare the joins behind each field in ``field_lookups`` and the
+mixin's ``setup_eager_loading`` only joins what the pruned field tree still reads,
+so both the payload and the query shrink with the request. Unknown field names are
+ignored, and the parameters only apply to GET/HEAD.
+"""
+
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+
+
+def _names(request, param):
+    """Set of dotted names in a comma-separated query param, or None if absent"""
+    if request is None or request.method not in ("GET", "HEAD"):
+        return None
+    value = request.query_params.get(param)
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsMixin:
+    """ModelSerializer mixin honouring ``?fields=`` and ``?expand=``"""
+
+    # name -> "pk" (collapse to the related primary key) or None (leave out)
+    expandable_fields = {}
+    # name -> select_related lookups (relative to this model) the field reads
+    field_lookups = {}
+
+    def _path(self):
+        """Dotted position of this serializer in the response, '' at the root"""
+        parts = []
+        node = self
+        while node.parent is not None:
+            if node.field_name:
+                parts.append(node.field_name)
+            node = node.parent
+        return ".".join(reversed(parts))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        selected = _names(request, FIELDS_PARAM)
+        expanded = _names(request, EXPAND_PARAM)
+        if not selected and expanded is None:
+            return fields
+
+        prefix = f"{self._path()}." if self._path() else ""
+        if selected:
+            here = {
+                name[len(prefix):].split(".")[0]
+                for name in selected
+                if name.startswith(prefix)
+            }
+            # Names only deeper in a sibling branch do not constrain this level
+            if here:
+                fields = {name: field for name, field in fields.items() if name in here}
+
+        if expanded is not None:
+            for name, collapsed in self.expandable_fields.items():
+                if name not in fields:
+                    continue
+                path = prefix + name
+                if path in expanded or any(e.startswith(f"{path}.") for e in expanded):
+                    continue
+                if collapsed == "pk":
+                    source = fields[name].source
+                    kwargs = {"source": source} if source not in (None, name) else {}
+                    fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, **kwargs)
+                else:
+                    del fields[name]
+        return fields
+
+    def related_lookups(self, prefix=""):
+        """select_related lookups needed to render the current (pruned) fields"""
+        lookups = []
+        for name, field in self.fields.items():
+            lookups.extend(prefix + lookup for lookup in self.field_lookups.get(name, ()))
+            if isinstance(field, SparseFieldsMixin):
+                lookups.extend(
+                    field.related_lookups(f"{prefix}{field.source.replace('.', '__')}__")
+                )
+        return lookups
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, context=None):
+        lookups = cls(context=context or {}).related_lookups()
+        return queryset.select_related(*lookups) if lookups else queryset
@@ -0,0 +1,58 @@
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+
+from .card_cache import bump_card_version, invalidate_all_cards
+from .models import BabysitterReview, BabysitterStats
+
+
+def aggregate_review_stats(reviews):
+    """Group a BabysitterReview queryset into one stats row (dict) per babysitter"""
+    histogram = {
+        f"rating_{rating}_count": Count("id", filter=Q(rating=rating))
+        for rating in range(1, 6)
+    }
+    return (
+        reviews.values("babysitter_id")
+        .annotate(
+            total_reviews=Count("id"),
+            rating_sum=Sum("rating"),
+            last_review_at=Max("created_at"),
+            **histogram,
+        )
+        .order_by("babysitter_id")
+    )
+
+
+def rebuild_babysitter_stats(babysitter_ids=None, batch_size=1000):
+    """
+    Rebuild BabysitterStats from BabysitterReview in bulk.
+    Replaces the rows of the given babysitters (or all rows) in a single transaction
+    and returns the number of stats rows written.
+    """
+    reviews = BabysitterReview.objects.all()
+    existing = BabysitterStats.objects.all()
+    if babysitter_ids is not None:
+        reviews = reviews.filter(babysitter_id__in=babysitter_ids)
+        existing = existing.filter(babysitter_id__in=babysitter_ids)
+
+    written = 0
+    batch = []
+    with transaction.atomic():
+        existing.delete()
+        for row in aggregate_review_stats(reviews).iterator(chunk_size=batch_size):
+            stats = BabysitterStats(**row)
+            stats.refresh_average()
+            batch.append(stats)
+            if len(batch) >= batch_size:
+                BabysitterStats.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            BabysitterStats.objects.bulk_create(batch)
+            written += len(batch)
+    # bulk_create skips the signals that keep listing cards fresh
+    if babysitter_ids is None:
+        invalidate_all_cards()
+    else:
+        bump_card_version(*babysitter_ids)
+    return written
@@ -0,0 +1,138 @@
+"""
+Server-sent events endpoint, served directly by the ASGI application.
+
+``GET /api/events/stream/?token=<access token>`` keeps the connection open and
+writes one SSE message per event published to the user's channel (see
+``parent.events``). Browsers' ``EventSource`` cannot send an Authorization header,
+so the JWT access token is passed as a query parameter.
+
+Event types:
+- ``story.created``: a babysitter posted a story on one of the parent's bookings
+- ``booking.created``: a parent sent the babysitter a new request
+- ``series.created``: a parent booked a recurring series (one event for all bookings)
+- ``booking.status``: a booking moved to ACCEPTED/REJECTED/CANCELLED/COMPLETED/EXPIRED
+"""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from account.models import User
+from .events import get_event_backend, user_channel
+
+EVENT_STREAM_PATH = "/api/events/stream/"
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+
+def encode_event(event):
+    """Format an event dict as one SSE message"""
+    data = json.dumps(event, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n".encode()
+
+
+def _cors_headers(scope):
+    origin = dict(scope.get("headers", [])).get(b"origin", b"").decode()
+    if origin and origin in getattr(settings, "CORS_ALLOWED_ORIGINS", []):
+        return [
+            (b"access-control-allow-origin", origin.encode()),
+            (b"vary", b"Origin"),
+        ]
+    return []
+
+
+async def authenticate(scope):
+    """User id from the ``token`` query parameter, or None"""
+    query = parse_qs(scope.get("query_string", b"").decode())
+    token = (query.get("token") or [""])[0]
+    if not token:
+        return None
+    try:
+        user_id = AccessToken(token)[api_settings.USER_ID_CLAIM]
+    except (TokenError, KeyError):
+        return None
+    if not await User.objects.filter(pk=user_id, is_active=True).aexists():
+        return None
+    return user_id
+
+
+async def _send_json(send, scope, status, body):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json")] + _cors_headers(scope),
+        }
+    )
+    await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+
+async def _wait_for_disconnect(receive):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def event_stream(scope, receive, send):
+    """ASGI app streaming the authenticated user's events until the client leaves"""
+    if scope["method"] != "GET":
+        await _send_json(send, scope, 405, {"detail": "Method not allowed."})
+        return
+    user_id = await authenticate(scope)
+    if user_id is None:
+        await _send_json(
+            send, scope, 401, {"detail": "A valid access token is required."}
+        )
+        return
+
+    subscription = get_event_backend().subscribe(user_channel(user_id))
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    # Stop nginx from buffering the stream
+                    (b"x-accel-buffering", b"no"),
+                ]
+                + _cors_headers(scope),
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": f"retry: {RETRY_MILLISECONDS}\n: connected\n\n".encode(),
+                "more_body": True,
+            }
+        )
+        while not disconnected.done():
+            next_event = asyncio.ensure_future(subscription.get())
+            await asyncio.wait(
+                {next_event, disconnected},
+                timeout=HEARTBEAT_SECONDS,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if next_event.done():
+                body = encode_event(next_event.result())
+            else:
+                next_event.cancel()
+                if disconnected.done():
+                    break
+                body = b": keepalive\n\n"
+            await send({"type": "http.response.body", "body": body, "more_body": True})
+    except OSError:
+        # Client went away mid-write
+        pass
+    finally:
+        subscription.close()
+        disconnected.cancel()
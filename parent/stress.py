@@ -0,0 +1,134 @@
+"""
+Concurrency stress harness for booking acceptance.
+
+Creates one babysitter with many PENDING requests for the same time window and
+accepts them all from a thread pool. Exactly one accept may win. The winner
+rejects the other overlapping requests in its own transaction, so the losers
+queued on the babysitter lock are refused by the status check ("invalid_status");
+with that auto-decline switched off they are refused by the conflict check.
+"""
+
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import OperationalError, connection
+from django.utils import timezone
+
+from account.models import User
+from .bookings import BookingConflictError, BookingTransitionError, accept_booking
+from .models import BabysitterRequest, ParentProfile
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def create_overlapping_requests(count):
+    """Create a babysitter plus ``count`` PENDING requests that all overlap"""
+    suffix = uuid.uuid4().hex[:8]
+    babysitter = User.objects.create_user(
+        email=f"stress-sitter-{suffix}@example.com",
+        password="stress-pass-123",
+        first_name="Stress",
+        last_name="Sitter",
+        role="BABYSITTER",
+    )
+    parent_user = User.objects.create_user(
+        email=f"stress-parent-{suffix}@example.com",
+        password="stress-pass-123",
+        first_name="Stress",
+        last_name="Parent",
+        role="PARENT",
+    )
+    parent = ParentProfile.objects.create(user=parent_user)
+    start = (timezone.now() + timedelta(days=7)).replace(
+        hour=9, minute=0, second=0, microsecond=0
+    )
+    requests = BabysitterRequest.objects.bulk_create(
+        [
+            BabysitterRequest(
+                parent=parent,
+                babysitter=babysitter,
+                # Staggered by a minute so every pair of requests overlaps
+                start_date=start + timedelta(minutes=i % 60),
+                end_date=start + timedelta(hours=2, minutes=i % 60),
+                hourly_rate=15,
+            )
+            for i in range(count)
+        ]
+    )
+    return babysitter, parent_user, [r.id for r in requests]
+
+
+def run_accept_stress(babysitter, request_ids, threads=16, max_retries=50):
+    """
+    Accept every request concurrently and return a result dict with counts,
+    throughput (accepts/s) and latency percentiles in milliseconds.
+    """
+    latencies = []
+    outcomes = {"accepted": 0, "conflict": 0, "invalid_status": 0, "error": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(min(threads, len(request_ids)) or 1)
+    started = threading.local()
+
+    def attempt(request_id):
+        if not getattr(started, "waited", False):
+            started.waited = True
+            try:
+                barrier.wait(timeout=10)
+            except threading.BrokenBarrierError:
+                pass
+        begin = time.perf_counter()
+        outcome = "error"
+        for _ in range(max_retries):
+            try:
+                accept_booking(request_id, babysitter)
+                outcome = "accepted"
+            except BookingConflictError:
+                outcome = "conflict"
+            except BookingTransitionError:
+                outcome = "invalid_status"
+            except OperationalError:
+                # SQLite reports lock contention as "database is locked"; retry
+                time.sleep(0.001)
+                continue
+            break
+        elapsed = (time.perf_counter() - begin) * 1000
+        with lock:
+            outcomes[outcome] += 1
+            latencies.append(elapsed)
+
+    def worker(ids):
+        try:
+            for request_id in ids:
+                attempt(request_id)
+        finally:
+            connection.close()
+
+    chunks = [request_ids[i::threads] for i in range(threads)]
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, [chunk for chunk in chunks if chunk]))
+    duration = time.perf_counter() - begin
+
+    return {
+        **outcomes,
+        "attempts": len(request_ids),
+        "threads": threads,
+        "duration_s": round(duration, 3),
+        "throughput_per_s": round(len(request_ids) / duration, 1) if duration else 0.0,
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else 0.0,
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2) if latencies else 0.0,
+        "accepted_in_db": BabysitterRequest.objects.filter(
+            babysitter=babysitter, status="ACCEPTED"
+        ).count(),
+    }
@@ -0,0 +1,85 @@
+"""
+Status housekeeping for bookings nobody closed by hand.
+
+- ACCEPTED bookings whose ``end_date`` has passed become COMPLETED
+- PENDING requests whose ``start_date`` has passed become EXPIRED
+
+Each transition runs as set-based UPDATEs over bounded batches of ids. The UPDATE
+repeats the status condition, so a run is idempotent and several nodes can sweep at
+the same time: every row changes status exactly once, on whichever node gets there
+first. Run it periodically with ``manage.py sweep_bookings`` or as a queued job.
+"""
+
+import logging
+
+from django.utils import timezone
+
+from .events import publish_event
+from .jobs import job
+from .models import BabysitterRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# (count key, current status, new status, field compared to now)
+TRANSITIONS = [
+    ("completed", "ACCEPTED", "COMPLETED", "end_date"),
+    ("expired", "PENDING", "EXPIRED", "start_date"),
+]
+
+
+def _sweep(old_status, new_status, field, now, batch_size):
+    """Move due rows from old_status to new_status; returns the number changed"""
+    due = BabysitterRequest.objects.filter(status=old_status, **{f"{field}__lte": now})
+    changed = 0
+    while True:
+        batch = list(
+            due.values("id", "parent__user_id", "babysitter_id", "start_date", "end_date")[
+                :batch_size
+            ]
+        )
+        if not batch:
+            return changed
+        ids = [row["id"] for row in batch]
+        # Stamp updated_at with this run's time to tell our rows from another node's
+        stamp = timezone.now()
+        updated = BabysitterRequest.objects.filter(
+            pk__in=ids, status=old_status
+        ).update(status=new_status, updated_at=stamp)
+        changed += updated
+        if updated:
+            mine = set(
+                BabysitterRequest.objects.filter(
+                    pk__in=ids, status=new_status, updated_at=stamp
+                ).values_list("id", flat=True)
+            )
+            for row in batch:
+                if row["id"] in mine:
+                    publish_event(
+                        [row["parent__user_id"], row["babysitter_id"]],
+                        "booking.status",
+                        {
+                            "id": row["id"],
+                            "status": new_status,
+                            "start_date": row["start_date"],
+                            "end_date": row["end_date"],
+                            "previous_status": old_status,
+                        },
+                    )
+        if len(batch) < batch_size:
+            return changed
+
+
+@job(queue="maintenance", max_attempts=1)
+def sweep_stale_bookings(now=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Complete finished bookings and expire unanswered requests; returns counts"""
+    now = now or timezone.now()
+    counts = {
+        key: _sweep(old_status, new_status, field, now, batch_size)
+        for key, old_status, new_status, field in TRANSITIONS
+    }
+    logger.info(
+        "Booking sweep: %(completed)d completed, %(expired)d expired", counts
+    )
+    return counts
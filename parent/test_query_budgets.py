@@ -0,0 +1,472 @@
+"""
+Query-count and latency budgets for every API route.
+
+Each endpoint is requested twice: once with a small data set and again after the
+data set has grown several times over. The number of queries must not change
+between the two runs (no N+1) and must stay within the budget recorded in
+query_budgets.json. Latency of the second run is measured as well.
+
+Environment switches:
+- ``PERF_UPDATE_BASELINE=1`` rewrites the latency baseline in query_budgets.json
+- ``PERF_ENFORCE_LATENCY=1`` fails when an endpoint is slower than
+  ``latency_tolerance`` x its baseline
+"""
+
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from account.models import User, UserProfile
+from .models import (
+    BabysitterAvailability,
+    BabysitterRequest,
+    BabysitterReview,
+    BabysitterStory,
+    BookingSeries,
+    ChildProfile,
+    ParentProfile,
+)
+
+BUDGET_FILE = Path(__file__).with_name("query_budgets.json")
+SMALL_VOLUME = 2
+LARGE_VOLUME = 12
+LATENCY_RUNS = 3
+
+
+def _endpoint(name, role, method="GET", pk=None, data=None, fmt="json", query=None):
+    return {
+        "name": name,
+        "role": role,
+        "method": method,
+        "pk": pk,
+        "data": data,
+        "format": fmt,
+        "query": query,
+    }
+
+
+# One entry per (method, route). ``pk`` names an attribute of the test case holding
+# the object (or id) used for detail routes.
+ENDPOINTS = [
+    # Account
+    _endpoint(
+        "register",
+        None,
+        "POST",
+        data={
+            "email": "new.user@test.com",
+            "first_name": "New",
+            "last_name": "User",
+            "role": "PARENT",
+            "password": "Sturdy-Pass-2024",
+        },
+        fmt="multipart",
+    ),
+    _endpoint(
+        "login",
+        None,
+        "POST",
+        data={"email": "parent@test.com", "password": "testpass123"},
+    ),
+    _endpoint("logout", "parent", "POST", data="refresh_token"),
+    _endpoint("me", "parent"),
+    _endpoint(
+        "change-password",
+        "parent",
+        "POST",
+        data={"old_password": "testpass123", "new_password": "Sturdy-Pass-2024"},
+    ),
+    _endpoint(
+        "profile-update", "babysitter", "PATCH", data={"bio": "Hi"}, fmt="multipart"
+    ),
+    _endpoint("admin-users-list", "admin"),
+    _endpoint("admin-users-detail", "admin", pk="babysitter"),
+    # Parent
+    _endpoint("api-root", "parent"),
+    _endpoint("parent-profile-list", "parent"),
+    _endpoint("parent-profile-me", "parent"),
+    _endpoint("parent-profile-detail", "parent", pk="parent_profile"),
+    _endpoint("child-profile-list", "parent"),
+    _endpoint("child-profile-detail", "parent", pk="child"),
+    _endpoint("babysitter-request-list", "parent"),
+    _endpoint("babysitter-request-list", "parent", "POST", data="new_request"),
+    _endpoint("babysitter-request-detail", "parent", pk="pending"),
+    _endpoint("babysitter-request-cancel", "parent", "POST", pk="pending"),
+    _endpoint("babysitter-request-upcoming", "parent"),
+    _endpoint("babysitter-request-past", "parent"),
+    _endpoint("booking-series-list", "parent"),
+    _endpoint("booking-series-list", "parent", "POST", data="new_series"),
+    _endpoint("booking-series-detail", "parent", pk="series"),
+    _endpoint("booking-series-cancel", "parent", "POST", pk="series"),
+    _endpoint("babysitter-listing-list", "parent"),
+    _endpoint("babysitter-listing-search", "parent", query={"name": "a"}),
+    _endpoint("babysitter-listing-detail", "parent", pk="babysitter"),
+    _endpoint("babysitter-listing-availability", "parent", pk="babysitter"),
+    _endpoint("babysitter-listing-free-slots", "parent", pk="babysitter"),
+    _endpoint(
+        "babysitter-listing-bookings", "parent", pk="babysitter", query="booking_day"
+    ),
+    _endpoint("babysitter-review-list", "parent"),
+    _endpoint("babysitter-review-detail", "parent", pk="review"),
+    _endpoint("booking-history-list", "parent"),
+    _endpoint("booking-history-detail", "parent", pk="completed"),
+    _endpoint("parent-stories-list", "parent"),
+    _endpoint("parent-stories-detail", "parent", pk="story"),
+    # Babysitter
+    _endpoint("babysitter-incoming-requests-list", "babysitter"),
+    _endpoint("babysitter-incoming-requests-detail", "babysitter", pk="pending"),
+    _endpoint(
+        "babysitter-incoming-requests-accept", "babysitter", "POST", pk="pending"
+    ),
+    _endpoint(
+        "babysitter-incoming-requests-reject", "babysitter", "POST", pk="pending"
+    ),
+    _endpoint(
+        "babysitter-incoming-requests-bulk-decide",
+        "babysitter",
+        "POST",
+        data="decisions",
+    ),
+    _endpoint("babysitter-bookings-list", "babysitter"),
+    _endpoint("babysitter-bookings-detail", "babysitter", pk="accepted"),
+    _endpoint("babysitter-bookings-complete", "babysitter", "POST", pk="accepted"),
+    _endpoint("babysitter-bookings-upcoming", "babysitter"),
+    _endpoint("babysitter-bookings-past", "babysitter"),
+    _endpoint("babysitter-reviews-received-list", "babysitter"),
+    _endpoint("babysitter-reviews-received-detail", "babysitter", pk="review"),
+    _endpoint("babysitter-history-list", "babysitter"),
+    _endpoint("babysitter-history-detail", "babysitter", pk="completed"),
+    _endpoint("babysitter-availability-list", "babysitter"),
+    _endpoint("babysitter-availability-detail", "babysitter", pk="slot"),
+    _endpoint("babysitter-availability-bulk", "babysitter", "PUT", data="schedule"),
+    _endpoint("babysitter-stories-list", "babysitter"),
+    _endpoint("babysitter-stories-detail", "babysitter", pk="story"),
+    _endpoint("babysitter-stories-active-bookings", "babysitter"),
+]
+
+
+def endpoint_key(endpoint):
+    return f"{endpoint['method']} {endpoint['name']}"
+
+
+def api_route_names():
+    """Names of every route registered under /api/account/ and /api/parent/"""
+
+    def walk(patterns, prefix=""):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns, prefix + str(pattern.pattern))
+            else:
+                yield prefix + str(pattern.pattern), pattern.name
+
+    return {
+        name
+        for path, name in walk(get_resolver().url_patterns)
+        if path.startswith(("api/account/", "api/parent/")) and "format" not in path
+    }
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class QueryBudgetTests(TestCase):
+    """Every API route stays within a fixed, volume-independent query budget"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.budgets = json.loads(BUDGET_FILE.read_text())
+        cls.counter = 0
+
+        cls.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        UserProfile.objects.create(user=cls.parent_user)
+        cls.parent_profile = ParentProfile.objects.create(user=cls.parent_user)
+        cls.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        UserProfile.objects.create(user=cls.babysitter, address="Kathmandu")
+        cls.admin = User.objects.create_superuser(
+            email="admin@test.com", password="testpass123", first_name="Admin"
+        )
+        cls.refresh_token = str(RefreshToken.for_user(cls.parent_user))
+
+        now = timezone.now()
+        # One session in progress so stories can be posted and read
+        cls.ongoing = BabysitterRequest.objects.create(
+            parent=cls.parent_profile,
+            babysitter=cls.babysitter,
+            start_date=now - timedelta(hours=1),
+            end_date=now + timedelta(hours=3),
+            status="ACCEPTED",
+            hourly_rate=15,
+        )
+        cls.grow(SMALL_VOLUME)
+
+        cls.child = cls.parent_profile.children.first()
+        cls.pending = BabysitterRequest.objects.filter(status="PENDING").first()
+        cls.accepted = (
+            BabysitterRequest.objects.filter(status="ACCEPTED")
+            .exclude(pk=cls.ongoing.pk)
+            .first()
+        )
+        cls.completed = BabysitterRequest.objects.filter(status="COMPLETED").first()
+        cls.series = BookingSeries.objects.first()
+        cls.review = BabysitterReview.objects.first()
+        cls.story = BabysitterStory.objects.first()
+        cls.slot = BabysitterAvailability.objects.filter(babysitter=cls.babysitter).first()
+        cls.booking_day = {"date": timezone.localtime(cls.accepted.start_date).date()}
+
+    @classmethod
+    def grow(cls, count):
+        """Add ``count`` more rows of every kind the endpoints read"""
+        now = timezone.now()
+        for _ in range(count):
+            cls.counter += 1
+            i = cls.counter
+            child = ChildProfile.objects.create(
+                parent=cls.parent_profile, name=f"Child {i}", date_of_birth="2019-01-01"
+            )
+            sitter = User.objects.create_user(
+                email=f"sitter{i}@test.com",
+                first_name=f"Sitter{i}",
+                last_name="Kumar",
+                role="BABYSITTER",
+                password="testpass123",
+            )
+            UserProfile.objects.create(user=sitter, address="Lalitpur")
+            BabysitterAvailability.objects.create(
+                babysitter=sitter,
+                day_of_week=i % 7,
+                start_time=dt_time(9, 0),
+                end_time=dt_time(17, 0),
+            )
+            BabysitterAvailability.objects.create(
+                babysitter=cls.babysitter,
+                day_of_week=i % 7,
+                start_time=dt_time(i // 7 * 2, 0),
+                end_time=dt_time(i // 7 * 2 + 1, 0),
+            )
+            start = now + timedelta(hours=10 * i + 200)
+            series = BookingSeries.objects.create(
+                parent=cls.parent_profile,
+                child=child,
+                babysitter=cls.babysitter,
+                weekdays=[timezone.localtime(start).weekday()],
+                starts_on=timezone.localtime(start).date(),
+                count=1,
+                start_time=timezone.localtime(start).time(),
+                end_time=timezone.localtime(start + timedelta(hours=2)).time(),
+                hourly_rate=15,
+            )
+            for status, offset in (
+                ("PENDING", 10 * i + 200),
+                ("ACCEPTED", 10 * i + 300),
+                ("COMPLETED", -10 * i - 2),
+                ("REJECTED", 10 * i + 400),
+            ):
+                start = now + timedelta(hours=offset)
+                booking = BabysitterRequest.objects.create(
+                    parent=cls.parent_profile,
+                    child=child,
+                    babysitter=cls.babysitter,
+                    start_date=start,
+                    end_date=start + timedelta(hours=2),
+                    status=status,
+                    hourly_rate=15,
+                    total_cost=30,
+                    series=series if status == "PENDING" else None,
+                )
+                if status == "COMPLETED":
+                    BabysitterReview.objects.create(
+                        booking=booking,
+                        parent=cls.parent_profile,
+                        babysitter=cls.babysitter,
+                        rating=1 + i % 5,
+                        comment="Great",
+                    )
+            BabysitterStory.objects.create(
+                booking=cls.ongoing, babysitter=cls.babysitter, content=f"Update {i}"
+            )
+
+    def client_for(self, role):
+        client = APIClient()
+        user = {
+            "parent": self.parent_user,
+            "babysitter": self.babysitter,
+            "admin": self.admin,
+        }.get(role)
+        if user:
+            # Fresh instance: views like change-password mutate request.user in memory
+            client.force_authenticate(User.objects.get(pk=user.pk))
+        return client
+
+    def request_data(self, endpoint):
+        data = endpoint["data"]
+        if data == "refresh_token":
+            return {"refresh": self.refresh_token}
+        if data == "new_request":
+            # Well past every booking grow() creates
+            start = timezone.localtime() + timedelta(days=60)
+            BabysitterAvailability.objects.get_or_create(
+                babysitter=self.babysitter,
+                day_of_week=start.weekday(),
+                start_time=dt_time(20, 0),
+                end_time=dt_time(23, 0),
+            )
+            start = start.replace(hour=20, minute=0, second=0, microsecond=0)
+            return {
+                "babysitter": str(self.babysitter.pk),
+                "child": str(self.child.pk),
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(hours=2)).isoformat(),
+                "hourly_rate": "15.00",
+            }
+        if data == "new_series":
+            start = timezone.localtime() + timedelta(days=70)
+            BabysitterAvailability.objects.get_or_create(
+                babysitter=self.babysitter,
+                day_of_week=start.weekday(),
+                start_time=dt_time(20, 0),
+                end_time=dt_time(23, 0),
+            )
+            return {
+                "babysitter": str(self.babysitter.pk),
+                "child": str(self.child.pk),
+                "weekdays": [start.weekday()],
+                "starts_on": start.date().isoformat(),
+                "count": 3,
+                "start_time": "20:00",
+                "end_time": "22:00",
+            }
+        if data == "decisions":
+            return {
+                "decisions": [
+                    {"id": str(booking.pk), "decision": decision}
+                    for booking, decision in (
+                        (self.pending, "accept"),
+                        (self.accepted, "reject"),
+                    )
+                ]
+            }
+        if data == "schedule":
+            return {
+                "slots": [
+                    {"day_of_week": day, "start_time": "09:00", "end_time": "17:00"}
+                    for day in range(5)
+                ]
+            }
+        return data
+
+    def call(self, endpoint):
+        """Run one request inside a rolled-back transaction; return (response, queries, ms)"""
+        kwargs = {}
+        if endpoint["pk"]:
+            target = getattr(self, endpoint["pk"])
+            kwargs = {"id" if endpoint["name"].startswith("admin") else "pk": target.pk}
+        url = reverse(endpoint["name"], kwargs=kwargs)
+        query = endpoint["query"]
+        if isinstance(query, str):
+            query = getattr(self, query)
+        client = self.client_for(endpoint["role"])
+        data = self.request_data(endpoint)
+
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                begin = time.perf_counter()
+                if endpoint["method"] == "GET":
+                    response = client.get(url, query)
+                else:
+                    response = getattr(client, endpoint["method"].lower())(
+                        url, data, format=endpoint["format"]
+                    )
+                elapsed = (time.perf_counter() - begin) * 1000
+                transaction.set_rollback(True)
+        return response, len(queries), elapsed
+
+    def test_every_route_has_a_budget(self):
+        covered = {endpoint["name"] for endpoint in ENDPOINTS}
+        missing = api_route_names() - covered
+        self.assertFalse(missing, f"Routes without a query budget: {sorted(missing)}")
+        keys = {endpoint_key(endpoint) for endpoint in ENDPOINTS}
+        self.assertEqual(keys, set(self.budgets["queries"]))
+        missing = keys - set(self.budgets["latency_ms"])
+        self.assertFalse(missing, f"Routes without a latency baseline: {sorted(missing)}")
+
+    def test_query_counts_within_budget_and_independent_of_volume(self):
+        small = {}
+        for endpoint in ENDPOINTS:
+            response, count, _ = self.call(endpoint)
+            self.assertLess(
+                response.status_code, 400, f"{endpoint_key(endpoint)}: {response.data}"
+            )
+            small[endpoint_key(endpoint)] = count
+
+        self.grow(LARGE_VOLUME - SMALL_VOLUME)
+
+        latencies = {}
+        unbounded = set(self.budgets.get("known_unbounded", []))
+        for endpoint in ENDPOINTS:
+            key = endpoint_key(endpoint)
+            timings = []
+            for _ in range(LATENCY_RUNS):
+                response, count, elapsed = self.call(endpoint)
+                timings.append(elapsed)
+            latencies[key] = round(statistics.median(timings), 2)
+
+            with self.subTest(endpoint=key):
+                self.assertLess(response.status_code, 400, response.data)
+                if key not in unbounded:
+                    self.assertEqual(
+                        count,
+                        small[key],
+                        f"{key}: query count grows with data ({small[key]} -> {count})",
+                    )
+                self.assertLessEqual(
+                    count,
+                    self.budgets["queries"][key],
+                    f"{key}: {count} queries, budget is {self.budgets['queries'][key]}",
+                )
+
+        self.check_latency(latencies)
+
+    def check_latency(self, latencies):
+        if os.environ.get("PERF_UPDATE_BASELINE") == "1":
+            budgets = json.loads(BUDGET_FILE.read_text())
+            budgets["latency_ms"] = dict(sorted(latencies.items()))
+            budgets["latency_recorded_at"] = datetime.now().isoformat(timespec="seconds")
+            BUDGET_FILE.write_text(json.dumps(budgets, indent=2) + "\n")
+            return
+
+        if os.environ.get("PERF_ENFORCE_LATENCY") != "1":
+            return
+        tolerance = self.budgets.get("latency_tolerance", 2.0)
+        baseline = self.budgets.get("latency_ms", {})
+        for key, elapsed in latencies.items():
+            if key in baseline:
+                with self.subTest(latency=key):
+                    self.assertLessEqual(
+                        elapsed,
+                        baseline[key] * tolerance,
+                        f"{key}: {elapsed}ms vs baseline {baseline[key]}ms",
+                    )
@@ -1,8 +1,73 @@
-from django.test import TestCase
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models.signals import post_delete, post_init
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from account.models import User
-from .models import ParentProfile, ChildProfile, BabysitterRequest, BabysitterReview
-from datetime import timedelta
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+from account.models import User, UserProfile
+from .models import (
+    ParentProfile,
+    ChildProfile,
+    BabysitterRequest,
+    BabysitterReview,
+    BabysitterAvailability,
+    BabysitterStats,
+    BabysitterStory,
+    BookingSeries,
+    Job,
+)
+from .availability_bitmap import slot_mask
+from .card_cache import VERSION_KEY, get_card_cache
+from .scheduling import (
+    covers_window,
+    filter_available,
+    get_availability_bitmap,
+    subtract_intervals,
+)
+from .events import BaseEventBackend, get_event_backend, user_channel
+from .streams import event_stream
+from .jobs import claim_job, enqueue, job, run_job, run_pending
+from .pagination import BookingCursorPagination
+from .renditions import rendition_urls
+from .seeding import flush_seeded
+from .series import expand_dates
+from .sweeper import sweep_stale_bookings
+from .stress import create_overlapping_requests, run_accept_stress
+from .renderers import FastJSONRenderer, msgpack, orjson
+from .values_read import values_reader
+from .compression import CompressionMiddleware, GzipCodec, choose_codec, no_compression
+from .serializers import (
+    BabysitterAvailabilitySerializer,
+    BabysitterListSerializer,
+    BabysitterStorySerializer,
+    BookingHistorySerializer,
+    BookingSeriesSerializer,
+)
+from account.serializers import AdminUserListSerializer
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+import asyncio
+import gzip
+from itertools import product
+import json
+import shutil
+from unittest.mock import Mock, patch
+import uuid
+import zlib
+import tempfile
+from types import SimpleNamespace
+from unittest import skipIf, skipUnless
+from PIL import Image
 
 
 class ParentProfileTests(TestCase):
@@ -163,3 +228,2227 @@ class BabysitterReviewTests(TestCase):
         self.assertEqual(self.review.rating, 5)
         self.assertEqual(self.review.parent, self.parent_profile)
         self.assertEqual(self.review.babysitter, self.babysitter)
+
+
+class BabysitterStatsTests(TestCase):
+    """Tests for the denormalized babysitter rating stats"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        self.start_date = timezone.now() - timedelta(days=3)
+
+    def _review(self, rating, days=0):
+        booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            start_date=self.start_date + timedelta(days=days),
+            end_date=self.start_date + timedelta(days=days, hours=2),
+            status="COMPLETED",
+            hourly_rate=20.00,
+        )
+        return BabysitterReview.objects.create(
+            booking=booking,
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            rating=rating,
+        )
+
+    def test_stats_follow_review_create_edit_delete(self):
+        first = self._review(5)
+        second = self._review(2, days=1)
+
+        stats = BabysitterStats.objects.get(babysitter=self.babysitter)
+        self.assertEqual(stats.total_reviews, 2)
+        self.assertEqual(stats.average_rating, Decimal("3.50"))
+        self.assertEqual(stats.histogram, {1: 0, 2: 1, 3: 0, 4: 0, 5: 1})
+        self.assertEqual(stats.last_review_at, second.created_at)
+
+        second.rating = 4
+        second.save()
+        stats.refresh_from_db()
+        self.assertEqual(stats.average_rating, Decimal("4.50"))
+        self.assertEqual(stats.histogram, {1: 0, 2: 0, 3: 0, 4: 1, 5: 1})
+
+        second.delete()
+        stats.refresh_from_db()
+        self.assertEqual(stats.total_reviews, 1)
+        self.assertEqual(stats.average_rating, Decimal("5.00"))
+        self.assertEqual(stats.last_review_at, first.created_at)
+
+    def test_rebuild_command_matches_incremental_stats(self):
+        self._review(5)
+        self._review(3, days=1)
+        self._review(4, days=2)
+        expected = BabysitterStats.objects.get(babysitter=self.babysitter)
+
+        BabysitterStats.objects.all().delete()
+        call_command("rebuild_babysitter_stats", stdout=StringIO())
+
+        rebuilt = BabysitterStats.objects.get(babysitter=self.babysitter)
+        self.assertEqual(rebuilt.total_reviews, expected.total_reviews)
+        self.assertEqual(rebuilt.average_rating, expected.average_rating)
+        self.assertEqual(rebuilt.histogram, expected.histogram)
+        self.assertEqual(rebuilt.last_review_at, expected.last_review_at)
+
+    def test_listing_reads_stats_with_constant_queries(self):
+        self._review(4)
+        for i in range(5):
+            User.objects.create_user(
+                email=f"sitter{i}@test.com",
+                first_name=f"Sitter{i}",
+                role="BABYSITTER",
+                password="testpass123",
+            )
+        client = APIClient()
+        client.force_authenticate(self.parent_user)
+
+        # One for the conditional GET validator, one for the page
+        with self.assertNumQueries(2):
+            response = client.get("/api/parent/listings/")
+
+        self.assertEqual(response.status_code, 200)
+        rated = next(row for row in response.data if row["id"] == str(self.babysitter.id))
+        self.assertEqual(rated["average_rating"], 4.0)
+        self.assertEqual(rated["total_reviews"], 1)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "babysitter-card-tests",
+        }
+    }
+)
+class BabysitterCardCacheTests(TestCase):
+    """Listing cards are served from the cache and rebuilt when their inputs change"""
+
+    def setUp(self):
+        caches["default"].clear()
+        parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(parent_user)
+
+    def card(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get("/api/parent/listings/")
+        self.assertEqual(response.status_code, 200)
+        return next(row for row in response.data if row["id"] == str(self.babysitter.id))
+
+    def review(self, rating):
+        start = timezone.now() - timedelta(days=2)
+        booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            status="COMPLETED",
+            hourly_rate=20.00,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            return BabysitterReview.objects.create(
+                booking=booking, parent=self.parent_profile, babysitter=self.babysitter, rating=rating
+            )
+
+    def test_cached_card_is_reused_until_user_changes(self):
+        self.assertEqual(self.card()["first_name"], "Jane")
+
+        # A queryset update sends no signal, so the cached card is still served
+        User.objects.filter(pk=self.babysitter.pk).update(first_name="Janet")
+        self.assertEqual(self.card()["first_name"], "Jane")
+
+        self.babysitter.first_name = "Janet"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.babysitter.save()
+        self.assertEqual(self.card()["first_name"], "Janet")
+
+    def test_profile_and_review_changes_refresh_card(self):
+        self.assertIsNone(self.card()["profile"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserProfile.objects.create(user=self.babysitter, bio="Loves kids")
+        self.assertEqual(self.card()["profile"]["bio"], "Loves kids")
+
+        review = self.review(4)
+        self.assertEqual(self.card()["total_reviews"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            review.delete()
+        self.assertEqual(self.card()["total_reviews"], 0)
+
+    def test_stats_rebuild_invalidates_cards(self):
+        self.review(4)
+        self.assertEqual(self.card()["average_rating"], 4.0)
+
+        BabysitterReview.objects.filter(babysitter=self.babysitter).update(rating=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("rebuild_babysitter_stats", stdout=StringIO())
+        self.assertEqual(self.card()["average_rating"], 2.0)
+
+    @override_settings(ALLOWED_HOSTS=["testserver", "example.com"])
+    def test_cards_depend_on_request_host(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            UserProfile.objects.create(
+                user=self.babysitter, profile_picture="profiles/jane.jpg"
+            )
+        self.assertEqual(
+            self.card()["profile"]["profile_picture"], "http://testserver/media/profiles/jane.jpg"
+        )
+        response = self.client.get("/api/parent/listings/", HTTP_HOST="example.com")
+        row = next(row for row in response.data if row["id"] == str(self.babysitter.id))
+        self.assertEqual(
+            row["profile"]["profile_picture"], "http://example.com/media/profiles/jane.jpg"
+        )
+
+
+class ConditionalGetTests(TestCase):
+    """ETag / Last-Modified validators let unchanged reads answer 304"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.user)
+        self.children = [
+            ChildProfile.objects.create(
+                parent=self.parent_profile, name=name, date_of_birth="2018-01-01", gender="F"
+            )
+            for name in ["Emma", "Olivia"]
+        ]
+        self.client = APIClient()
+
+    def get(self, url, **headers):
+        # Fresh user so the parent profile lookup is part of every request
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+        return self.client.get(url, headers=headers)
+
+    def test_unchanged_list_answers_304_without_fetching_rows(self):
+        response = self.get("/api/parent/children/")
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotIn("Last-Modified", response)
+
+        # Profile lookup and the validator aggregate only
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/parent/children/", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_changes_and_deletions_change_the_etag(self):
+        etag = self.get("/api/parent/children/")["ETag"]
+
+        self.children[0].name = "Emily"
+        self.children[0].save()
+        response = self.get("/api/parent/children/", If_None_Match=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        self.children[1].delete()
+        response = self.get("/api/parent/children/", If_None_Match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+
+        # Query strings are part of the validator
+        filtered = self.get("/api/parent/children/?page_size=1")
+        self.assertNotEqual(filtered["ETag"], response["ETag"])
+
+    def test_detail_honours_if_modified_since(self):
+        url = f"/api/parent/children/{self.children[0].id}/"
+        response = self.get(url)
+        last_modified = response["Last-Modified"]
+
+        self.assertEqual(self.get(url, If_Modified_Since=last_modified).status_code, 304)
+        self.assertEqual(self.get(url, If_None_Match=response["ETag"]).status_code, 304)
+        self.assertEqual(self.get(f"/api/parent/children/{uuid.uuid4()}/").status_code, 404)
+
+    def test_nested_changes_invalidate_requests(self):
+        start = timezone.now() + timedelta(days=1)
+        BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            child=self.children[0],
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            hourly_rate=20.00,
+        )
+        etag = self.get("/api/parent/requests/")["ETag"]
+        self.assertEqual(self.get("/api/parent/requests/", If_None_Match=etag).status_code, 304)
+
+        # child_name is nested in each booking row
+        self.children[0].name = "Emily"
+        self.children[0].save()
+        response = self.get("/api/parent/requests/", If_None_Match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["child_name"], "Emily")
+
+    def test_deleted_related_rows_change_the_etag(self):
+        babysitter = User.objects.create_user(
+            email="sitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        start = timezone.now() + timedelta(days=1)
+        for child, sitter in ((self.children[1], babysitter), (self.children[0], None)):
+            BabysitterRequest.objects.create(
+                parent=self.parent_profile,
+                child=child,
+                babysitter=sitter,
+                start_date=start,
+                end_date=start + timedelta(hours=2),
+                hourly_rate=20.00,
+            )
+            start += timedelta(days=1)
+        # The remaining child is the most recently updated related row
+        self.children[0].save()
+
+        # SET_NULL clears the foreign keys without touching updated_at
+        for related, field in ((self.children[1], "child"), (babysitter, "babysitter")):
+            with self.subTest(field=field):
+                etag = self.get("/api/parent/requests/")["ETag"]
+                pk = related.pk
+                related.delete()
+                response = self.get("/api/parent/requests/", If_None_Match=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], etag)
+                self.assertNotIn(pk, [row[field] for row in response.data])
+
+    def test_me_view_revalidates(self):
+        UserProfile.objects.create(user=self.user)
+        response = self.get("/api/account/me/")
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(self.get("/api/account/me/", If_None_Match=etag).status_code, 304)
+
+        self.user.first_name = "Johnny"
+        self.user.save()
+        response = self.get("/api/account/me/", If_None_Match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["user"]["first_name"], "Johnny")
+
+
+class PaginationTests(TestCase):
+    """Tests for keyset and page-number pagination on list endpoints"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        # Several bookings share a start_date so the id tiebreaker is exercised
+        start = timezone.now() - timedelta(days=30)
+        for i in range(12):
+            BabysitterRequest.objects.create(
+                parent=self.parent_profile,
+                babysitter=self.babysitter,
+                start_date=start + timedelta(days=i // 3),
+                end_date=start + timedelta(days=i // 3, hours=2),
+                status="COMPLETED",
+                hourly_rate=20.00,
+            )
+        self.client = APIClient()
+
+    def test_keyset_pages_cover_history_without_duplicates(self):
+        self.client.force_authenticate(self.parent_user)
+        seen = []
+        url = "/api/parent/history/?page_size=5"
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data), 5)
+            seen.extend(row["id"] for row in response.data)
+            cursor = response.headers.get("X-Next-Cursor")
+            url = f"/api/parent/history/?page_size=5&cursor={cursor}" if cursor else None
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), 12)
+        self.assertEqual(len(set(seen)), 12)
+        starts = list(
+            BabysitterRequest.objects.filter(id__in=seen).values_list("id", "start_date")
+        )
+        by_id = dict((str(pk), start) for pk, start in starts)
+        ordered = [by_id[pk] for pk in seen]
+        self.assertEqual(ordered, sorted(ordered, reverse=True))
+
+    def test_lists_are_paginated_unless_staff_opts_out(self):
+        self.client.force_authenticate(self.parent_user)
+        with patch.object(BookingCursorPagination, "page_size", 5):
+            for url in ("/api/parent/history/", "/api/parent/history/?paginate=false"):
+                with self.subTest(url=url):
+                    response = self.client.get(url)
+                    self.assertEqual(len(response.data), 5)
+                    self.assertIn("X-Next-Cursor", response.headers)
+
+    def test_past_bookings_are_ordered_by_end_date_across_pages(self):
+        # Starts first but ends last, so start and end order disagree
+        long_booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            start_date=timezone.now() - timedelta(days=40),
+            end_date=timezone.now() - timedelta(days=1),
+            status="COMPLETED",
+            hourly_rate=20.00,
+        )
+        for user, path in (
+            (self.parent_user, "/api/parent/requests/past/"),
+            (self.babysitter, "/api/parent/babysitter/bookings/past/"),
+        ):
+            with self.subTest(path=path):
+                self.client.force_authenticate(user)
+                seen, url = [], f"{path}?page_size=4"
+                while url:
+                    response = self.client.get(url)
+                    seen.extend(row["id"] for row in response.data)
+                    cursor = response.headers.get("X-Next-Cursor")
+                    url = f"{path}?page_size=4&cursor={cursor}" if cursor else None
+
+                self.assertEqual(len(seen), 13)
+                self.assertEqual(seen[0], str(long_booking.id))
+                ends = dict(
+                    (str(pk), end)
+                    for pk, end in BabysitterRequest.objects.values_list("id", "end_date")
+                )
+                ordered = [ends[pk] for pk in seen]
+                self.assertEqual(ordered, sorted(ordered, reverse=True))
+
+    def test_invalid_cursor_returns_404(self):
+        self.client.force_authenticate(self.parent_user)
+        response = self.client.get("/api/parent/history/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_admin_user_list_uses_page_numbers(self):
+        admin = User.objects.create_superuser(
+            email="admin@test.com", password="testpass123", first_name="Admin"
+        )
+        self.client.force_authenticate(admin)
+
+        response = self.client.get("/api/account/users/?page_size=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.headers["X-Total-Count"], "3")
+        self.assertIn('rel="next"', response.headers["Link"])
+
+        response = self.client.get("/api/account/users/?page_size=2&paginate=false")
+        self.assertEqual(len(response.data), 3)
+
+
+class BookingConflictTests(TestCase):
+    """Tests for the single-query booking overlap check"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        self.start = (timezone.now() + timedelta(days=2)).replace(
+            hour=10, minute=0, second=0, microsecond=0
+        )
+        # A long history of non-overlapping bookings
+        for day in range(1, 20):
+            self._booking(self.start - timedelta(days=day), hours=3, status="COMPLETED")
+        self.accepted = self._booking(self.start, hours=3, status="ACCEPTED")
+
+    def _booking(self, start, hours, status="PENDING"):
+        return BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            start_date=start,
+            end_date=start + timedelta(hours=hours),
+            status=status,
+            hourly_rate=20.00,
+        )
+
+    def test_find_conflict_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            conflict = BabysitterRequest.objects.find_conflict(
+                self.babysitter,
+                self.start + timedelta(hours=2),
+                self.start + timedelta(hours=4),
+            )
+        self.assertEqual(conflict.id, self.accepted.id)
+
+    def test_touching_intervals_do_not_conflict(self):
+        conflict = BabysitterRequest.objects.find_conflict(
+            self.babysitter,
+            self.start + timedelta(hours=3),
+            self.start + timedelta(hours=5),
+        )
+        self.assertIsNone(conflict)
+
+    def test_accept_rejects_overlapping_request(self):
+        pending = self._booking(self.start + timedelta(hours=1), hours=1)
+        client = APIClient()
+        client.force_authenticate(self.babysitter)
+
+        response = client.post(f"/api/parent/babysitter/requests/{pending.id}/accept/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Conflicting booking", response.data["detail"])
+        pending.refresh_from_db()
+        self.assertEqual(pending.status, "PENDING")
+
+
+class ConcurrentAcceptTests(TransactionTestCase):
+    """Concurrent accepts of overlapping requests must not double-book"""
+
+    def test_at_most_one_overlapping_accept_wins(self):
+        babysitter, _, request_ids = create_overlapping_requests(40)
+
+        result = run_accept_stress(
+            babysitter, request_ids, threads=8, max_retries=1000
+        )
+
+        self.assertEqual(result["accepted"], 1)
+        self.assertEqual(result["accepted_in_db"], 1)
+        # The winner rejects the others before releasing the lock, so every loser
+        # waited on it and then failed the status check
+        self.assertEqual(result["invalid_status"], 39)
+        self.assertEqual(result["conflict"] + result["error"], 0)
+
+    def test_losers_hit_the_conflict_check_without_auto_decline(self):
+        babysitter, _, request_ids = create_overlapping_requests(40)
+
+        with patch("parent.bookings.decline_overlapping_requests", return_value=[]):
+            result = run_accept_stress(
+                babysitter, request_ids, threads=8, max_retries=1000
+            )
+
+        self.assertEqual(result["accepted"], 1)
+        self.assertEqual(result["accepted_in_db"], 1)
+        self.assertEqual(result["conflict"], 39)
+        self.assertEqual(result["invalid_status"] + result["error"], 0)
+
+
+class FreeSlotsTests(TestCase):
+    """Tests for the free-slot computation and endpoint"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        for day in range(7):
+            BabysitterAvailability.objects.create(
+                babysitter=self.babysitter,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 0),
+            )
+        self.day = timezone.localdate() + timedelta(days=3)
+        start = timezone.make_aware(datetime.combine(self.day, time(11, 0)))
+        BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            status="ACCEPTED",
+            hourly_rate=20.00,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.parent_user)
+
+    def test_subtract_intervals(self):
+        free = [(0, 10), (20, 30)]
+        busy = [(2, 4), (3, 5), (8, 22), (29, 40)]
+        self.assertEqual(subtract_intervals(free, busy), [(0, 2), (5, 8), (22, 29)])
+
+    def test_booking_is_removed_from_free_windows(self):
+        response = self.client.get(
+            f"/api/parent/listings/{self.babysitter.id}/free-slots/",
+            {"from": self.day.isoformat(), "to": self.day.isoformat()},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(s["start_time"], s["end_time"]) for s in response.data],
+            [("09:00", "11:00"), ("13:00", "17:00")],
+        )
+
+        response = self.client.get(
+            f"/api/parent/listings/{self.babysitter.id}/free-slots/",
+            {"from": self.day.isoformat(), "to": self.day.isoformat(), "min_duration": 180},
+        )
+        self.assertEqual([s["start_time"] for s in response.data], ["13:00"])
+
+    def test_query_count_does_not_depend_on_range(self):
+        url = f"/api/parent/listings/{self.babysitter.id}/free-slots/"
+        with self.assertNumQueries(3):
+            short = self.client.get(url, {"from": self.day.isoformat(), "to": self.day.isoformat()})
+        to_date = self.day + timedelta(days=29)
+        with self.assertNumQueries(3):
+            long = self.client.get(url, {"from": self.day.isoformat(), "to": to_date.isoformat()})
+        self.assertEqual(len(short.data), 2)
+        self.assertEqual(len(long.data), 31)
+
+
+class AvailabilitySearchTests(TestCase):
+    """Tests for searching babysitters free in a given time window"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com",
+            first_name="John",
+            last_name="Doe",
+            role="PARENT",
+            password="testpass123",
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.day = timezone.localdate() + timedelta(days=5)
+        self.free, self.booked, self.away = [
+            User.objects.create_user(
+                email=f"{name}@test.com",
+                first_name=name.title(),
+                role="BABYSITTER",
+                password="testpass123",
+            )
+            for name in ("free", "booked", "away")
+        ]
+        for sitter in (self.free, self.booked):
+            BabysitterAvailability.objects.create(
+                babysitter=sitter,
+                day_of_week=self.day.weekday(),
+                start_time=time(8, 0),
+                end_time=time(20, 0),
+            )
+        BabysitterAvailability.objects.create(
+            babysitter=self.away,
+            day_of_week=(self.day.weekday() + 1) % 7,
+            start_time=time(8, 0),
+            end_time=time(20, 0),
+        )
+        start = timezone.make_aware(datetime.combine(self.day, time(17, 0)))
+        BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.booked,
+            start_date=start,
+            end_date=start + timedelta(hours=3),
+            status="ACCEPTED",
+            hourly_rate=20.00,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.parent_user)
+
+    def test_search_returns_only_free_babysitters(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                "/api/parent/listings/search/",
+                {"date": self.day.isoformat(), "start_time": "18:00", "end_time": "19:00"},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["id"] for row in response.data], [str(self.free.id)])
+
+        response = self.client.get(
+            "/api/parent/listings/search/",
+            {"date": self.day.isoformat(), "start_time": "09:00", "end_time": "12:00"},
+        )
+        self.assertEqual(
+            {row["id"] for row in response.data}, {str(self.free.id), str(self.booked.id)}
+        )
+
+    def test_incomplete_window_is_rejected(self):
+        response = self.client.get(
+            "/api/parent/listings/search/", {"date": self.day.isoformat()}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class AvailabilityBitmapTests(TestCase):
+    """Tests for the packed weekly availability bitmap"""
+
+    def setUp(self):
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        self.slot = BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=0,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+        )
+
+    def test_bitmap_rebuilt_on_slot_changes(self):
+        bitmap = get_availability_bitmap(self.babysitter.id)
+        self.assertEqual(bitmap, slot_mask(0, time(9, 0), time(12, 0)))
+        self.assertEqual(bin(bitmap).count("1"), 12)
+
+        self.slot.delete()
+        self.assertEqual(get_availability_bitmap(self.babysitter.id), 0)
+
+    def test_coverage_check_reads_only_the_bitmap(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(covers_window(self.babysitter.id, 0, time(9, 30), time(11, 0)))
+        with self.assertNumQueries(1):
+            self.assertFalse(covers_window(self.babysitter.id, 0, time(11, 0), time(13, 0)))
+
+    def test_overlapping_slot_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            BabysitterAvailability.objects.create(
+                babysitter=self.babysitter,
+                day_of_week=0,
+                start_time=time(11, 30),
+                end_time=time(14, 0),
+            )
+        BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=0,
+            start_time=time(12, 0),
+            end_time=time(14, 0),
+        )
+        self.assertTrue(covers_window(self.babysitter.id, 0, time(11, 0), time(13, 0)))
+
+    def test_unaligned_slots_fall_back_to_rows(self):
+        BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=1,
+            start_time=time(9, 10),
+            end_time=time(10, 50),
+        )
+        self.assertIsNone(get_availability_bitmap(self.babysitter.id))
+        self.assertTrue(covers_window(self.babysitter.id, 1, time(9, 20), time(10, 40)))
+        self.assertFalse(covers_window(self.babysitter.id, 1, time(9, 0), time(10, 0)))
+
+    def test_touching_slots_cover_window_on_every_path(self):
+        BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=0,
+            start_time=time(12, 0),
+            end_time=time(15, 0),
+        )
+        monday = timezone.localdate() + timedelta(days=7 - timezone.localdate().weekday())
+        babysitters = User.objects.filter(pk=self.babysitter.pk)
+
+        def search(start, end):
+            window = [
+                timezone.make_aware(datetime.combine(monday, t)) for t in (start, end)
+            ]
+            return filter_available(babysitters, *window).exists()
+
+        def check():
+            self.assertTrue(covers_window(self.babysitter.id, 0, time(11, 0), time(13, 0)))
+            self.assertTrue(covers_window(self.babysitter.id, 0, time(11, 20), time(13, 40)))
+            self.assertFalse(covers_window(self.babysitter.id, 0, time(11, 0), time(16, 0)))
+            self.assertTrue(search(time(11, 0), time(13, 0)))
+            self.assertTrue(search(time(11, 20), time(13, 40)))
+            self.assertFalse(search(time(11, 0), time(16, 0)))
+            self.assertFalse(search(time(8, 0), time(10, 0)))
+
+        # Aligned slots: the bitmap answers aligned windows
+        self.assertIsNotNone(get_availability_bitmap(self.babysitter.id))
+        check()
+
+        # An unaligned slot makes the bitmap inexact, so every window reads rows
+        BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=0,
+            start_time=time(16, 10),
+            end_time=time(17, 50),
+        )
+        self.assertIsNone(get_availability_bitmap(self.babysitter.id))
+        check()
+
+
+class AvailabilityBulkReplaceTests(TestCase):
+    """Tests for PUT /babysitter/availability/bulk/"""
+
+    url = "/api/parent/babysitter/availability/bulk/"
+
+    def setUp(self):
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            last_name="Smith",
+            role="BABYSITTER",
+            password="testpass123",
+        )
+        self.kept = BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=0,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+        )
+        BabysitterAvailability.objects.create(
+            babysitter=self.babysitter,
+            day_of_week=1,
+            start_time=time(9, 0),
+            end_time=time(12, 0),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.babysitter)
+
+    def test_replaces_schedule_with_few_queries(self):
+        slots = [{"day_of_week": 0, "start_time": "09:00", "end_time": "12:00"}] + [
+            {"day_of_week": day, "start_time": f"{hour:02d}:00", "end_time": f"{hour + 1:02d}:00"}
+            for day in range(2, 7)
+            for hour in (8, 10, 14, 18)
+        ]
+        with self.assertNumQueries(9):
+            response = self.client.put(self.url, {"slots": slots}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 21)
+        stored = BabysitterAvailability.objects.filter(babysitter=self.babysitter)
+        self.assertEqual(stored.count(), 21)
+        self.assertTrue(stored.filter(pk=self.kept.pk).exists())
+        self.assertFalse(stored.filter(day_of_week=1).exists())
+        self.assertTrue(covers_window(self.babysitter.id, 6, time(18, 0), time(19, 0)))
+        self.assertFalse(covers_window(self.babysitter.id, 1, time(9, 0), time(10, 0)))
+
+    def test_overlapping_slots_are_rejected_without_changes(self):
+        slots = [
+            {"day_of_week": 3, "start_time": "09:00", "end_time": "17:00"},
+            {"day_of_week": 3, "start_time": "10:00", "end_time": "11:00"},
+            {"day_of_week": 3, "start_time": "12:00", "end_time": "13:00"},
+        ]
+        response = self.client.put(self.url, {"slots": slots}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Thursday", str(response.data["slots"]))
+        self.assertEqual(
+            BabysitterAvailability.objects.filter(babysitter=self.babysitter).count(), 2
+        )
+
+
+class SeedLoadTests(TestCase):
+    """Tests for the seed_load synthetic data generator"""
+
+    def seed(self):
+        call_command(
+            "seed_load",
+            parents=20,
+            babysitters=8,
+            bookings=200,
+            seed=42,
+            anchor=date(2026, 3, 2),
+            batch_size=50,
+            stdout=StringIO(),
+        )
+        return list(
+            BabysitterRequest.objects.order_by("id").values_list(
+                "id", "status", "start_date", "end_date", "child_id"
+            )
+        )
+
+    def test_generates_requested_volumes_consistently(self):
+        bookings = self.seed()
+
+        self.assertEqual(len(bookings), 200)
+        self.assertEqual(User.objects.filter(role="PARENT").count(), 20)
+        self.assertEqual(User.objects.filter(role="BABYSITTER").count(), 8)
+        self.assertTrue(BabysitterReview.objects.exists())
+        self.assertEqual(
+            {status for _, status, *_ in bookings},
+            {"PENDING", "ACCEPTED", "REJECTED", "CANCELLED", "COMPLETED"},
+        )
+        # Accepted/completed bookings never overlap for the same babysitter
+        for booking in BabysitterRequest.objects.blocking():
+            self.assertIsNone(
+                BabysitterRequest.objects.find_conflict(
+                    booking.babysitter_id,
+                    booking.start_date,
+                    booking.end_date,
+                    exclude_id=booking.id,
+                )
+            )
+        stats = BabysitterStats.objects.get(
+            babysitter=BabysitterReview.objects.first().babysitter
+        )
+        self.assertGreater(stats.total_reviews, 0)
+        self.assertIsNotNone(get_availability_bitmap(stats.babysitter_id))
+
+    def test_same_seed_gives_same_data(self):
+        first = self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
+        call_command("seed_load", flush=True, parents=0, babysitters=0, stdout=StringIO())
+        self.assertFalse(BabysitterRequest.objects.exists())
+        self.assertEqual(self.seed(), first)
+
+    def test_flush_fires_delete_signals_and_keeps_other_users_consistent(self):
+        self.seed()
+        outsider = User.objects.create_user(
+            email="outsider@test.com", first_name="Out", role="BABYSITTER", password="x"
+        )
+        other_parent = ParentProfile.objects.create(
+            user=User.objects.create_user(
+                email="other-parent@test.com", first_name="Other", role="PARENT", password="x"
+            )
+        )
+        BabysitterAvailability.objects.create(
+            babysitter=outsider, day_of_week=0, start_time=time(9), end_time=time(17)
+        )
+        bitmap = get_availability_bitmap(outsider.pk)
+        seeded_booking = BabysitterRequest.objects.filter(status="COMPLETED").first()
+        for parent, rating in ((seeded_booking.parent, 1), (other_parent, 5)):
+            booking = BabysitterRequest.objects.get(pk=seeded_booking.pk)
+            booking.pk = None
+            booking.parent = parent
+            booking.babysitter = outsider
+            booking.save()
+            BabysitterReview.objects.create(
+                booking=booking, parent=parent, babysitter=outsider, rating=rating
+            )
+        self.assertEqual(BabysitterStats.objects.get(babysitter=outsider).total_reviews, 2)
+        version_key = VERSION_KEY.format(user_id=outsider.pk)
+        version = get_card_cache().get(version_key)
+
+        receiver = Mock()
+        post_delete.connect(receiver, sender=BabysitterReview)
+        self.addCleanup(post_delete.disconnect, receiver, sender=BabysitterReview)
+        flush_seeded("load", batch_size=20)
+        receiver.assert_called()
+
+        self.assertEqual(
+            sorted(User.objects.values_list("email", flat=True)),
+            ["other-parent@test.com", "outsider@test.com"],
+        )
+        for model in (BabysitterStory, ChildProfile):
+            self.assertFalse(model.objects.exists())
+        self.assertEqual(BabysitterReview.objects.get().parent, other_parent)
+        stats = BabysitterStats.objects.get(babysitter=outsider)
+        self.assertEqual((stats.total_reviews, stats.average_rating), (1, 5))
+        self.assertNotEqual(get_card_cache().get(version_key), version)
+        self.assertEqual(get_availability_bitmap(outsider.pk), bitmap)
+
+
+class BookingEagerLoadingTests(TestCase):
+    """Booking list endpoints run a fixed number of queries regardless of size"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        cls.parent_profile = ParentProfile.objects.create(user=cls.parent_user)
+        cls.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        child = ChildProfile.objects.create(
+            parent=cls.parent_profile, name="Emma", date_of_birth="2020-01-01"
+        )
+        start = timezone.now() - timedelta(days=300)
+        bookings = BabysitterRequest.objects.bulk_create(
+            [
+                BabysitterRequest(
+                    parent=cls.parent_profile,
+                    child=child,
+                    babysitter=cls.babysitter,
+                    start_date=start + timedelta(days=i),
+                    end_date=start + timedelta(days=i, hours=2),
+                    status="COMPLETED",
+                    hourly_rate=15,
+                )
+                for i in range(200)
+            ]
+        )
+        BabysitterReview.objects.bulk_create(
+            [
+                BabysitterReview(
+                    booking=booking,
+                    parent=cls.parent_profile,
+                    babysitter=cls.babysitter,
+                    rating=5,
+                )
+                for booking in bookings
+            ]
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_parent_lists_are_constant(self):
+        for url in [
+            "/api/parent/requests/",
+            "/api/parent/requests/past/",
+            "/api/parent/history/",
+            "/api/parent/reviews/",
+        ]:
+            # Fresh user each time so the parent profile lookup is not cached
+            self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+            with self.subTest(url=url), self.assertNumQueries(3):
+                response = self.client.get(url, {"page_size": 200})
+            self.assertEqual(len(response.data), 200)
+        self.assertEqual(response.data[0]["parent_info"]["email"], "parent@test.com")
+
+    def test_babysitter_lists_are_constant(self):
+        self.client.force_authenticate(self.babysitter)
+        for url in [
+            "/api/parent/babysitter/bookings/past/",
+            "/api/parent/babysitter/history/",
+            "/api/parent/babysitter/reviews/",
+        ]:
+            with self.subTest(url=url), self.assertNumQueries(2):
+                response = self.client.get(url, {"page_size": 200})
+            self.assertEqual(len(response.data), 200)
+
+    def test_detail_includes_nested_review(self):
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        booking = BabysitterRequest.objects.first()
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/parent/requests/{booking.id}/")
+        self.assertEqual(response.data["review"]["rating"], 5)
+        self.assertEqual(response.data["child"]["parent"]["user"]["email"], "parent@test.com")
+
+
+class SparseFieldsTests(TestCase):
+    """?fields= and ?expand= trim the payload and the joins behind it"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.child = ChildProfile.objects.create(
+            parent=self.parent_profile, name="Emma", date_of_birth="2020-01-01"
+        )
+        start = timezone.now() - timedelta(days=3)
+        self.booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            child=self.child,
+            babysitter=self.babysitter,
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            status="COMPLETED",
+            hourly_rate=15,
+        )
+        BabysitterReview.objects.create(
+            booking=self.booking, parent=self.parent_profile, babysitter=self.babysitter, rating=5
+        )
+        self.client = APIClient()
+        self.url = f"/api/parent/requests/{self.booking.id}/"
+
+    def get(self, url, params=None):
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, queries[-1]["sql"]
+
+    def test_fields_keep_only_requested_keys_and_joins(self):
+        response, sql = self.get(self.url, {"fields": "id,status,child.name"})
+
+        self.assertEqual(set(response.data), {"id", "status", "child"})
+        self.assertEqual(response.data["child"], {"name": "Emma"})
+        self.assertIn("parent_childprofile", sql)
+        self.assertNotIn("parent_babysitterreview", sql)
+        self.assertNotIn("account_user", sql)
+
+    def test_expand_collapses_other_relations(self):
+        response, sql = self.get(self.url, {"expand": "child"})
+
+        self.assertEqual(response.data["parent"], self.parent_profile.id)
+        self.assertEqual(response.data["babysitter_info"], self.babysitter.id)
+        self.assertNotIn("review", response.data)
+        self.assertEqual(response.data["child"]["name"], "Emma")
+        self.assertEqual(response.data["child"]["parent"], self.parent_profile.id)
+        self.assertNotIn("parent_babysitterreview", sql)
+
+        response, _ = self.get(self.url, {"expand": "child.parent.user"})
+        self.assertEqual(response.data["child"]["parent"]["user"]["email"], "parent@test.com")
+
+    def test_full_payload_without_parameters(self):
+        response, sql = self.get(self.url)
+
+        self.assertEqual(response.data["review"]["rating"], 5)
+        self.assertEqual(response.data["child"]["parent"]["user"]["email"], "parent@test.com")
+        self.assertIn("parent_babysitterreview", sql)
+
+    def test_babysitter_detail_skips_reviews_query(self):
+        url = f"/api/parent/listings/{self.babysitter.id}/"
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        with CaptureQueriesContext(connection) as full:
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["reviews"]), 1)
+
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        with CaptureQueriesContext(connection) as sparse:
+            response = self.client.get(url, {"expand": ""})
+        self.assertNotIn("reviews", response.data)
+        self.assertEqual(len(sparse), len(full) - 1)
+
+
+class RendererTests(TestCase):
+    """The fast JSON renderer matches JSONRenderer byte for byte"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.child = ChildProfile.objects.create(
+            parent=self.parent_profile, name="Émma", date_of_birth="2020-01-01"
+        )
+        start = timezone.now() - timedelta(days=3)
+        self.booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            child=self.child,
+            babysitter=self.babysitter,
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            status="COMPLETED",
+            hourly_rate=Decimal("15.50"),
+            special_requirements="Line\u2028separator",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.parent_user)
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_output_matches_json_renderer(self):
+        kathmandu = timezone.get_fixed_timezone(345)
+        data = {
+            "id": uuid.uuid4(),
+            "rate": Decimal("12.34"),
+            "utc": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            "local": datetime(2025, 1, 2, 3, 4, 5, tzinfo=kathmandu),
+            "day": date(2025, 1, 2),
+            "at": time(9, 30),
+            "text": "Émma\u2028\u2029</script>",
+            "nested": [{"n": 1, "f": 1.5, "none": None, "yes": True}],
+            1: "int key",
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+        # Non-finite floats are rejected like JSONRenderer does under STRICT_JSON
+        for value in (float("nan"), float("inf"), Decimal("-Infinity")):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({"nested": [{"f": value}]})
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render({"nested": [{"f": value}]})
+
+        # Exponents are written without padding; the parsed values are equal
+        small = {"f": 1.5e-7, "big": 1e16}
+        self.assertEqual(FastJSONRenderer().render(small), b'{"f":1.5e-7,"big":1e16}')
+        self.assertEqual(
+            json.loads(FastJSONRenderer().render(small)),
+            json.loads(JSONRenderer().render(small)),
+        )
+
+    def test_indented_output_falls_back_to_json_renderer(self):
+        data = {"a": [1, 2], "b": Decimal("1.5")}
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_api_responses_use_fast_renderer(self):
+        response = self.client.get(f"/api/parent/requests/{self.booking.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+        self.assertEqual(json.loads(response.content)["child"]["name"], "Émma")
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_msgpack_negotiation(self):
+        url = f"/api/parent/requests/{self.booking.id}/"
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        as_json = json.loads(self.client.get(url).content)
+        self.assertEqual(msgpack.unpackb(response.content, raw=False), as_json)
+
+    @skipIf(msgpack, "msgpack is installed")
+    def test_msgpack_not_offered_without_msgpack(self):
+        response = self.client.get(
+            f"/api/parent/requests/{self.booking.id}/", HTTP_ACCEPT="application/msgpack"
+        )
+        self.assertEqual(response.status_code, 406)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_renderers", rows=5, repeat=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("booking_details", output)
+        self.assertIn("drf-json", output)
+        if orjson is not None:
+            self.assertIn("fast-json", output)
+
+    def test_benchmark_command_without_data(self):
+        BabysitterRequest.objects.all().delete()
+        User.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command("benchmark_renderers", stdout=StringIO())
+
+
+class ValuesReadTests(TestCase):
+    """The values read path renders exactly what the serializers render"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com",
+            first_name="Jane",
+            role="BABYSITTER",
+            password="testpass123",
+            phone_number="555-0100",
+        )
+        self.child = ChildProfile.objects.create(
+            parent=self.parent_profile, name="Emma", date_of_birth="2020-01-01"
+        )
+        start = timezone.now() - timedelta(days=10)
+        for day, child, babysitter, total in [
+            (0, self.child, self.babysitter, Decimal("45.00")),
+            (1, self.child, self.babysitter, None),
+            (2, None, self.babysitter, Decimal("7.5")),
+            (3, self.child, None, Decimal("30.00")),
+        ]:
+            BabysitterRequest.objects.create(
+                parent=self.parent_profile,
+                child=child,
+                babysitter=babysitter,
+                start_date=start + timedelta(days=day),
+                end_date=start + timedelta(days=day, hours=2, minutes=20),
+                status="COMPLETED",
+                hourly_rate=Decimal("15.50"),
+                total_cost=total,
+            )
+        for day in (0, 3, 6):
+            BabysitterAvailability.objects.create(
+                babysitter=self.babysitter,
+                day_of_week=day,
+                start_time=time(9, 0),
+                end_time=time(17, 30),
+            )
+        self.client = APIClient()
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def serializer_output(self, serializer_class, queryset, request_path):
+        request = Request(APIRequestFactory().get(request_path))
+        return self.render(serializer_class(queryset, many=True, context={"request": request}).data)
+
+    def test_reader_output_matches_serializers(self):
+        cases = [
+            (BookingHistorySerializer, BabysitterRequest.objects.order_by("start_date")),
+            (BabysitterAvailabilitySerializer, BabysitterAvailability.objects.order_by("day_of_week")),
+            (AdminUserListSerializer, User.objects.order_by("email")),
+        ]
+        for (serializer_class, queryset), tz in product(cases, ["UTC", "Asia/Kathmandu"]):
+            with self.subTest(serializer=serializer_class.__name__, tz=tz), timezone.override(tz):
+                reader = values_reader(serializer_class())
+                self.assertIsNotNone(reader)
+                with self.assertNumQueries(1):
+                    rows = reader.rows(reader.values(queryset))
+                self.assertEqual(
+                    self.render(rows), self.serializer_output(serializer_class, queryset, "/")
+                )
+
+    def test_history_endpoint_pages_match_serializer(self):
+        self.client.force_authenticate(self.parent_user)
+        url = "/api/parent/history/?page_size=2"
+        bodies = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            bodies.extend(json.loads(response.content))
+            url = response.headers.get("X-Next-Cursor") and (
+                f"/api/parent/history/?page_size=2&cursor={response.headers['X-Next-Cursor']}"
+            )
+
+        queryset = BabysitterRequest.objects.order_by("-start_date", "-id")
+        expected = self.serializer_output(BookingHistorySerializer, queryset, "/api/parent/history/")
+        self.assertEqual(bodies, json.loads(expected))
+        # The booking whose child was removed has no child_name, as before
+        self.assertEqual(sum("child_name" not in row for row in bodies), 1)
+
+    def test_availability_and_admin_lists_match_serializer(self):
+        self.client.force_authenticate(self.babysitter)
+        response = self.client.get("/api/parent/babysitter/availability/")
+        queryset = BabysitterAvailability.objects.order_by("day_of_week", "start_time")
+        self.assertEqual(
+            response.content, self.serializer_output(BabysitterAvailabilitySerializer, queryset, "/")
+        )
+
+        admin = User.objects.create_superuser(
+            email="admin@test.com", password="testpass123", first_name="Admin"
+        )
+        self.client.force_authenticate(admin)
+        response = self.client.get("/api/account/users/?page_size=2&page=2")
+        queryset = User.objects.order_by("-created_at")[2:4]
+        self.assertEqual(
+            response.content, self.serializer_output(AdminUserListSerializer, queryset, "/")
+        )
+
+    def test_unsupported_serializers_use_regular_path(self):
+        # Nested many=True, file URLs and method fields without values_columns
+        self.assertIsNone(values_reader(BookingSeriesSerializer()))
+        self.assertIsNone(values_reader(BabysitterListSerializer()))
+        self.assertIsNone(values_reader(BabysitterStorySerializer()))
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_read_paths", rows=5, repeat=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("BookingHistorySerializer", output)
+        self.assertIn("values", output)
+
+
+class ResponseCompressionTests(TestCase):
+    """gzip/brotli response compression in parent/compression.py"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def middleware(self, view):
+        return CompressionMiddleware(lambda request: view(request))
+
+    def run_view(self, view, path="/api/parent/history/", accept="gzip, deflate, br"):
+        request = self.factory.get(path, HTTP_ACCEPT_ENCODING=accept)
+        middleware = self.middleware(view)
+        middleware.process_view(request, view, (), {})
+        return middleware(request)
+
+    def json_view(self, size=4000):
+        body = json.dumps([{"id": i, "name": "Emma"} for i in range(size // 25)])
+        return lambda request: HttpResponse(body, content_type="application/json")
+
+    def test_api_list_is_compressed_when_accepted(self):
+        parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        parent_profile = ParentProfile.objects.create(user=parent_user)
+        child = ChildProfile.objects.create(
+            parent=parent_profile, name="Emma", date_of_birth="2020-01-01"
+        )
+        start = timezone.now() - timedelta(days=30)
+        for day in range(20):
+            BabysitterRequest.objects.create(
+                parent=parent_profile,
+                child=child,
+                start_date=start + timedelta(days=day),
+                end_date=start + timedelta(days=day, hours=2),
+                status="COMPLETED",
+                hourly_rate=15,
+            )
+        client = APIClient()
+        client.force_authenticate(parent_user)
+
+        plain = client.get("/api/parent/history/")
+        self.assertNotIn("Content-Encoding", plain.headers)
+        response = client.get("/api/parent/history/", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_small_refused_and_ineligible_responses_are_left_alone(self):
+        def image(request):
+            return HttpResponse(b"\x89PNG" * 1000, content_type="image/png")
+
+        cases = [
+            (self.json_view(size=500), "/api/parent/history/", "gzip"),
+            (self.json_view(), "/api/parent/history/", "identity"),
+            (self.json_view(), "/api/parent/history/", "gzip;q=0, br;q=0"),
+            (self.json_view(), "/media/profile.json", "gzip"),
+            (image, "/api/parent/history/", "gzip"),
+            (no_compression(self.json_view()), "/api/parent/history/", "gzip"),
+        ]
+        for view, path, accept in cases:
+            with self.subTest(path=path, accept=accept):
+                response = self.run_view(view, path, accept)
+                self.assertNotIn("Content-Encoding", response.headers)
+
+    @override_settings(RESPONSE_COMPRESSION_MIN_SIZE=0)
+    def test_auth_responses_are_never_compressed(self):
+        User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        client = APIClient()
+
+        login = client.post(
+            "/api/account/login/",
+            {"email": "parent@test.com", "password": "testpass123"},
+            format="json",
+            HTTP_ACCEPT_ENCODING="gzip",
+        )
+        self.assertEqual(login.status_code, 200)
+        self.assertIn("access", login.json())
+        self.assertNotIn("Content-Encoding", login.headers)
+
+        # Other account endpoints are still compressed
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {login.json()['access']}")
+        me = client.get("/api/account/me/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(me["Content-Encoding"], "gzip")
+
+    def test_codec_negotiation(self):
+        gzip_codec, brotli_codec = GzipCodec(), SimpleNamespace(name="br")
+        codecs = [brotli_codec, gzip_codec]
+        self.assertIs(choose_codec("gzip, br", codecs), brotli_codec)
+        self.assertIs(choose_codec("br;q=0.5, gzip", codecs), gzip_codec)
+        self.assertIs(choose_codec("*", codecs), brotli_codec)
+        self.assertIs(choose_codec("*, br;q=0", codecs), gzip_codec)
+        self.assertIsNone(choose_codec("deflate, identity", codecs))
+        self.assertIsNone(choose_codec("", codecs))
+
+    def test_streaming_response_is_compressed_per_chunk(self):
+        chunks = [json.dumps({"n": i, "text": "x" * 200}).encode() + b"\n" for i in range(5)]
+        def view(request):
+            return StreamingHttpResponse(iter(chunks), content_type="application/json")
+
+        response = self.run_view(view, accept="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        decompressor = zlib.decompressobj(31)
+        # Every chunk can be decoded as soon as it arrives
+        received = [decompressor.decompress(part) for part in response.streaming_content]
+        self.assertEqual(received[: len(chunks)], chunks)
+        self.assertTrue(decompressor.eof)
+
+    def test_async_streaming_response_is_compressed(self):
+        async def chunks():
+            for i in range(3):
+                yield f"line {i}\n".encode() * 100
+
+        def view(request):
+            return StreamingHttpResponse(chunks(), content_type="text/plain")
+
+        response = self.run_view(view, accept="gzip")
+
+        async def read():
+            return b"".join([part async for part in response.streaming_content])
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        expected = b"".join(f"line {i}\n".encode() * 100 for i in range(3))
+        self.assertEqual(gzip.decompress(asyncio.run(read())), expected)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("benchmark_compression", stdout=out)
+
+        User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        call_command("benchmark_compression", repeat=2, stdout=out)
+        self.assertIn("gzip-6", out.getvalue())
+
+
+class ParentStoryFeedTests(TestCase):
+    """Tests for the parent story feed query and ?since= polling"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        child = ChildProfile.objects.create(
+            parent=self.parent_profile, name="Emma", date_of_birth="2020-01-01"
+        )
+        now = timezone.now()
+        self.booking = BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            child=child,
+            babysitter=self.babysitter,
+            start_date=now - timedelta(hours=1),
+            end_date=now + timedelta(hours=3),
+            status="ACCEPTED",
+            hourly_rate=15,
+        )
+        for i in range(5):
+            self.post_story(f"Update {i}")
+        self.client = APIClient()
+        self.url = "/api/parent/stories/"
+
+    def post_story(self, content):
+        return BabysitterStory.objects.create(
+            booking=self.booking, babysitter=self.babysitter, content=content
+        )
+
+    def get(self, params=None):
+        # Fresh user so the parent profile lookup is part of every request
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        return self.client.get(self.url, params or {})
+
+    def test_feed_is_one_joined_query(self):
+        self.client.force_authenticate(User.objects.get(pk=self.parent_user.pk))
+        # Profile lookup, conditional GET validator, feed
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(response.data[0]["content"], "Update 4")
+        self.assertEqual(response.data[0]["booking_info"]["child_name"], "Emma")
+        self.assertEqual(response.data[0]["booking_info"]["parent_email"], "parent@test.com")
+
+    def test_since_returns_only_newer_stories(self):
+        since = self.get()["X-Since-Cursor"]
+
+        empty = self.get({"since": since})
+        self.assertEqual(empty.data, [])
+        self.assertEqual(empty["X-Since-Cursor"], since)
+
+        self.post_story("Update 5")
+        self.post_story("Update 6")
+        response = self.get({"since": since})
+        self.assertEqual([s["content"] for s in response.data], ["Update 6", "Update 5"])
+        self.assertNotEqual(response["X-Since-Cursor"], since)
+        self.assertEqual(self.get({"since": response["X-Since-Cursor"]}).data, [])
+
+    def test_invalid_since_is_404(self):
+        self.assertEqual(self.get({"since": "garbage"}).status_code, 404)
+
+
+class RecordingEventBackend(BaseEventBackend):
+    """Collects published events instead of delivering them"""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, channel, event):
+        self.published.append((channel, event["type"], event["data"]))
+
+
+@override_settings(PARENT_EVENT_BACKEND="parent.tests.RecordingEventBackend")
+class EventPublishingTests(TestCase):
+    """Booking and story changes are published to the users involved"""
+
+    def setUp(self):
+        get_event_backend().published.clear()
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.booking = BabysitterRequest.objects.create(
+                parent=self.parent_profile,
+                babysitter=self.babysitter,
+                start_date=now - timedelta(hours=1),
+                end_date=now + timedelta(hours=3),
+                hourly_rate=15,
+            )
+        self.backend = get_event_backend()
+
+    def test_new_request_is_pushed_to_babysitter(self):
+        self.assertEqual(
+            [(c, t) for c, t, _ in self.backend.published],
+            [(user_channel(self.babysitter.id), "booking.created")],
+        )
+
+    def test_status_change_is_pushed_to_both_sides(self):
+        self.backend.published.clear()
+        client = APIClient()
+        client.force_authenticate(self.babysitter)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                f"/api/parent/babysitter/requests/{self.booking.id}/accept/"
+            )
+        self.assertEqual(response.status_code, 200)
+
+        channels = {channel for channel, _, _ in self.backend.published}
+        self.assertEqual(
+            channels,
+            {user_channel(self.parent_user.id), user_channel(self.babysitter.id)},
+        )
+        _, event_type, data = self.backend.published[0]
+        self.assertEqual(event_type, "booking.status")
+        self.assertEqual((data["previous_status"], data["status"]), ("PENDING", "ACCEPTED"))
+
+    def test_loaded_status_is_tracked_without_post_init(self):
+        self.assertFalse(post_init.has_listeners(BabysitterRequest))
+        booking = BabysitterRequest.objects.get(pk=self.booking.pk)
+        self.assertEqual(booking._loaded_status, "PENDING")
+        deferred = BabysitterRequest.objects.only("id").get(pk=self.booking.pk)
+        self.assertIsNone(deferred._loaded_status)
+
+    def test_accept_declines_overlapping_pending_requests(self):
+        other_parent = User.objects.create_user(
+            email="other@test.com", first_name="Ann", role="PARENT", password="testpass123"
+        )
+        other_profile = ParentProfile.objects.create(user=other_parent)
+
+        def request_at(start_hours, end_hours, status="PENDING"):
+            return BabysitterRequest.objects.create(
+                parent=other_profile,
+                babysitter=self.babysitter,
+                status=status,
+                start_date=self.booking.start_date + timedelta(hours=start_hours),
+                end_date=self.booking.start_date + timedelta(hours=end_hours),
+                hourly_rate=15,
+            )
+
+        overlapping = request_at(2, 6)
+        adjacent = request_at(4, 6)
+        cancelled = request_at(1, 2, status="CANCELLED")
+        self.backend.published.clear()
+
+        client = APIClient()
+        client.force_authenticate(self.babysitter)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post(
+                f"/api/parent/babysitter/requests/{self.booking.id}/accept/"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["declined_ids"], [overlapping.id])
+        statuses = dict(
+            BabysitterRequest.objects.filter(
+                pk__in=[overlapping.pk, adjacent.pk, cancelled.pk]
+            ).values_list("id", "status")
+        )
+        self.assertEqual(
+            statuses,
+            {overlapping.id: "REJECTED", adjacent.id: "PENDING", cancelled.id: "CANCELLED"},
+        )
+        declined = [
+            (channel, data)
+            for channel, _, data in self.backend.published
+            if data["id"] == overlapping.id
+        ]
+        self.assertEqual(
+            {channel for channel, _ in declined},
+            {user_channel(other_parent.id), user_channel(self.babysitter.id)},
+        )
+        self.assertEqual(declined[0][1]["reason"], "overlapping_booking_accepted")
+
+    def test_saving_without_status_change_is_silent(self):
+        self.backend.published.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.booking.special_requirements = "Bring snacks"
+            self.booking.save()
+        self.assertEqual(self.backend.published, [])
+
+    def test_story_is_pushed_to_parent(self):
+        self.booking.status = "ACCEPTED"
+        self.booking.save()
+        self.backend.published.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            story = BabysitterStory.objects.create(
+                booking=self.booking, babysitter=self.babysitter, content="Lunch done"
+            )
+        self.assertEqual(
+            self.backend.published,
+            [
+                (
+                    user_channel(self.parent_user.id),
+                    "story.created",
+                    {
+                        "id": story.id,
+                        "booking_id": self.booking.id,
+                        "babysitter_id": self.babysitter.id,
+                        "created_at": story.created_at,
+                    },
+                )
+            ],
+        )
+
+
+class EventStreamTests(TestCase):
+    """Tests for the server-sent events ASGI endpoint"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+
+    def scope(self, token=""):
+        return {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/events/stream/",
+            "query_string": f"token={token}".encode(),
+            "headers": [],
+        }
+
+    async def test_rejects_missing_or_bad_token(self):
+        for token in ["", "not-a-jwt"]:
+            sent = []
+
+            async def send(message):
+                sent.append(message)
+
+            await event_stream(self.scope(token), None, send)
+            self.assertEqual(sent[0]["status"], 401)
+
+    async def test_streams_published_events_until_disconnect(self):
+        token = str(AccessToken.for_user(self.user))
+        chunks = asyncio.Queue()
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            await chunks.put(message)
+
+        stream = asyncio.ensure_future(event_stream(self.scope(token), receive, send))
+        start = await asyncio.wait_for(chunks.get(), 5)
+        self.assertEqual(start["status"], 200)
+        self.assertIn((b"content-type", b"text/event-stream"), start["headers"])
+        self.assertIn(b": connected", (await asyncio.wait_for(chunks.get(), 5))["body"])
+
+        event = {"id": 7, "type": "story.created", "data": {"id": "abc"}}
+        delivered = await asyncio.to_thread(
+            get_event_backend().publish, user_channel(self.user.id), event
+        )
+        self.assertEqual(delivered, 1)
+        body = (await asyncio.wait_for(chunks.get(), 5))["body"].decode()
+        self.assertTrue(body.startswith("id: 7\nevent: story.created\ndata: "))
+        self.assertEqual(json.loads(body.split("data: ", 1)[1]), event)
+
+        disconnect.set()
+        await asyncio.wait_for(stream, 5)
+        self.assertEqual(get_event_backend().publish(user_channel(self.user.id), event), 0)
+
+
+def make_jpeg(width, height, name="photo.jpg"):
+    """An in-memory JPEG upload carrying EXIF data"""
+    buffer = BytesIO()
+    exif = Image.Exif()
+    exif[0x010F] = "TestCamera"  # Make
+    Image.new("RGB", (width, height), (200, 100, 50)).save(buffer, "JPEG", exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+class ImageRenditionTests(TestCase):
+    """Uploaded pictures get resized WebP/JPEG renditions from a background job"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        ParentProfile.objects.create(user=self.parent_user)
+
+    def upload(self, image):
+        profile, _ = UserProfile.objects.get_or_create(user=self.babysitter)
+        profile.profile_picture = image
+        profile.save()
+        self.assertEqual(run_pending(), 1)
+        profile.refresh_from_db()
+        return profile
+
+    def test_renditions_are_resized_and_stripped(self):
+        profile = self.upload(make_jpeg(2000, 1200))
+        renditions = profile.profile_picture_renditions
+
+        self.assertEqual(renditions["source"], profile.profile_picture.name)
+        self.assertEqual((renditions["card"]["width"], renditions["card"]["height"]), (480, 360))
+        self.assertEqual((renditions["full"]["width"], renditions["full"]["height"]), (1600, 960))
+        for extension, expected in [("webp", "WEBP"), ("jpeg", "JPEG")]:
+            with default_storage.open(renditions["thumb"]["files"][extension]) as stored:
+                image = Image.open(stored)
+                self.assertEqual(image.format, expected)
+                self.assertEqual(image.size, (128, 128))
+                self.assertEqual(len(image.getexif()), 0)
+
+    def test_listing_exposes_rendition_urls(self):
+        self.upload(make_jpeg(800, 600))
+        client = APIClient()
+        client.force_authenticate(self.parent_user)
+        response = client.get(f"/api/parent/listings/{self.babysitter.id}/")
+
+        renditions = response.data["profile"]["profile_picture_renditions"]
+        self.assertTrue(renditions["card"]["webp"].startswith("http://testserver/media/renditions/"))
+        self.assertTrue(renditions["card"]["webp"].endswith("/card.webp"))
+
+    def test_replacing_image_removes_old_renditions(self):
+        old = self.upload(make_jpeg(800, 600, "first.jpg")).profile_picture_renditions
+        profile = self.upload(make_jpeg(600, 800, "second.jpg"))
+
+        self.assertFalse(default_storage.exists(old["card"]["files"]["webp"]))
+        self.assertTrue(
+            default_storage.exists(profile.profile_picture_renditions["card"]["files"]["webp"])
+        )
+
+    def test_renditions_pending_until_generated(self):
+        profile = UserProfile.objects.create(user=self.babysitter)
+        UserProfile.objects.filter(pk=profile.pk).update(profile_picture="profiles/x.jpg")
+        profile.refresh_from_db()
+        self.assertIsNone(rendition_urls(profile, "profile_picture"))
+
+
+JOB_CALLS = []
+
+
+@job(max_attempts=2)
+def record_call(value):
+    JOB_CALLS.append(value)
+
+
+@job(max_attempts=2)
+def always_fail():
+    raise ValueError("boom")
+
+
+class JobQueueTests(TestCase):
+    """Jobs are claimed once, retried with backoff and recovered after a lost lease"""
+
+    def setUp(self):
+        JOB_CALLS.clear()
+
+    def test_enqueued_job_runs_and_is_removed(self):
+        enqueue(record_call, "hello")
+
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(JOB_CALLS, ["hello"])
+        self.assertFalse(Job.objects.exists())
+
+    def test_delayed_job_waits_until_due(self):
+        queued = enqueue(record_call, "later", delay=timedelta(minutes=5))
+
+        self.assertEqual(run_pending(), 0)
+        self.assertIsNone(claim_job("worker", now=queued.run_at - timedelta(seconds=1)))
+        self.assertIsNotNone(claim_job("worker", now=queued.run_at))
+
+    def test_failing_job_is_retried_then_marked_failed(self):
+        queued = enqueue(always_fail)
+        before = timezone.now()
+
+        with self.assertLogs("parent.jobs", "WARNING"):
+            self.assertFalse(run_job(claim_job("worker"), "worker"))
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.Status.QUEUED)
+        self.assertEqual(queued.attempts, 1)
+        self.assertGreater(queued.run_at, before + timedelta(seconds=8))
+        self.assertIn("ValueError: boom", queued.last_error)
+
+        with self.assertLogs("parent.jobs", "ERROR"):
+            self.assertFalse(run_job(claim_job("worker", now=queued.run_at), "worker"))
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.Status.FAILED)
+        self.assertEqual(queued.attempts, 2)
+        self.assertIsNotNone(queued.finished_at)
+
+    def test_job_is_claimed_by_one_worker_only(self):
+        enqueue(record_call, 1)
+
+        self.assertIsNotNone(claim_job("first"))
+        self.assertIsNone(claim_job("second"))
+
+    def test_expired_lease_is_taken_over(self):
+        enqueue(record_call, "retry")
+        first = claim_job("first")
+
+        later = first.locked_until + timedelta(seconds=1)
+        second = claim_job("second", now=later)
+        self.assertEqual(second.pk, first.pk)
+        self.assertEqual(second.attempts, 2)
+
+        # The first worker finishing late does not touch the job it lost
+        Job.objects.filter(pk=first.pk).update(locked_until=later + timedelta(minutes=5))
+        run_job(first, "first")
+        self.assertTrue(Job.objects.filter(pk=first.pk, locked_by="second").exists())
+
+    def test_run_worker_burst(self):
+        enqueue(record_call, "a")
+        enqueue(record_call, "b", queue="other")
+        out = StringIO()
+
+        call_command("run_worker", "--burst", "--queue", "default", stdout=out)
+
+        self.assertEqual(JOB_CALLS, ["a"])
+        self.assertIn("Processed 1 job(s).", out.getvalue())
+        self.assertEqual(list(Job.objects.values_list("queue", flat=True)), ["other"])
+
+
+@override_settings(PARENT_EVENT_BACKEND="parent.tests.RecordingEventBackend")
+class BookingSweeperTests(TestCase):
+    """Ended bookings are completed and unanswered past requests expire"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.now = timezone.now()
+        self.addCleanup(get_event_backend().published.clear)
+
+    def booking(self, status, start_hours, end_hours):
+        return BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            status=status,
+            start_date=self.now + timedelta(hours=start_hours),
+            end_date=self.now + timedelta(hours=end_hours),
+            hourly_rate=15,
+        )
+
+    def status_of(self, booking):
+        return BabysitterRequest.objects.values_list("status", flat=True).get(pk=booking.pk)
+
+    def test_sweep_completes_and_expires_in_batches(self):
+        ended = [self.booking("ACCEPTED", -5, -2) for _ in range(3)]
+        running = self.booking("ACCEPTED", -1, 2)
+        stale = [self.booking("PENDING", -3, 1) for _ in range(2)]
+        upcoming = self.booking("PENDING", 2, 4)
+        cancelled = self.booking("CANCELLED", -5, -2)
+
+        counts = sweep_stale_bookings(now=self.now, batch_size=2)
+
+        self.assertEqual(counts, {"completed": 3, "expired": 2})
+        self.assertEqual({self.status_of(b) for b in ended}, {"COMPLETED"})
+        self.assertEqual({self.status_of(b) for b in stale}, {"EXPIRED"})
+        self.assertEqual(self.status_of(running), "ACCEPTED")
+        self.assertEqual(self.status_of(upcoming), "PENDING")
+        self.assertEqual(self.status_of(cancelled), "CANCELLED")
+
+        # A second run (or another node) has nothing left to do
+        self.assertEqual(
+            sweep_stale_bookings(now=self.now), {"completed": 0, "expired": 0}
+        )
+
+    def test_sweep_publishes_status_changes(self):
+        booking = self.booking("PENDING", -3, 1)
+        backend = get_event_backend()
+        backend.published.clear()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            sweep_stale_bookings(now=self.now)
+
+        self.assertEqual(
+            {channel for channel, _, _ in backend.published},
+            {user_channel(self.parent_user.id), user_channel(self.babysitter.id)},
+        )
+        _, event_type, data = backend.published[0]
+        self.assertEqual(event_type, "booking.status")
+        self.assertEqual(data["id"], booking.id)
+        self.assertEqual((data["previous_status"], data["status"]), ("PENDING", "EXPIRED"))
+
+    def test_expired_requests_leave_incoming_list(self):
+        booking = self.booking("PENDING", -3, 1)
+        call_command("sweep_bookings", stdout=StringIO())
+
+        client = APIClient()
+        client.force_authenticate(self.babysitter)
+        response = client.get("/api/parent/babysitter/requests/")
+        self.assertNotIn(str(booking.id), [row["id"] for row in response.data])
+        client.force_authenticate(self.parent_user)
+        response = client.post(f"/api/parent/requests/{booking.id}/cancel/")
+        self.assertEqual(response.status_code, 400)
+
+
+class BookingSeriesTests(TestCase):
+    """A recurring series books every occurrence in one request"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.child = ChildProfile.objects.create(
+            parent=self.parent_profile, name="Sam", date_of_birth="2019-01-01"
+        )
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        for day in range(5):
+            BabysitterAvailability.objects.create(
+                babysitter=self.babysitter,
+                day_of_week=day,
+                start_time=time(17, 0),
+                end_time=time(22, 0),
+            )
+        today = timezone.localdate()
+        # Monday two weeks from now
+        self.monday = today + timedelta(days=14 - today.weekday())
+        self.client = APIClient()
+        self.client.force_authenticate(self.parent_user)
+
+    def post_series(self, **overrides):
+        data = {
+            "babysitter": str(self.babysitter.pk),
+            "child": str(self.child.pk),
+            "weekdays": [0, 1, 2, 3, 4],
+            "starts_on": self.monday.isoformat(),
+            "count": 40,
+            "start_time": "18:00",
+            "end_time": "21:00",
+            "hourly_rate": "12.50",
+            **overrides,
+        }
+        return self.client.post("/api/parent/series/", data, format="json")
+
+    def test_expand_dates(self):
+        monday = date(2026, 1, 5)
+        self.assertEqual(
+            expand_dates([0, 3], monday, interval=2, count=4, exceptions=[date(2026, 1, 8)]),
+            [date(2026, 1, 5), date(2026, 1, 19), date(2026, 1, 22)],
+        )
+        self.assertEqual(
+            expand_dates([6], monday, until=date(2026, 1, 18)),
+            [date(2026, 1, 11), date(2026, 1, 18)],
+        )
+
+    def test_eight_weeks_of_evenings_in_one_request(self):
+        response = self.post_series()
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(len(response.data["report"]), 40)
+        self.assertEqual({o["status"] for o in response.data["report"]}, {"created"})
+        self.assertEqual(len(response.data["occurrences"]), 40)
+        bookings = BabysitterRequest.objects.filter(series_id=response.data["id"])
+        self.assertEqual(bookings.count(), 40)
+        first = bookings.order_by("start_date").first()
+        self.assertEqual(timezone.localtime(first.start_date).date(), self.monday)
+        self.assertEqual(first.total_cost, Decimal("37.50"))
+        self.assertEqual(first.status, "PENDING")
+
+    def test_query_count_does_not_depend_on_occurrences(self):
+        def queries_for(count):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post_series(count=count)
+            self.assertEqual(response.status_code, 201, response.data)
+            BabysitterRequest.objects.all().delete()
+            return len(queries)
+
+        self.assertEqual(queries_for(1), queries_for(40))
+
+    def test_conflicts_are_reported_per_occurrence(self):
+        tuesday = self.monday + timedelta(days=1)
+        BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=self.babysitter,
+            status="ACCEPTED",
+            start_date=timezone.make_aware(datetime.combine(tuesday, time(20, 0))),
+            end_date=timezone.make_aware(datetime.combine(tuesday, time(23, 0))),
+            hourly_rate=15,
+        )
+        response = self.post_series(
+            weekdays=[0, 1, 5],
+            count=6,
+            exceptions=[(self.monday + timedelta(days=7)).isoformat()],
+        )
+
+        self.assertEqual(response.status_code, 201, response.data)
+        statuses = [o["status"] for o in response.data["report"]]
+        # Mon, Tue (clash), Sat (no availability), [Mon excepted], Tue, Sat
+        self.assertEqual(
+            statuses, ["created", "conflict", "unavailable", "created", "unavailable"]
+        )
+        self.assertIn("20:00", response.data["report"][1]["detail"])
+        self.assertEqual(len(response.data["occurrences"]), 2)
+
+    def test_all_or_nothing(self):
+        response = self.post_series(weekdays=[0, 5], count=4, skip_conflicts=False)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [o["status"] for o in response.data["report"]],
+            ["ok", "unavailable", "ok", "unavailable"],
+        )
+        self.assertFalse(BookingSeries.objects.exists())
+        self.assertFalse(BabysitterRequest.objects.exists())
+
+    def test_rule_validation(self):
+        self.assertEqual(self.post_series(count=None).status_code, 400)
+        self.assertEqual(self.post_series(count=101).status_code, 400)
+        self.assertEqual(
+            self.post_series(start_time="21:00", end_time="18:00").status_code, 400
+        )
+
+    def test_cancel_series(self):
+        series_id = self.post_series(count=3).data["id"]
+        BabysitterRequest.objects.filter(series_id=series_id).update(status="ACCEPTED")
+
+        response = self.client.post(f"/api/parent/series/{series_id}/cancel/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["cancelled_ids"]), 3)
+        self.assertEqual(
+            set(
+                BabysitterRequest.objects.filter(series_id=series_id).values_list(
+                    "status", flat=True
+                )
+            ),
+            {"CANCELLED"},
+        )
+
+
+class BulkDecideTests(TestCase):
+    """Babysitters can accept and reject many incoming requests in one call"""
+
+    def setUp(self):
+        self.parent_user = User.objects.create_user(
+            email="parent@test.com", first_name="John", role="PARENT", password="testpass123"
+        )
+        self.parent_profile = ParentProfile.objects.create(user=self.parent_user)
+        self.babysitter = User.objects.create_user(
+            email="babysitter@test.com", first_name="Jane", role="BABYSITTER", password="testpass123"
+        )
+        self.base = timezone.now().replace(microsecond=0) + timedelta(days=3)
+        self.client = APIClient()
+        self.client.force_authenticate(self.babysitter)
+
+    def booking(self, start_hours, end_hours, status="PENDING", babysitter=None):
+        return BabysitterRequest.objects.create(
+            parent=self.parent_profile,
+            babysitter=babysitter or self.babysitter,
+            status=status,
+            start_date=self.base + timedelta(hours=start_hours),
+            end_date=self.base + timedelta(hours=end_hours),
+            hourly_rate=15,
+        )
+
+    def decide(self, *decisions):
+        return self.client.post(
+            "/api/parent/babysitter/requests/bulk-decide/",
+            {"decisions": [{"id": str(b.id), "decision": d} for b, d in decisions]},
+            format="json",
+        )
+
+    def test_outcome_per_request(self):
+        self.booking(0, 2, status="ACCEPTED")
+        clashes_existing = self.booking(1, 3)
+        first = self.booking(4, 6)
+        overlaps_first = self.booking(5, 7)
+        rejected = self.booking(10, 12)
+        not_pending = self.booking(20, 22, status="CANCELLED")
+        other_sitter = User.objects.create_user(
+            email="other@test.com", first_name="Ann", role="BABYSITTER", password="testpass123"
+        )
+        someone_else = self.booking(30, 32, babysitter=other_sitter)
+        untouched = self.booking(5, 6)
+
+        decisions = [
+            (overlaps_first, "accept"),
+            (first, "accept"),
+            (clashes_existing, "accept"),
+            (rejected, "reject"),
+            (not_pending, "accept"),
+            (someone_else, "reject"),
+        ]
+        response = self.decide(*decisions)
+
+        self.assertEqual(response.status_code, 200)
+        results = {row["id"]: row for row in response.data["results"]}
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [booking.id for booking, _ in decisions],
+        )
+        self.assertEqual(results[first.id]["result"], "accepted")
+        self.assertEqual(results[overlaps_first.id]["result"], "conflict")
+        self.assertIn(str(first.id), results[overlaps_first.id]["detail"])
+        # Lost to a booking accepted in the same batch, so it can never be accepted
+        self.assertEqual(results[overlaps_first.id]["status"], "REJECTED")
+        self.assertEqual(results[clashes_existing.id]["result"], "conflict")
+        self.assertEqual(results[clashes_existing.id]["status"], "PENDING")
+        self.assertEqual(results[rejected.id]["result"], "rejected")
+        self.assertEqual(results[not_pending.id]["result"], "invalid_status")
+        self.assertEqual(results[someone_else.id]["result"], "not_found")
+        self.assertEqual(response.data["declined_ids"], [untouched.id])
+
+        statuses = dict(BabysitterRequest.objects.values_list("id", "status"))
+        self.assertEqual(statuses[first.id], "ACCEPTED")
+        self.assertEqual(statuses[overlaps_first.id], "REJECTED")
+        self.assertEqual(statuses[clashes_existing.id], "PENDING")
+        self.assertEqual(statuses[rejected.id], "REJECTED")
+        self.assertEqual(statuses[untouched.id], "REJECTED")
+        self.assertEqual(statuses[someone_else.id], "PENDING")
+
+    def test_query_count_does_not_depend_on_batch_size(self):
+        def queries_for(count, offset):
+            bookings = [self.booking(offset + 3 * i, offset + 3 * i + 2) for i in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.decide(*[(b, "accept") for b in bookings])
+            self.assertEqual(
+                {row["result"] for row in response.data["results"]}, {"accepted"}
+            )
+            return len(queries)
+
+        queries_for(1, 0)  # creates the babysitter's lock row
+        self.assertEqual(queries_for(1, 50), queries_for(30, 100))
+
+    def test_rejects_duplicates_and_oversized_batches(self):
+        booking = self.booking(0, 2)
+        self.assertEqual(self.decide((booking, "accept"), (booking, "reject")).status_code, 400)
+        response = self.client.post(
+            "/api/parent/babysitter/requests/bulk-decide/",
+            {"decisions": [{"id": str(uuid.uuid4()), "decision": "reject"}] * 101},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
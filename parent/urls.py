@@ -4,6 +4,7 @@ from .views import (
     ParentProfileViewSet,
     ChildProfileViewSet,
     BabysitterRequestViewSet,
+    BookingSeriesViewSet,
     BabysitterListingView,
     BabysitterReviewViewSet,
     BookingHistoryViewSet,
@@ -21,6 +22,7 @@ parent_router = DefaultRouter()
 parent_router.register(r"profile", ParentProfileViewSet, basename="parent-profile")
 parent_router.register(r"children", ChildProfileViewSet, basename="child-profile")
 parent_router.register(r"requests", BabysitterRequestViewSet, basename="babysitter-request")
+parent_router.register(r"series", BookingSeriesViewSet, basename="booking-series")
 parent_router.register(r"listings", BabysitterListingView, basename="babysitter-listing")
 parent_router.register(r"reviews", BabysitterReviewViewSet, basename="babysitter-review")
 parent_router.register(r"history", BookingHistoryViewSet, basename="booking-history")
@@ -0,0 +1,285 @@
+"""
+Values-based read path for hot, read-only list endpoints.
+
+``ValuesReader`` compiles a serializer once per response into the ``.values()``
+columns it reads plus one mapper per field, and then builds each output row
+straight from a values dict: no model instances, no ``get_attribute`` walks. The
+mappers reuse the serializer's own field instances for formatting (datetime and
+decimal fields resolve their timezone, format and precision once per response
+rather than once per value), so the output is identical to ``serializer.data``:
+
+- model fields, dotted sources (``child.name``) and ``get_<field>_display``
+  become columns, formatted with ``field.to_representation``
+- primary key related fields read the foreign key column
+- nested serializers are compiled recursively and render ``None`` when the
+  relation is empty
+- ``SerializerMethodField`` methods are called with a row object whose attributes
+  are the model columns the serializer lists for them in ``values_columns``
+- sources crossing an empty nullable relation are left out (or ``None`` when the
+  field allows null), as DRF does
+
+Anything else (file fields, reverse relations, properties, ``many=True`` nesting,
+custom ``to_representation``)
+raises ``UnsupportedField`` and ``ValuesListMixin`` falls back to the regular
+serializer path.
+"""
+
+import decimal
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.encoding import force_str
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import empty
+from rest_framework.relations import PKOnlyObject, RelatedField
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+_SKIP = object()
+
+
+class UnsupportedField(Exception):
+    """A serializer field the values read path cannot reproduce"""
+
+
+def _forward_relation(model, name):
+    field = model._meta.get_field(name)
+    if not (field.concrete and (field.many_to_one or field.one_to_one)):
+        raise UnsupportedField(f"{model.__name__}.{name} is not a forward relation")
+    return field
+
+
+def _display_mapper(model, name):
+    """Mapper reproducing ``Model.get_<name>_display``"""
+    field = model._meta.get_field(name)
+    if not field.choices:
+        raise UnsupportedField(f"{model.__name__}.{name} has no choices")
+    # Translated once per response instead of once per row
+    choices = {key: force_str(label) for key, label in field.flatchoices}
+    return lambda value: choices.get(value, force_str(value, strings_only=True))
+
+
+def _converter(field):
+    """
+    ``field.to_representation``, or an equivalent with its per-call lookups done
+    up front for the ISO datetimes and string decimals that dominate list rows
+    """
+    convert = field.to_representation
+    if type(field) is serializers.DateTimeField:
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        if tz is None or output_format is None or output_format.lower() != ISO_8601:
+            return convert
+
+        def datetime_converter(value):
+            try:
+                value = value.astimezone(tz).isoformat()
+            except (OverflowError, TypeError, ValueError):
+                return convert(value)
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return datetime_converter
+
+    if type(field) is serializers.DecimalField:
+        coerce_to_string = getattr(
+            field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING
+        )
+        if (
+            not coerce_to_string
+            or field.localize
+            or field.normalize_output
+            or field.decimal_places is None
+        ):
+            return convert
+        exponent = decimal.Decimal(".1") ** field.decimal_places
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+
+        def decimal_converter(value):
+            if not isinstance(value, decimal.Decimal):
+                return convert(value)
+            return f"{value.quantize(exponent, rounding=field.rounding, context=context):f}"
+
+        return decimal_converter
+
+    return convert
+
+
+def _column_mapper(lookup, convert):
+    def mapper(row):
+        value = row[lookup]
+        return None if value is None else convert(value)
+
+    return mapper
+
+
+class ValuesReader:
+    """``serializer``'s output for values rows; see the module docstring"""
+
+    def __init__(self, serializer):
+        self.columns = {"pk": None}
+        self.build = self._compile(serializer, serializer.Meta.model, "")
+
+    def _column(self, lookup):
+        self.columns.setdefault(lookup, None)
+        return lookup
+
+    def _compile(self, serializer, model, prefix):
+        if type(serializer).to_representation is not serializers.Serializer.to_representation:
+            raise UnsupportedField(f"{type(serializer).__name__} overrides to_representation")
+        mappers = [
+            (field.field_name, self._compile_field(serializer, field, model, prefix))
+            for field in serializer._readable_fields
+        ]
+
+        def build(row):
+            result = {}
+            for name, mapper in mappers:
+                value = mapper(row)
+                if value is not _SKIP:
+                    result[name] = value
+            return result
+
+        return build
+
+    def _compile_field(self, serializer, field, model, prefix):
+        if isinstance(field, serializers.SerializerMethodField):
+            return self._compile_method(serializer, field, prefix)
+        if field.source == "*" or isinstance(
+            field, (serializers.FileField, serializers.ListSerializer)
+        ):
+            raise UnsupportedField(f"{field.field_name} cannot be read from values")
+
+        # Relations crossed before the last attribute; a NULL one means "no value"
+        guards = []
+        for attr in field.source_attrs[:-1]:
+            relation = _forward_relation(model, attr)
+            prefix = f"{prefix}{attr}__"
+            if relation.null:
+                guards.append(self._column(prefix[:-2]))
+            model = relation.related_model
+        attr = field.source_attrs[-1]
+
+        if isinstance(field, serializers.BaseSerializer):
+            relation = _forward_relation(model, attr)
+            present = self._column(prefix + attr)
+            build = self._compile(field, relation.related_model, f"{prefix}{attr}__")
+
+            def nested(row):
+                return None if row[present] is None else build(row)
+
+            return self._guarded(field, guards, nested)
+
+        convert = _converter(field)
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            if not (attr.startswith("get_") and attr.endswith("_display")):
+                raise UnsupportedField(f"{model.__name__}.{attr} is not a column")
+            name = attr[len("get_"):-len("_display")]
+            lookup = self._column(prefix + name)
+            display = _display_mapper(model, name)
+            return self._guarded(
+                field, guards, _column_mapper(lookup, lambda value: convert(display(value)))
+            )
+
+        if isinstance(field, RelatedField):
+            if not field.use_pk_only_optimization() or not model_field.is_relation:
+                raise UnsupportedField(f"{field.field_name} needs the related object")
+            _forward_relation(model, attr)
+            lookup = self._column(prefix + attr)
+            return self._guarded(
+                field, guards, _column_mapper(lookup, lambda pk: convert(PKOnlyObject(pk)))
+            )
+
+        if (
+            not model_field.concrete
+            or model_field.is_relation
+            or isinstance(model_field, models.FileField)
+        ):
+            raise UnsupportedField(f"{model.__name__}.{attr} is not a plain column")
+        return self._guarded(field, guards, _column_mapper(self._column(prefix + attr), convert))
+
+    def _compile_method(self, serializer, field, prefix):
+        names = getattr(serializer, "values_columns", {}).get(field.field_name)
+        if names is None:
+            raise UnsupportedField(f"{field.field_name} does not list its values_columns")
+        lookups = [(name, self._column(prefix + name)) for name in names]
+        method = getattr(serializer, field.method_name)
+
+        def value(row):
+            return method(SimpleNamespace(**{name: row[lookup] for name, lookup in lookups}))
+
+        return value
+
+    @staticmethod
+    def _guarded(field, guards, value):
+        if not guards:
+            return value
+        if field.default is not empty or not (field.allow_null or not field.required):
+            raise UnsupportedField(f"{field.field_name} has no value across a NULL relation")
+        missing = None if field.allow_null else _SKIP
+
+        def guarded(row):
+            for guard in guards:
+                if row[guard] is None:
+                    return missing
+            return value(row)
+
+        return guarded
+
+    def values(self, queryset, *extra):
+        """``queryset`` as values rows with the compiled columns plus ``extra``"""
+        columns = dict(self.columns)
+        columns.update(dict.fromkeys(extra))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def rows(self, values):
+        build = self.build
+        return [build(row) for row in values]
+
+
+def values_reader(serializer):
+    """A ValuesReader for ``serializer``, or None if it needs the regular path"""
+    try:
+        return ValuesReader(serializer)
+    except (UnsupportedField, FieldDoesNotExist, AttributeError):
+        return None
+
+
+class ValuesListMixin:
+    """
+    Serve ``list`` from values rows when the serializer supports it. Paginators get
+    dict rows carrying ``pk`` and the ordering columns (see ``KeysetPagination``).
+    """
+
+    def list(self, request, *args, **kwargs):
+        reader = values_reader(self.get_serializer())
+        if reader is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = [*queryset.query.order_by, *queryset.model._meta.ordering]
+        default = getattr(self.paginator, "default_ordering", None)
+        if default:
+            ordering.append(default)
+        opts = queryset.model._meta
+        extra = []
+        for name in ordering:
+            if not isinstance(name, str):
+                continue
+            name = name.lstrip("-")
+            name = opts.pk.name if name == "pk" else name
+            try:
+                if opts.get_field(name).concrete:
+                    extra.append(name)
+            except FieldDoesNotExist:
+                continue
+        values = reader.values(queryset, *extra)
+
+        page = self.paginate_queryset(values)
+        if page is not None:
+            return self.get_paginated_response(reader.rows(page))
+        return Response(reader.rows(values))
@@ -6,25 +6,45 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
 from django.db.models import F
-from .models import ParentProfile, ChildProfile, BabysitterRequest, BabysitterReview, BabysitterAvailability, BabysitterStory
+from .models import ParentProfile, ChildProfile, BabysitterRequest, BabysitterReview, BabysitterAvailability, BabysitterStory, BookingSeries
 from .serializers import (
     ParentProfileSerializer,
     ChildProfileSerializer,
     ChildProfileDetailSerializer,
     BabysitterRequestSerializer,
     BabysitterRequestDetailSerializer,
+    BookingSeriesSerializer,
+    BulkBookingDecisionSerializer,
     BabysitterReviewSerializer,
     BookingHistorySerializer,
     BabysitterListSerializer,
     BabysitterDetailSerializer,
     BabysitterAvailabilitySerializer,
+    BabysitterAvailabilityBulkSerializer,
     BabysitterStorySerializer,
 )
+from .bookings import BookingTransitionError, accept_booking, decide_bookings
+from .conditional import ConditionalGetMixin, conditional_get
+from .eager_loading import EagerLoadingMixin, apply_eager_loading
+from .scheduling import compute_free_slots, filter_available
+from .series import SeriesConflictError, cancel_series
+from .values_read import ValuesListMixin
+from .pagination import (
+    BookingCursorPagination,
+    KeysetPagination,
+    PaginatedActionMixin,
+    StoryCursorPagination,
+)
 from account.models import User
 from account.permissions import IsParent, IsBabysitter
 
 
-class ParentProfileViewSet(viewsets.ModelViewSet):
+# Date range limits for the free-slots calendar endpoint
+FREE_SLOTS_DEFAULT_DAYS = 14
+FREE_SLOTS_MAX_DAYS = 62
+
+
+class ParentProfileViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for parent profile management.
     Allows parents to view and manage their profile information.
@@ -59,15 +79,20 @@ class ParentProfileViewSet(viewsets.ModelViewSet):
             serializer.save()
             return Response(serializer.data)
 
-        serializer = self.get_serializer(parent_profile)
-        return Response(serializer.data)
+        return conditional_get(
+            request,
+            ParentProfile.objects.filter(pk=parent_profile.pk),
+            self.get_serializer_class(),
+            lambda: Response(self.get_serializer(parent_profile).data),
+            single=True,
+        )
 
     def perform_create(self, serializer):
         """Create parent profile for current user"""
         serializer.save(user=self.request.user)
 
 
-class ChildProfileViewSet(viewsets.ModelViewSet):
+class ChildProfileViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for child profile management.
     Allows parents to create, view, and manage their children's profiles.
@@ -76,6 +101,7 @@ class ChildProfileViewSet(viewsets.ModelViewSet):
     queryset = ChildProfile.objects.all()
     serializer_class = ChildProfileSerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Filter children based on parent"""
@@ -100,7 +126,9 @@ class ChildProfileViewSet(viewsets.ModelViewSet):
         serializer.save(parent=parent_profile)
 
 
-class BabysitterRequestViewSet(viewsets.ModelViewSet):
+class BabysitterRequestViewSet(
+    ConditionalGetMixin, EagerLoadingMixin, PaginatedActionMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for babysitter requests/bookings.
     Allows parents to send babysitter requests and manage bookings.
@@ -109,6 +137,7 @@ class BabysitterRequestViewSet(viewsets.ModelViewSet):
     queryset = BabysitterRequest.objects.all()
     serializer_class = BabysitterRequestSerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = BookingCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["status", "child"]
     ordering_fields = ["start_date", "created_at"]
@@ -141,7 +170,7 @@ class BabysitterRequestViewSet(viewsets.ModelViewSet):
         """Cancel a babysitter request"""
         babysitter_request = self.get_object()
 
-        if babysitter_request.status in ["COMPLETED", "REJECTED", "CANCELLED"]:
+        if babysitter_request.status in ["COMPLETED", "REJECTED", "CANCELLED", "EXPIRED"]:
             return Response(
                 {
                     "detail": f"Cannot cancel request with status {babysitter_request.status}."
@@ -165,8 +194,7 @@ class BabysitterRequestViewSet(viewsets.ModelViewSet):
             .order_by("start_date")
         )
 
-        serializer = self.get_serializer(bookings, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(bookings)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     def past(self, request):
@@ -174,19 +202,69 @@ class BabysitterRequestViewSet(viewsets.ModelViewSet):
         now = timezone.now()
         bookings = self.get_queryset().filter(end_date__lt=now).order_by("-end_date")
 
-        serializer = BookingHistorySerializer(bookings, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(bookings, BookingHistorySerializer)
 
 
-class BabysitterListingView(viewsets.ReadOnlyModelViewSet):
+class BookingSeriesViewSet(ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet):
+    """
+    ViewSet for recurring booking series.
+    One POST expands a weekly rule into PENDING requests and reports, per occurrence,
+    whether it was created or why it was skipped.
+    """
+
+    serializer_class = BookingSeriesSerializer
+    permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = KeysetPagination
+    http_method_names = ["get", "post"]
+
+    def get_queryset(self):
+        """Filter series based on parent"""
+        return BookingSeries.objects.filter(parent__user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        """Create the series and its bookings in one transaction"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        parent_profile, _ = ParentProfile.objects.get_or_create(user=request.user)
+        try:
+            serializer.save(parent=parent_profile)
+        except SeriesConflictError as exc:
+            return Response(
+                {"detail": str(exc), "report": exc.occurrences},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {**serializer.data, "report": serializer.report},
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        """Cancel all upcoming pending/accepted bookings of the series"""
+        cancelled = cancel_series(self.get_object())
+        return Response(
+            {
+                "detail": f"{len(cancelled)} booking(s) cancelled.",
+                "cancelled_ids": cancelled,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class BabysitterListingView(
+    ConditionalGetMixin, PaginatedActionMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for viewing available babysitters.
     Allows parents to view babysitter profiles and ratings.
     """
 
-    queryset = User.objects.filter(role="BABYSITTER", is_active=True)
+    queryset = User.objects.filter(role="BABYSITTER", is_active=True).select_related(
+        "profile", "babysitter_stats"
+    )
     serializer_class = BabysitterListSerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = KeysetPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["first_name", "last_name", "email"]
     ordering = ["first_name"]
@@ -220,11 +298,46 @@ class BabysitterListingView(viewsets.ReadOnlyModelViewSet):
         if city:
             queryset = queryset.filter(profile__address__icontains=city)
 
+        # Filter by free time window: ?date=YYYY-MM-DD&start_time=HH:MM&end_time=HH:MM
+        window_params = [
+            request.query_params.get(key) for key in ("date", "start_time", "end_time")
+        ]
+        if any(window_params):
+            from datetime import datetime
+
+            try:
+                day, start_time, end_time = (
+                    datetime.strptime(window_params[0], "%Y-%m-%d").date(),
+                    datetime.strptime(window_params[1], "%H:%M").time(),
+                    datetime.strptime(window_params[2], "%H:%M").time(),
+                )
+            except (TypeError, ValueError):
+                return Response(
+                    {
+                        "detail": "date (YYYY-MM-DD), start_time and end_time (HH:MM) "
+                        "must be given together."
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if start_time >= end_time:
+                return Response(
+                    {"detail": "start_time must be before end_time."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queryset = filter_available(
+                queryset,
+                timezone.make_aware(datetime.combine(day, start_time)),
+                timezone.make_aware(datetime.combine(day, end_time)),
+            )
+
         # Note: Rating filter removed since it requires annotation
         # Can be implemented with queryset annotation if needed
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # Free-window results also depend on other babysitters' bookings and slots,
+        # which the listing validators do not cover
+        return self.paginated_response(
+            queryset.order_by("first_name"), conditional=not any(window_params)
+        )
         
     @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated])
     def availability(self, request, pk=None):
@@ -233,10 +346,90 @@ class BabysitterListingView(viewsets.ReadOnlyModelViewSet):
         availability_slots = BabysitterAvailability.objects.filter(
             babysitter=babysitter
         ).order_by('day_of_week', 'start_time')
-        
-        serializer = BabysitterAvailabilitySerializer(availability_slots, many=True)
-        return Response(serializer.data)
+
+        return conditional_get(
+            request,
+            availability_slots,
+            BabysitterAvailabilitySerializer,
+            lambda: Response(
+                BabysitterAvailabilitySerializer(availability_slots, many=True).data
+            ),
+        )
     
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[IsAuthenticated],
+        url_path="free-slots",
+    )
+    def free_slots(self, request, pk=None):
+        """Get bookable time windows for a babysitter over a date range"""
+        babysitter = self.get_object()
+        from datetime import datetime, timedelta
+
+        try:
+            from_param = request.query_params.get("from")
+            from_date = (
+                datetime.strptime(from_param, "%Y-%m-%d").date()
+                if from_param
+                else timezone.localdate()
+            )
+            to_param = request.query_params.get("to")
+            to_date = (
+                datetime.strptime(to_param, "%Y-%m-%d").date()
+                if to_param
+                else from_date + timedelta(days=FREE_SLOTS_DEFAULT_DAYS - 1)
+            )
+        except ValueError:
+            return Response(
+                {"detail": "Invalid date format. Use YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if to_date < from_date:
+            return Response(
+                {"detail": "'to' must not be before 'from'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if (to_date - from_date).days >= FREE_SLOTS_MAX_DAYS:
+            return Response(
+                {"detail": f"Date range cannot exceed {FREE_SLOTS_MAX_DAYS} days."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            min_duration = int(request.query_params.get("min_duration") or 0)
+        except ValueError:
+            min_duration = -1
+        if min_duration < 0:
+            return Response(
+                {"detail": "min_duration must be a non-negative number of minutes."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        windows = compute_free_slots(
+            babysitter,
+            from_date,
+            to_date,
+            min_duration=timedelta(minutes=min_duration),
+        )
+
+        slot_data = []
+        for start, end in windows:
+            start = timezone.localtime(start)
+            end = timezone.localtime(end)
+            slot_data.append(
+                {
+                    "date": start.date().isoformat(),
+                    "start_time": start.strftime("%H:%M"),
+                    "end_time": end.strftime("%H:%M"),
+                    "start_date": start.isoformat(),
+                    "end_date": end.isoformat(),
+                    "duration_minutes": int((end - start).total_seconds() // 60),
+                }
+            )
+        return Response(slot_data)
+
     @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated])
     def bookings(self, request, pk=None):
         """Get existing bookings for a babysitter on a specific date"""
@@ -263,7 +456,7 @@ class BabysitterListingView(viewsets.ReadOnlyModelViewSet):
             babysitter=babysitter,
             start_date__date=target_date,
             status__in=['ACCEPTED', 'COMPLETED']
-        ).order_by('start_date')
+        ).select_related('parent__user').order_by('start_date')
         
         # Return simplified booking data showing time conflicts
         booking_data = [
@@ -282,7 +475,7 @@ class BabysitterListingView(viewsets.ReadOnlyModelViewSet):
         return Response(booking_data)
 
 
-class BabysitterReviewViewSet(viewsets.ModelViewSet):
+class BabysitterReviewViewSet(ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     """
     ViewSet for babysitter reviews.
     Allows parents to create and view reviews after completed bookings.
@@ -291,6 +484,7 @@ class BabysitterReviewViewSet(viewsets.ModelViewSet):
     queryset = BabysitterReview.objects.all()
     serializer_class = BabysitterReviewSerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         """Filter reviews by parent"""
@@ -316,7 +510,9 @@ class BabysitterReviewViewSet(viewsets.ModelViewSet):
             raise NotFound("Parent profile not found.")
 
 
-class BookingHistoryViewSet(viewsets.ReadOnlyModelViewSet):
+class BookingHistoryViewSet(
+    ConditionalGetMixin, ValuesListMixin, EagerLoadingMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for viewing booking history.
     Shows completed and past bookings with details.
@@ -325,6 +521,7 @@ class BookingHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = BabysitterRequest.objects.filter(status="COMPLETED")
     serializer_class = BookingHistorySerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = BookingCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["child", "babysitter"]
     ordering_fields = ["start_date", "created_at"]
@@ -347,7 +544,9 @@ class BookingHistoryViewSet(viewsets.ReadOnlyModelViewSet):
 # ============================================
 
 
-class BabysitterIncomingRequestsViewSet(viewsets.ModelViewSet):
+class BabysitterIncomingRequestsViewSet(
+    ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for babysitters to view and manage incoming requests.
     Babysitters can view requests sent to them and accept/reject them.
@@ -356,6 +555,7 @@ class BabysitterIncomingRequestsViewSet(viewsets.ModelViewSet):
     queryset = BabysitterRequest.objects.all()
     serializer_class = BabysitterRequestSerializer
     permission_classes = [IsAuthenticated, IsBabysitter]
+    pagination_class = BookingCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["status"]
     ordering_fields = ["start_date", "created_at"]
@@ -366,7 +566,7 @@ class BabysitterIncomingRequestsViewSet(viewsets.ModelViewSet):
         """Filter requests sent to current babysitter"""
         return BabysitterRequest.objects.filter(
             babysitter=self.request.user
-        ).exclude(status__in=["COMPLETED", "CANCELLED"])
+        ).exclude(status__in=["COMPLETED", "CANCELLED", "EXPIRED"])
 
     def get_serializer_class(self):
         """Use detailed serializer for retrieve action"""
@@ -379,38 +579,20 @@ class BabysitterIncomingRequestsViewSet(viewsets.ModelViewSet):
         """Accept a babysitter request with double booking validation"""
         booking_request = self.get_object()
 
-        if booking_request.status != "PENDING":
+        try:
+            booking = accept_booking(booking_request.id, request.user)
+        except BookingTransitionError as exc:
             return Response(
-                {"detail": f"Cannot accept request with status {booking_request.status}."},
+                {"detail": exc.detail},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check for conflicting bookings before accepting
-        # Check against both ACCEPTED and COMPLETED bookings
-        conflicting_bookings = BabysitterRequest.objects.filter(
-            babysitter=request.user,
-            status__in=['ACCEPTED', 'COMPLETED']
-        ).exclude(id=booking_request.id)
-
-        for booking in conflicting_bookings:
-            # Check if the new booking overlaps with existing ones
-            # Overlap logic: existing_start < new_end AND existing_end > new_start
-            if (booking_request.start_date < booking.end_date and 
-                booking_request.end_date > booking.start_date):
-                return Response(
-                    {
-                        "detail": "Babysitter already has a booking during this time. "
-                                 f"Conflicting booking: {booking.start_date.strftime('%Y-%m-%d %H:%M')} to "
-                                 f"{booking.end_date.strftime('%Y-%m-%d %H:%M')}."
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-        booking_request.status = "ACCEPTED"
-        booking_request.save()
-
         return Response(
-            {"detail": "Request accepted successfully."},
+            {
+                "detail": "Request accepted successfully.",
+                # Overlapping pending requests rejected along with this accept
+                "declined_ids": booking.auto_declined,
+            },
             status=status.HTTP_200_OK,
         )
 
@@ -433,8 +615,37 @@ class BabysitterIncomingRequestsViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-decide",
+        permission_classes=[IsAuthenticated, IsBabysitter],
+    )
+    def bulk_decide(self, request):
+        """Accept/reject many requests in one transaction; returns an outcome per id"""
+        serializer = BulkBookingDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        decisions = [
+            (decision["id"], decision["decision"])
+            for decision in serializer.validated_data["decisions"]
+        ]
+        outcomes, declined_ids = decide_bookings(request.user, decisions)
+        return Response(
+            {
+                "results": [
+                    {"id": booking_id, "decision": decision, **outcomes[booking_id]}
+                    for booking_id, decision in decisions
+                ],
+                # Other pending requests rejected because they overlap an accepted one
+                "declined_ids": declined_ids,
+            },
+            status=status.HTTP_200_OK,
+        )
+
 
-class BabysitterBookingsViewSet(viewsets.ModelViewSet):
+class BabysitterBookingsViewSet(
+    ConditionalGetMixin, EagerLoadingMixin, PaginatedActionMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for babysitters to view their accepted/ongoing bookings.
     """
@@ -442,6 +653,7 @@ class BabysitterBookingsViewSet(viewsets.ModelViewSet):
     queryset = BabysitterRequest.objects.all()
     serializer_class = BabysitterRequestSerializer
     permission_classes = [IsAuthenticated, IsBabysitter]
+    pagination_class = BookingCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["status"]
     ordering_fields = ["start_date", "created_at"]
@@ -485,8 +697,7 @@ class BabysitterBookingsViewSet(viewsets.ModelViewSet):
         """Get upcoming accepted bookings"""
         now = timezone.now()
         bookings = self.get_queryset().filter(start_date__gt=now).order_by("start_date")
-        serializer = self.get_serializer(bookings, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(bookings)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated, IsBabysitter])
     def past(self, request):
@@ -496,11 +707,12 @@ class BabysitterBookingsViewSet(viewsets.ModelViewSet):
             babysitter=request.user,
             end_date__lt=now
         ).order_by("-end_date")
-        serializer = BookingHistorySerializer(bookings, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(bookings, BookingHistorySerializer)
 
 
-class BabysitterReviewsReceivedViewSet(viewsets.ReadOnlyModelViewSet):
+class BabysitterReviewsReceivedViewSet(
+    ConditionalGetMixin, EagerLoadingMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for babysitters to view reviews they've received.
     """
@@ -508,6 +720,7 @@ class BabysitterReviewsReceivedViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = BabysitterReview.objects.all()
     serializer_class = BabysitterReviewSerializer
     permission_classes = [IsAuthenticated, IsBabysitter]
+    pagination_class = KeysetPagination
     ordering = ["-created_at"]
 
     def get_queryset(self):
@@ -515,7 +728,9 @@ class BabysitterReviewsReceivedViewSet(viewsets.ReadOnlyModelViewSet):
         return BabysitterReview.objects.filter(babysitter=self.request.user)
 
 
-class BabysitterHistoryViewSet(viewsets.ReadOnlyModelViewSet):
+class BabysitterHistoryViewSet(
+    ConditionalGetMixin, ValuesListMixin, EagerLoadingMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for viewing babysitter's completed booking history.
     """
@@ -523,6 +738,7 @@ class BabysitterHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = BabysitterRequest.objects.filter(status="COMPLETED")
     serializer_class = BookingHistorySerializer
     permission_classes = [IsAuthenticated, IsBabysitter]
+    pagination_class = BookingCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["parent"]
     ordering_fields = ["start_date", "created_at"]
@@ -536,7 +752,9 @@ class BabysitterHistoryViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class BabysitterAvailabilityViewSet(viewsets.ModelViewSet):
+class BabysitterAvailabilityViewSet(
+    ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for babysitter availability management.
     Allows babysitters to create, view, update, and delete their availability slots.
@@ -557,13 +775,23 @@ class BabysitterAvailabilityViewSet(viewsets.ModelViewSet):
         """Create availability slot for current babysitter"""
         serializer.save(babysitter=self.request.user)
 
+    @action(detail=False, methods=["put"], url_path="bulk")
+    def bulk(self, request):
+        """Replace the whole weekly schedule in one transaction"""
+        serializer = BabysitterAvailabilityBulkSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        slots = serializer.save()
+        return Response(BabysitterAvailabilitySerializer(slots, many=True).data)
+
 
 # ============================================
 # STORY VIEWSETS
 # ============================================
 
 
-class BabysitterStoryViewSet(viewsets.ModelViewSet):
+class BabysitterStoryViewSet(ConditionalGetMixin, EagerLoadingMixin, viewsets.ModelViewSet):
     """
     Babysitter can POST stories only during an active (ongoing) ACCEPTED booking.
     Babysitter can also GET/DELETE their own stories.
@@ -571,6 +799,7 @@ class BabysitterStoryViewSet(viewsets.ModelViewSet):
 
     serializer_class = BabysitterStorySerializer
     permission_classes = [IsAuthenticated, IsBabysitter]
+    pagination_class = StoryCursorPagination
     http_method_names = ["get", "post", "delete"]
 
     def get_queryset(self):
@@ -594,19 +823,24 @@ class BabysitterStoryViewSet(viewsets.ModelViewSet):
             start_date__lte=now,
             end_date__gte=now,
         )
+        bookings = apply_eager_loading(bookings, BabysitterRequestSerializer)
         serializer = BabysitterRequestSerializer(bookings, many=True)
         return Response(serializer.data)
 
 
-class ParentStoriesViewSet(viewsets.ReadOnlyModelViewSet):
+class ParentStoriesViewSet(
+    ConditionalGetMixin, EagerLoadingMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     Parents can GET stories from their hired babysitters.
     Only stories created within the booking's start_date–end_date window are returned.
-    Optionally filter by ?booking_id=<uuid>.
+    Optionally filter by ?booking_id=<uuid>, and pass ?since=<X-Since-Cursor> to
+    fetch only stories posted after the last refresh.
     """
 
     serializer_class = BabysitterStorySerializer
     permission_classes = [IsAuthenticated, IsParent]
+    pagination_class = StoryCursorPagination
 
     def get_queryset(self):
         user = self.request.user